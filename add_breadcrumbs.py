@@ -5,6 +5,7 @@ Breadcrumbs improve UX and enable breadcrumb rich snippets.
 """
 import re
 from pathlib import Path
+from parallel_runner import run_parallel, jobs_from_argv, report_failures
 
 def get_breadcrumbs(filepath):
     """Generate breadcrumb trail from file path."""
@@ -105,20 +106,16 @@ def add_breadcrumbs(content, filepath):
 
 def process_file(filepath):
     """Process a single HTML file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        updated_content = add_breadcrumbs(content, filepath)
-        
-        if updated_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    
+    updated_content = add_breadcrumbs(content, filepath)
+    
+    if updated_content != content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(updated_content)
+        return True
+    return False
 
 def main():
     """Process all HTML files."""
@@ -136,10 +133,12 @@ def main():
     print("Adding breadcrumb navigation...")
     
     updated_count = 0
-    for filepath in sorted(html_files):
-        if process_file(filepath):
+    results = run_parallel(process_file, sorted(html_files), jobs_from_argv())
+    for filepath, updated, error in results:
+        if updated:
             updated_count += 1
             print(f"[OK] Added breadcrumbs to {filepath}")
+    report_failures(results)
     
     print(f"\nCompleted! Updated {updated_count} files with breadcrumbs.")
 
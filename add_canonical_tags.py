@@ -2,9 +2,14 @@
 """
 Add canonical tags to all HTML pages.
 Canonical tags prevent duplicate content issues and consolidate link equity.
+Pass --incremental to skip files unchanged since the last run (see incremental.py).
 """
 import re
 from pathlib import Path
+from incremental import is_incremental, load_manifest, is_unchanged, record, save_manifest
+
+# Bump when the transform's output changes so --incremental reprocesses every file
+TRANSFORM_VERSION = 1
 
 def get_canonical_url(filepath):
     """Generate canonical URL from file path."""
@@ -90,11 +95,19 @@ def main():
     print(f"Found {len(html_files)} HTML files")
     
     updated_count = 0
+    manifest = load_manifest('add_canonical_tags', TRANSFORM_VERSION) if is_incremental() else None
     for filepath in sorted(html_files):
+        if manifest is not None and is_unchanged(manifest, filepath):
+            continue
         if process_file(filepath):
             updated_count += 1
             print(f"[OK] Added canonical to {filepath}")
+        if manifest is not None:
+            record(manifest, filepath)
     
+    if manifest is not None:
+        save_manifest(manifest)
+        print(f"Skipped {manifest['skipped']} unchanged files (--incremental)")
     print(f"\nCompleted! Updated {updated_count} files with canonical tags.")
 
 if __name__ == '__main__':
@@ -5,6 +5,12 @@ This ensures all pages have proper OG tags for social media sharing.
 """
 import re
 from pathlib import Path
+from add_twitter_cards import safe_content
+from html_extract import extract_page
+
+# One og:* meta tag with its indentation and line break
+OG_LINE_RE = re.compile(r'[ \t]*<meta\s+property=["\']og:[^>]*>[ \t]*\n?', re.IGNORECASE)
+OG_TAG_RE = re.compile(r'<meta\s+property="(og:[^"]+)"\s+content="([^"]*)"', re.IGNORECASE)
 
 def extract_page_info(content, filepath):
     """Extract page information for OG tags."""
@@ -15,18 +21,10 @@ def extract_page_info(content, filepath):
         'type': 'website'
     }
     
-    # Extract title
-    title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-    if title_match:
-        info['title'] = re.sub(r'\s+', ' ', title_match.group(1).strip())
-    
-    # Extract meta description
-    desc_match = re.search(r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']+)["\']', content, re.IGNORECASE)
-    if desc_match:
-        info['description'] = desc_match.group(1).strip()
-    elif title_match:
-        # Fallback: use title as description
-        info['description'] = info['title']
+    page = extract_page(content, head_only=True)
+    info['title'] = page['title']
+    # Fallback: use title as description
+    info['description'] = page['description'] or info['title']
     
     # Generate URL
     base_url = "https://artificial.one"
@@ -79,52 +77,41 @@ def add_complete_og_tags(content, filepath):
     """Add or update complete OG tags to HTML content."""
     info = extract_page_info(content, filepath)
     og_image_url = get_og_image_url(filepath)
+    # Escape & the same way add_twitter_cards.py does so the two scripts agree
+    title = safe_content(info['title'])
+    description = safe_content(info['description'])
     
     # Create complete OG tags
-    og_tags = f'''    <meta property="og:title" content="{info['title']}" />
-    <meta property="og:description" content="{info['description']}" />
+    og_tags = f'''    <meta property="og:title" content="{title}" />
+    <meta property="og:description" content="{description}" />
     <meta property="og:type" content="{info['type']}" />
     <meta property="og:url" content="{info['url']}" />
     <meta property="og:image" content="{og_image_url}" />
     <meta property="og:image:width" content="1200" />
     <meta property="og:image:height" content="630" />
-    <meta property="og:image:alt" content="{info['title']}" />'''
+    <meta property="og:image:alt" content="{title}" />'''
     
     # Check if any OG tags exist
-    has_og_tags = re.search(r'<meta\s+property=["\']og:', content, re.IGNORECASE)
+    existing = list(OG_LINE_RE.finditer(content))
     
-    if has_og_tags:
-        # Remove all existing OG tags
-        content = re.sub(
-            r'<meta\s+property=["\']og:[^>]*>',
-            '',
-            content,
-            flags=re.IGNORECASE
-        )
-        # Clean up extra blank lines
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+    if existing:
+        # Already complete and current: leave the page alone so re-runs are no-ops
+        expected = dict(OG_TAG_RE.findall(og_tags))
+        found = {}
+        for m in existing:
+            tag = OG_TAG_RE.search(m.group(0))
+            if tag:
+                found.setdefault(tag.group(1).lower(), []).append(tag.group(2))
+        if all(found.get(prop) == [value] for prop, value in expected.items()):
+            return content
         
-        # Find where to insert (after viewport or before closing head)
-        if '<meta name="viewport"' in content:
-            content = re.sub(
-                r'(<meta\s+name=["\']viewport["\'][^>]*>)',
-                rf'\1\n{og_tags}',
-                content,
-                flags=re.IGNORECASE,
-                count=1
-            )
-        elif '</head>' in content:
-            content = content.replace('</head>', f'{og_tags}\n</head>')
-        else:
-            # Insert after title
-            if '<title>' in content:
-                content = re.sub(
-                    r'(</title>)',
-                    rf'\1\n{og_tags}',
-                    content,
-                    flags=re.IGNORECASE,
-                    count=1
-                )
+        # Replace the existing tags in place: the block goes where the first
+        # one was and the others are removed with their lines
+        parts = [content[:existing[0].start()], og_tags + '\n']
+        for previous, m in zip(existing, existing[1:]):
+            parts.append(content[previous.end():m.start()])
+        parts.append(content[existing[-1].end():])
+        content = ''.join(parts)
     else:
         # No OG tags exist, add them after viewport or title
         if '<meta name="viewport"' in content:
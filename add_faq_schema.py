@@ -3,50 +3,16 @@
 Add FAQPage schema to pages with FAQs.
 This enables FAQ rich snippets in search results.
 """
-import re
 import json
 from pathlib import Path
+from html_extract import extract_page
 
 def extract_faqs(content):
-    """Extract FAQ questions and answers from HTML."""
-    faqs = []
-    
-    # Look for FAQ patterns
-    # Pattern 1: <h3>Question</h3><p>Answer</p>
-    faq_pattern1 = r'<h[23][^>]*>(.*?)</h[23]>\s*<p[^>]*>(.*?)</p>'
-    matches = re.findall(faq_pattern1, content, re.DOTALL | re.IGNORECASE)
-    
-    for question, answer in matches:
-        # Clean up HTML tags
-        question = re.sub(r'<[^>]+>', '', question).strip()
-        answer = re.sub(r'<[^>]+>', '', answer).strip()
-        
-        # Check if it looks like a FAQ (question mark, common FAQ words)
-        if '?' in question or any(word in question.lower() for word in ['what', 'how', 'why', 'when', 'where', 'is', 'are', 'can', 'does', 'do']):
-            if len(question) > 10 and len(answer) > 20:
-                faqs.append({
-                    'question': question[:200],  # Limit length
-                    'answer': answer[:500]  # Limit length
-                })
-    
-    # Pattern 2: FAQ section with specific markers
-    if 'FAQ' in content or 'Frequently Asked' in content:
-        # Look for sections between FAQ markers
-        faq_section = re.search(r'(?:FAQ|Frequently Asked Questions).*?(?=<h[12]|</article|</section|$)', content, re.DOTALL | re.IGNORECASE)
-        if faq_section:
-            section_content = faq_section.group(0)
-            # Extract Q&A pairs
-            qa_pairs = re.findall(r'<h[23][^>]*>(.*?)\?</h[23]>\s*<p[^>]*>(.*?)</p>', section_content, re.DOTALL | re.IGNORECASE)
-            for question, answer in qa_pairs:
-                question = re.sub(r'<[^>]+>', '', question).strip() + '?'
-                answer = re.sub(r'<[^>]+>', '', answer).strip()
-                if len(question) > 10 and len(answer) > 20:
-                    faqs.append({
-                        'question': question[:200],
-                        'answer': answer[:500]
-                    })
-    
-    return faqs[:10]  # Limit to 10 FAQs
+    """
+    FAQ questions and answers: an h2/h3 that reads like a question, followed
+    directly by a <p> answer (one html_extract pass, at most 10).
+    """
+    return extract_page(content)['faqs']
 
 def create_faq_schema(faqs):
     """Create FAQPage schema from FAQs."""
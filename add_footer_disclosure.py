@@ -8,17 +8,21 @@ from pathlib import Path
 
 DISCLOSURE_P = '<p class="text-sm opacity-90 mt-2">We use affiliate links. We may earn a commission if you buy through our links (no extra cost to you).</p>'
 
-def process_file(filepath: Path) -> bool:
-    try:
-        content = filepath.read_text(encoding="utf-8", errors="ignore")
-    except Exception as e:
-        print(f"  Read error: {e}")
-        return False
+FOOTER_DIRS = ["guides", "tools", "best", "category", "compare", "tutorials"]
+
+def is_footer_target(filepath: Path) -> bool:
+    """Pages that get the disclosure: section folders plus root blog posts."""
+    parts = Path(filepath).parts
+    if len(parts) > 1 and parts[0] in FOOTER_DIRS:
+        return True
+    return len(parts) == 1 and parts[0].startswith("blog-")
 
+def add_footer_disclosure(content: str) -> str:
+    """Insert the disclosure after the © 2026 footer line if it is missing."""
     if "We use affiliate links" in content or "we may earn a commission" in content.lower():
-        return False
+        return content
     if "© 2026 artificial.one" not in content:
-        return False
+        return content
 
     # Insert disclosure between </p> and </footer> (footer's single <p>© 2026...</p>)
     # Match: <p>© 2026 artificial.one - ...</p> followed by whitespace and </footer>
@@ -28,7 +32,16 @@ def process_file(filepath: Path) -> bool:
         nl = "\n" if "\n" in ws else " "
         indent = "        " if "\n" in ws else " "
         return p + nl + indent + DISCLOSURE_P + nl + "    " + end
-    new_content = re.sub(pattern, repl, content, count=1)
+    return re.sub(pattern, repl, content, count=1)
+
+def process_file(filepath: Path) -> bool:
+    try:
+        content = filepath.read_text(encoding="utf-8", errors="ignore")
+    except Exception as e:
+        print(f"  Read error: {e}")
+        return False
+
+    new_content = add_footer_disclosure(content)
     if new_content != content:
         filepath.write_text(new_content, encoding="utf-8")
         return True
@@ -36,9 +49,8 @@ def process_file(filepath: Path) -> bool:
 
 def main():
     root = Path(__file__).resolve().parent
-    dirs = ["guides", "tools", "best", "category", "compare", "tutorials"]
     total = 0
-    for d in dirs:
+    for d in FOOTER_DIRS:
         folder = root / d
         if not folder.is_dir():
             continue
@@ -3,6 +3,9 @@
 import re
 from pathlib import Path
 
+from build_css import SHEET_LINK_RE
+from page_index import iter_html_files
+
 # Standard mobile menu HTML template. {prefix} is '' or '../'
 MOBILE_MENU_HTML = '''
             <div id="mobile-menu" class="hidden md:hidden pb-4" style="border-top: 1px solid #e5e7eb; margin-top: 1rem;">
@@ -153,8 +156,8 @@ def process_file(p: Path) -> bool:
         return False
     if 'mobile-menu-btn' in content or 'id="mobile-menu"' in content:
         return False  # already has hamburger
-    if 'tailwindcss.com' not in content:
-        return False  # skip non-Tailwind
+    if 'tailwindcss.com' not in content and not SHEET_LINK_RE.search(content):
+        return False  # skip non-Tailwind (CDN or the build_css.py sheet)
     if p.name == 'index.html' and ('React' in content or 'id="root"' in content):
         return False  # skip React index
     if '<nav' not in content:
@@ -179,7 +182,7 @@ def process_file(p: Path) -> bool:
 
 def main():
     added = 0
-    for p in sorted(Path('.').rglob('*.html')):
+    for p in iter_html_files('.'):
         if process_file(p):
             print(p)
             added += 1
@@ -5,6 +5,8 @@ Generates SEO-friendly descriptions based on page content.
 """
 import re
 from pathlib import Path
+from page_index import build_index
+from parallel_runner import run_parallel, jobs_from_argv, report_failures
 
 def extract_page_info(content, filepath):
     """Extract information from page to generate meta description."""
@@ -159,60 +161,40 @@ def add_meta_description(content, filepath):
 
 def process_file(filepath):
     """Process a single HTML file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Skip if already has meta description
-        if re.search(r'<meta\s+name=["\']description["\'][^>]*>', content, re.IGNORECASE):
-            return False
-        
-        updated_content = add_meta_description(content, filepath)
-        
-        if updated_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    
+    # Skip if already has meta description
+    if re.search(r'<meta\s+name=["\']description["\'][^>]*>', content, re.IGNORECASE):
         return False
+    
+    updated_content = add_meta_description(content, filepath)
+    
+    if updated_content != content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(updated_content)
+        return True
+    return False
 
 def main():
     """Process all HTML files missing meta descriptions."""
-    root = Path('.')
-    html_files = []
-    
-    # Find all HTML files
-    for html_file in root.rglob('*.html'):
-        if any(part.startswith('.') for part in html_file.parts):
-            continue
-        if '.git' in html_file.parts:
-            continue
-        html_files.append(html_file)
-    
-    print(f"Found {len(html_files)} HTML files")
+    # Identify files missing descriptions from the shared page index
+    index = build_index()
+    print(f"Found {len(index)} HTML files")
     print("Checking for missing meta descriptions...\n")
     
-    # First pass: identify files missing descriptions
-    files_to_update = []
-    for filepath in sorted(html_files):
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            if not re.search(r'<meta\s+name=["\']description["\'][^>]*>', content, re.IGNORECASE):
-                files_to_update.append(filepath)
-        except:
-            pass
+    files_to_update = [Path(path) for path, page in index.items() if page['description'] is None]
     
     print(f"Found {len(files_to_update)} files missing meta descriptions\n")
     print("Adding meta descriptions...\n")
     
     updated_count = 0
-    for filepath in sorted(files_to_update):
-        if process_file(filepath):
+    results = run_parallel(process_file, sorted(files_to_update), jobs_from_argv())
+    for filepath, updated, error in results:
+        if updated:
             updated_count += 1
             print(f"[OK] Added meta description to {filepath}")
+    report_failures(results)
     
     print(f"\nCompleted! Updated {updated_count} files with meta descriptions.")
     print(f"\nRemaining files without descriptions: {len(files_to_update) - updated_count}")
@@ -8,9 +8,10 @@ Add 50+ New AppSumo apps from tracker to the site:
 import os
 import re
 import json
-import zipfile
-import xml.etree.ElementTree as ET
 from pathlib import Path
+from xlsx_reader import read_tracker
+from catalog import load_catalog
+from product_resolver import ProductResolver
 
 ROOT = Path(__file__).resolve().parent
 EXCEL = ROOT / "appsumo-affiliate-links-tracker.xlsx"
@@ -95,50 +96,11 @@ CATEGORY_MAP = {
 
 def extract_new_apps():
     """Read Excel and return list of {name, slug, link} for Status=New."""
-    with zipfile.ZipFile(EXCEL, "r") as z:
-        shared = []
-        try:
-            with z.open("xl/sharedStrings.xml") as x:
-                r = ET.parse(x).getroot()
-                ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-                for si in r.findall(".//m:si", ns):
-                    t = "".join(e.text or "" for e in si.findall(".//m:t", ns))
-                    shared.append(t)
-        except Exception:
-            pass
-        sheets = sorted([s for s in z.namelist() if s.startswith("xl/worksheets/sheet")])
-        with z.open(sheets[0]) as x:
-            r = ET.parse(x).getroot()
-            ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-            rows = []
-            for row in r.findall(".//m:row", ns):
-                rdata = []
-                for c in row.findall(".//m:c", ns):
-                    v = c.find(".//m:v", ns)
-                    val = v.text if v is not None and v.text else None
-                    if c.get("t") == "s" and val and shared:
-                        try:
-                            val = shared[int(val)]
-                        except Exception:
-                            pass
-                    rdata.append(val)
-                if any(x is not None for x in rdata):
-                    rows.append(rdata)
-    headers = [str(h) if h else f"Col{i}" for i, h in enumerate(rows[0])]
-    name_col = headers[0]
-    slug_col = "Product Slug"
-    link_col = "Your Generated Tracking Link"
-    status_col = "Status"
     out = []
-    for r in rows[1:]:
-        row = {}
-        for i, h in enumerate(headers):
-            row[h] = r[i] if i < len(r) else None
-        if not row.get(status_col) or str(row.get(status_col)).strip().lower() != "new":
+    for row in read_tracker(EXCEL):
+        if row.status.lower() != "new":
             continue
-        name = (row.get(name_col) or "").strip()
-        slug = (row.get(slug_col) or "").strip()
-        link = (row.get(link_col) or "").strip()
+        name, slug, link = row.name, row.slug, row.tracking_link
         if not name or not link:
             continue
         # slug filename: use last part if path-like
@@ -151,7 +113,26 @@ def extract_new_apps():
     return out
 
 
+# Tools the site already lists keep the category they are filed under
+KNOWN_TOOL_THRESHOLD = 0.9
+_catalog_index = None
+
+
+def catalog_index():
+    """(resolver over the catalog's tools, {slug: category}), loaded once."""
+    global _catalog_index
+    if _catalog_index is None:
+        tools = [t for t in load_catalog(ROOT) if t.category in CATEGORY_MAP.values()]
+        _catalog_index = (ProductResolver.from_tools(tools), {t.slug: t.category for t in tools})
+    return _catalog_index
+
+
 def infer_category(name: str, slug: str) -> str:
+    resolver, categories = catalog_index()
+    known = resolver.best(name, KNOWN_TOOL_THRESHOLD) or resolver.best(slug, KNOWN_TOOL_THRESHOLD)
+    if known:
+        return categories[known]
+
     n = name.lower()
     s = slug.lower().replace("-", "").replace("_", "")
     combined = n + " " + s
@@ -10,6 +10,13 @@ def update_affiliate_link(match):
     """Update affiliate link with rel="nofollow sponsored"."""
     link = match.group(0)
     
+    # Already compliant: leave it alone so repeated runs don't stack rel values
+    rel_match = re.search(r'rel\s*=\s*["\']([^"\']*)["\']', link, re.IGNORECASE)
+    if rel_match:
+        rel_values = rel_match.group(1).lower().split()
+        if 'nofollow' in rel_values and 'sponsored' in rel_values:
+            return link
+    
     # Check if already has rel attribute
     if re.search(r'rel\s*=', link, re.IGNORECASE):
         # Update existing rel
@@ -25,6 +32,20 @@ def update_affiliate_link(match):
     
     return link
 
+# Affiliate links (AppSumo, Impact, etc.)
+AFFILIATE_PATTERNS = [
+    r'<a\s+[^>]*href\s*=\s*["\']https?://appsumo\.8odi\.net[^"\']*["\'][^>]*>',
+    r'<a\s+[^>]*href\s*=\s*["\']https?://[^"\']*appsumo[^"\']*["\'][^>]*>',
+    r'<a\s+[^>]*href\s*=\s*["\']https?://[^"\']*impact\.com[^"\']*["\'][^>]*>',
+    # Add more affiliate link patterns as needed
+]
+
+def add_nofollow_to_links(content):
+    """Add rel="nofollow sponsored" to every affiliate link in content."""
+    for pattern in AFFILIATE_PATTERNS:
+        content = re.sub(pattern, update_affiliate_link, content, flags=re.IGNORECASE)
+    return content
+
 def process_file(filepath):
     """Process a single HTML file."""
     try:
@@ -33,16 +54,7 @@ def process_file(filepath):
         
         original_content = content
         
-        # Find affiliate links (AppSumo, Impact, etc.)
-        affiliate_patterns = [
-            r'<a\s+[^>]*href\s*=\s*["\']https?://appsumo\.8odi\.net[^"\']*["\'][^>]*>',
-            r'<a\s+[^>]*href\s*=\s*["\']https?://[^"\']*appsumo[^"\']*["\'][^>]*>',
-            r'<a\s+[^>]*href\s*=\s*["\']https?://[^"\']*impact\.com[^"\']*["\'][^>]*>',
-            # Add more affiliate link patterns as needed
-        ]
-        
-        for pattern in affiliate_patterns:
-            content = re.sub(pattern, update_affiliate_link, content, flags=re.IGNORECASE)
+        content = add_nofollow_to_links(content)
         
         # Also check for common affiliate link text patterns
         # Links with "Get Deal", "Lifetime Deal", "Buy Now", etc.
@@ -6,15 +6,17 @@ This helps Google understand content and enables rich snippets.
 import re
 import json
 from pathlib import Path
+from html_extract import extract_page
+from parallel_runner import run_parallel, jobs_from_argv, report_failures
 
 def extract_tool_info(content):
     """Extract tool information from HTML content."""
     info = {}
+    page = extract_page(content)
     
     # Extract title
-    title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE)
-    if title_match:
-        title = title_match.group(1)
+    if page['title']:
+        title = page['title']
         # Extract tool name (usually before "Review")
         tool_match = re.search(r'^([^R]+?)\s+Review', title, re.IGNORECASE)
         if tool_match:
@@ -22,24 +24,19 @@ def extract_tool_info(content):
         else:
             info['name'] = title.split('Review')[0].strip()
     
-    # Extract rating
-    rating_match = re.search(r'(\d+\.?\d*)/10|(\d+\.?\d*)/5', content)
-    if rating_match:
-        rating = rating_match.group(1) or rating_match.group(2)
-        info['rating'] = float(rating)
-        # Normalize to 5-point scale if needed
-        if '/10' in content:
+    # Extract rating, normalized to a 5-point scale
+    if page['rating']:
+        info['rating'] = float(page['rating'])
+        if page['rating_scale'] == 10:
             info['rating'] = info['rating'] / 2
     
     # Extract description
-    desc_match = re.search(r'<meta\s+name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', content, re.IGNORECASE)
-    if desc_match:
-        info['description'] = desc_match.group(1)
+    if page['description']:
+        info['description'] = page['description']
     
     # Extract URL
-    canonical_match = re.search(r'<link\s+rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\']', content, re.IGNORECASE)
-    if canonical_match:
-        info['url'] = canonical_match.group(1)
+    if page['canonical']:
+        info['url'] = page['canonical']
     
     return info
 
@@ -232,21 +229,17 @@ def add_structured_data(content, filepath):
 
 def process_file(filepath):
     """Process a single HTML file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        updated_content = add_structured_data(content, filepath)
-        
-        # Only write if content changed
-        if updated_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    
+    updated_content = add_structured_data(content, filepath)
+    
+    # Only write if content changed
+    if updated_content != content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(updated_content)
+        return True
+    return False
 
 def main():
     """Process all HTML files."""
@@ -267,10 +260,12 @@ def main():
     print("Adding structured data...")
     
     updated_count = 0
-    for filepath in sorted(html_files):
-        if process_file(filepath):
+    results = run_parallel(process_file, sorted(html_files), jobs_from_argv())
+    for filepath, updated, error in results:
+        if updated:
             updated_count += 1
             print(f"[OK] Added structured data to {filepath}")
+    report_failures(results)
     
     print(f"\nCompleted! Updated {updated_count} files with structured data.")
     print("\nNext steps:")
@@ -4,25 +4,24 @@ Add Twitter Card meta tags (twitter:card, twitter:title, twitter:description, tw
 to all pages. X/Twitter uses these for link previews; without them, previews can fail
 on some pages (e.g. category pages) while working on others (e.g. tools).
 Also escape & as &amp; in meta content to avoid parsing issues.
+Pass --incremental to skip files unchanged since the last run (see incremental.py).
 """
 import re
 from pathlib import Path
+from html_extract import extract_page
+from incremental import is_incremental, load_manifest, is_unchanged, record, save_manifest
+
+# Bump when the transform's output changes so --incremental reprocesses every file
+TRANSFORM_VERSION = 1
 
 def extract_page_info(content, filepath):
     """Extract title, description, og:image URL from content."""
-    info = {'title': '', 'description': '', 'image': ''}
-    m = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-    if m:
-        info['title'] = re.sub(r'\s+', ' ', m.group(1).strip())
-    m = re.search(r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']*)["\']', content, re.IGNORECASE)
-    if m:
-        info['description'] = m.group(1).strip()
-    elif info['title']:
-        info['description'] = info['title']
-    m = re.search(r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']', content, re.IGNORECASE)
-    if m:
-        info['image'] = m.group(1).strip()
-    return info
+    page = extract_page(content, head_only=True)
+    return {
+        'title': page['title'],
+        'description': page['description'] or page['title'],
+        'image': page['og'].get('og:image', ''),
+    }
 
 def get_og_image_url(filepath):
     """OG image URL for page type."""
@@ -48,13 +47,15 @@ def get_og_image_url(filepath):
     return f'{base}/images/og-default.jpg'
 
 def safe_content(text):
-    """Escape & <> for use in HTML attribute; keep quotes as-is."""
+    """Escape & <> " for use in a double-quoted HTML attribute; keep ' as-is."""
     if not text:
         return ''
+    # Leave existing entities (&amp;, &#39;, ...) alone so re-runs don't double-escape
+    text = re.sub(r'&(?!(?:[a-zA-Z]+|#\d+|#x[0-9a-fA-F]+);)', '&amp;', text)
     return (
-        text.replace('&', '&amp;')
-            .replace('<', '&lt;')
+        text.replace('<', '&lt;')
             .replace('>', '&gt;')
+            .replace('"', '&quot;')
     )
 
 def add_twitter_cards_and_fix_entities(content, filepath):
@@ -147,11 +148,19 @@ def main():
     files.sort()
     print(f"Found {len(files)} HTML files")
     n = 0
+    manifest = load_manifest('add_twitter_cards', TRANSFORM_VERSION) if is_incremental() else None
     for p in files:
+        if manifest is not None and is_unchanged(manifest, p):
+            continue
         if process(p):
             n += 1
             if n <= 25:
                 print(f"[OK] {p}")
+        if manifest is not None:
+            record(manifest, p)
+    if manifest is not None:
+        save_manifest(manifest)
+        print(f"Skipped {manifest['skipped']} unchanged files (--incremental)")
     print(f"\nDone. Updated {n} files.")
 
 if __name__ == '__main__':
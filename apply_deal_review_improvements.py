@@ -89,12 +89,16 @@ def process_file(filepath: Path) -> bool:
 
     # 2. Add sticky CTA CSS if missing
     if "#sticky-cta-bar" not in content and "sticky-cta-bar" not in content:
-        content = re.sub(
+        content, added = re.subn(
             r'(\.mobile-dropdown-btn\.active svg \{ transform: rotate\(180deg\); \}\s*)</style>',
             r'\1' + STICKY_CSS + "\n    </style>",
             content,
             count=1
         )
+        if not added:
+            # Page CSS already moved to a shared sheet (dedupe_inline_styles.py):
+            # add a block of its own, which the next dedupe run shares as well
+            content = content.replace("</head>", "    <style>" + STICKY_CSS + "    </style>\n</head>", 1)
 
     # 3. Add id="main-cta-box" to first .cta-box
     if 'id="main-cta-box"' not in content and 'class="cta-box"' in content:
@@ -1,177 +1,58 @@
 #!/usr/bin/env python3
 """
 Apply 57 New AppSumo apps to the site:
-- Create detailed review pages
-- Add to reviews.html, guides, best-of, blogs, sitemap
+- Create detailed review pages (templates/layouts/deal_review.tmpl)
+- Add to reviews_data.json (reviews.html), guides, best-of, blogs, sitemap
 """
 
 import json
 import re
+from html import escape
 from pathlib import Path
 
+from generate_sitemap import build_sitemaps
+from templates import render
+
 ROOT = Path(__file__).resolve().parent
 DATA_PATH = ROOT / "new_apps_data.json"
 TOOLS_DIR = ROOT / "tools"
 GUIDES_DIR = ROOT / "guides"
 BEST_DIR = ROOT / "best"
 
-REVIEW_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta property="og:title" content="{name} Review 2026: Features, Pricing &amp; AppSumo Lifetime Deal" />
-    <meta property="og:description" content="{meta_desc}" />
-    <meta property="og:type" content="article" />
-    <meta property="og:url" content="https://artificial.one/tools/{slug}-review.html" />
-    <meta property="og:image" content="https://artificial.one/images/og-default.jpg" />
-    <meta property="og:image:width" content="1200" />
-    <meta property="og:image:height" content="630" />
-    <link rel="canonical" href="https://artificial.one/tools/{slug}-review.html" />
-    <title>{name} Review 2026: Features, Pricing & AppSumo Lifetime Deal</title>
-    <meta name="description" content="{meta_desc}">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 900px; margin: 0 auto; padding: 20px; }}
-        header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 60px 20px; text-align: center; }}
-        h1 {{ font-size: 2.2em; margin-bottom: 15px; }}
-        .rating-box {{ background: white; color: #333; padding: 20px; border-radius: 10px; display: inline-block; margin-top: 20px; }}
-        .score {{ font-size: 2.5em; font-weight: 700; color: #667eea; }}
-        .quick-verdict {{ background: #f0f7ff; padding: 30px; border-radius: 10px; margin: 30px 0; border-left: 4px solid #667eea; }}
-        .pros-cons {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 30px 0; }}
-        .pros {{ background: #f0fdf4; padding: 20px; border-radius: 10px; border-left: 4px solid #10b981; }}
-        .cons {{ background: #fef2f2; padding: 20px; border-radius: 10px; border-left: 4px solid #ef4444; }}
-        .cta-box {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; border-radius: 10px; text-align: center; margin: 40px 0; }}
-        .btn {{ display: inline-block; background: white; color: #667eea; padding: 15px 40px; border-radius: 5px; text-decoration: none; font-weight: 700; font-size: 1.1em; margin-top: 15px; }}
-        .btn:hover {{ background: #f0f0f0; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e0e0e0; }}
-        th {{ background: #f9f9f9; font-weight: 600; }}
-        ul {{ margin-left: 20px; line-height: 1.8; }}
-        h2 {{ color: #667eea; margin: 40px 0 20px; font-size: 1.8em; }}
-        footer {{ background: #333; color: white; text-align: center; padding: 20px; margin-top: 60px; }}
-    </style>
-</head>
-<body>
-    <nav style="background: white; border-bottom: 1px solid #e5e7eb; padding: 16px 24px;">
-        <div style="max-width: 1000px; margin: 0 auto; display: flex; justify-content: space-between; align-items: center;">
-            <a href="../index.html"><img src="../artificial-one-logo-large.svg" alt="artificial.one" style="height: 48px;"></a>
-            <div style="display: flex; gap: 20px;">
-                <a href="../reviews.html" style="color: #4b5563; text-decoration: none; font-weight: 500;">Reviews</a>
-                <a href="../guides/best-lifetime-ai-tools.html" style="color: #4b5563; text-decoration: none; font-weight: 500;">Lifetime Deals</a>
-                <a href="../blog.html" style="color: #4b5563; text-decoration: none; font-weight: 500;">Blog</a>
-            </div>
-        </div>
-    </nav>
-    <header>
-        <div class="container">
-            <h1>{name} Review: Complete Guide</h1>
-            <div class="rating-box">
-                <div class="score">4.5/5</div>
-                <p style="margin-top: 10px;">AppSumo lifetime deal</p>
-            </div>
-        </div>
-    </header>
-    <div class="container">
-        <section>
-            <p style="font-size: 1.2em; line-height: 1.8; margin-bottom: 30px;">{desc}</p>
-        </section>
-        <div class="quick-verdict">
-            <h2 style="margin-top: 0; color: #667eea;">Quick Verdict</h2>
-            <p style="font-size: 1.1em;">{name} is a solid pick for {bestFor} who want a one-time payment. The AppSumo lifetime deal removes recurring costs and locks in value.</p>
-        </div>
-        <section>
-            <h2>What is {name}?</h2>
-            <p>{desc} Get lifetime access via the AppSumo deal—pay once, use forever.</p>
-        </section>
-        <section>
-            <h2>Pricing: Lifetime Deal</h2>
-            <p>Get lifetime access to {name} via AppSumo. Pay once, use forever. No monthly fees.</p>
-            <div class="cta-box">
-                <h2>Get {name} Lifetime Deal</h2>
-                <a href="{link}" class="btn" target="_blank" rel="noopener">Get Lifetime Access →</a>
-            </div>
-        </section>
-        <section>
-            <h2>Key Features</h2>
-            <ul>
-                <li>Lifetime access with one-time payment</li>
-                <li>No recurring subscription</li>
-                <li>{pros_0}</li>
-                <li>{pros_1}</li>
-            </ul>
-        </section>
-        <section>
-            <h2>Pros and Cons</h2>
-            <div class="pros-cons">
-                <div class="pros">
-                    <h3>✅ Pros</h3>
-                    <ul>{pros_ul}</ul>
-                </div>
-                <div class="cons">
-                    <h3>❌ Cons</h3>
-                    <ul>{cons_ul}</ul>
-                </div>
-            </div>
-        </section>
-        <section>
-            <h2>Who is {name} For?</h2>
-            <p>{name} is best for <strong>{bestFor}</strong>. If you need {cat_lower} tools without monthly fees, the AppSumo lifetime deal is worth considering.</p>
-        </section>
-        <div style="text-align: center; margin: 60px 0;">
-            <a href="../guides/best-lifetime-ai-tools.html" style="display: inline-block; background: #667eea; color: white; padding: 12px 30px; border-radius: 5px; text-decoration: none; font-weight: 600;">← More AI Lifetime Deals</a>
-        </div>
-    </div>
-    <footer><p>© 2026 artificial.one - {name} Review</p></footer>
-</body>
-</html>
-'''
-
-
-def escape_js(s: str) -> str:
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
-
 
 def format_review_html(app: dict) -> str:
-    name = app["name"].replace("&", "&amp;")
-    slug = app["slug"]
-    link = app["link"]
-    desc = app["desc"]
-    best_for = app["bestFor"]
-    cat = app["cat"]
     pros = app["pros"]
     cons = app["cons"]
-    meta_desc = f"Complete {name} review covering features, pricing, and exclusive AppSumo lifetime deal. {desc[:80]}..."
-    pros_0 = pros[0] if len(pros) > 0 else "Lifetime access"
-    pros_1 = pros[1] if len(pros) > 1 else "One-time payment"
-    pros_ul = "".join(f"<li>{p}</li>" for p in pros)
-    cons_ul = "".join(f"<li>{c}</li>" for c in cons)
-    cat_lower = cat.lower()
-    return REVIEW_TEMPLATE.format(
-        name=name,
-        slug=slug,
-        link=link,
-        meta_desc=meta_desc,
-        desc=desc,
-        bestFor=best_for,
-        pros_0=pros_0,
-        pros_1=pros_1,
-        pros_ul=pros_ul,
-        cons_ul=cons_ul,
-        cat_lower=cat_lower,
+    return render(
+        "deal_review",
+        root="../",
+        name=app["name"],
+        slug=app["slug"],
+        link=app["link"],
+        meta_desc=f"Complete {app['name']} review covering features, pricing, and exclusive AppSumo lifetime deal. {app['desc'][:80]}...",
+        desc=app["desc"],
+        bestFor=app["bestFor"],
+        pros_0=pros[0] if len(pros) > 0 else "Lifetime access",
+        pros_1=pros[1] if len(pros) > 1 else "One-time payment",
+        pros_ul="".join(f"<li>{escape(p)}</li>" for p in pros),
+        cons_ul="".join(f"<li>{escape(c)}</li>" for c in cons),
+        cat_lower=app["cat"].lower(),
     )
 
 
-def js_entry(app: dict) -> str:
-    name = app["name"].replace('"', '\\"')
-    cat = app["cat"]
-    desc = escape_js(app["desc"])
-    pros = "[" + ", ".join(f'"{escape_js(p)}"' for p in app["pros"]) + "]"
-    cons = "[" + ", ".join(f'"{escape_js(c)}"' for c in app["cons"]) + "]"
-    best = app["bestFor"].replace('"', '\\"')
-    link = app["link"]
-    return f'    {{name: "{name}", cat: "{cat}", type: "deal", rating: "4.5", desc: "{desc}", pros: {pros}, cons: {cons}, bestFor: "{best}", pricing: "Lifetime deal", link: "{link}"}}'
+def reviews_entry(app: dict) -> dict:
+    return {
+        "name": app["name"],
+        "cat": app["cat"],
+        "type": "deal",
+        "rating": "4.5",
+        "desc": app["desc"],
+        "pros": app["pros"],
+        "cons": app["cons"],
+        "bestFor": app["bestFor"],
+        "pricing": "Lifetime deal",
+        "link": app["link"],
+    }
 
 
 def run():
@@ -187,18 +68,13 @@ def run():
         path.write_text(html, encoding="utf-8")
     print(f"Created {len(data)} review pages in tools/")
 
-    # 2. Update reviews.html
-    reviews_path = ROOT / "reviews.html"
-    content = reviews_path.read_text(encoding="utf-8")
-    # Insert new deal entries before "];" that closes tools array.
-    # Match ",\n];\nfunction getCategorySlug" so we replace the comma before ]; with ",\n<entries>\n"; avoids double comma.
-    new_entries = ",\n" + ",\n".join(js_entry(a) for a in data)
-    pat = r',\s*\]\s*;\s*\nfunction getCategorySlug'
-    m = re.search(pat, content)
-    if m:
-        content = content[: m.start()] + new_entries + "\n];\nfunction getCategorySlug" + content[m.end() :]
-    reviews_path.write_text(content, encoding="utf-8")
-    print("Updated reviews.html")
+    # 2. Add the deals to reviews_data.json (reviews.html is rebuilt from it by catalog.py)
+    reviews_data_path = ROOT / "reviews_data.json"
+    entries = json.loads(reviews_data_path.read_text(encoding="utf-8"))
+    listed = {e["name"] for e in entries}
+    entries.extend(reviews_entry(a) for a in data if a["name"] not in listed)
+    reviews_data_path.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print("Updated reviews_data.json (run `python catalog.py` to rebuild reviews.html)")
 
     # 3. Update best-lifetime-ai-tools: add "57 New Deals" section
     blt = ROOT / "guides" / "best-lifetime-ai-tools.html"
@@ -295,33 +171,9 @@ def run():
     blog_path.write_text(blog_full, encoding="utf-8")
     print("Created blog-57-new-appsumo-deals-2026.html")
 
-    # 7. Update sitemap
-    sitemap = ROOT / "sitemap.xml"
-    sm = sitemap.read_text(encoding="utf-8")
-    entry_tpl = """  <url>
-    <loc>https://artificial.one/tools/{slug}-review.html</loc>
-    <lastmod>2026-01-24</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.7</priority>
-  </url>
-"""
-    new_urls = "".join(entry_tpl.format(slug=a["slug"]) for a in data)
-    new_urls += """  <url>
-    <loc>https://artificial.one/guides/best-new-appsumo-deals-2026.html</loc>
-    <lastmod>2026-01-24</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.8</priority>
-  </url>
-  <url>
-    <loc>https://artificial.one/blog-57-new-appsumo-deals-2026.html</loc>
-    <lastmod>2026-01-24</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.8</priority>
-  </url>
-"""
-    sm = sm.replace("</urlset>", new_urls + "\n</urlset>")
-    sitemap.write_text(sm, encoding="utf-8")
-    print("Updated sitemap.xml")
+    # 7. Update sitemap (new pages get their own entries, no duplicates)
+    urls, written = build_sitemaps(ROOT)
+    print(f"Updated sitemaps ({urls} URLs, {len(written)} file(s) rewritten)")
 
     print("Done.")
 
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Paginated blog index generated from blog post metadata.
+
+blog_posts.json holds one entry per post (href, title, description,
+category, label, accent, gradient, emoji, minutes), in listing order. Posts
+are never spliced into blog.html by hand any more; from it this module emits:
+- blog.html                 page 1 of every post
+- blog/page-N.html          further pages
+- blog/<category>.html      per-category listings (blog/<category>-page-N.html)
+- data/blog/<listing>-N.json
+                            each page as a JSON feed, used by the page's
+                            "Load more" button (infinite scroll without
+                            shipping every card in the first page)
+
+blog.html is also the page shell: the generated region sits between
+<!-- blog-index --> ... <!-- /blog-index --> and everything outside it is
+edited as before. Pages under blog/ are the same shell with relative links
+moved one level down.
+
+New blog-*.html posts that are not in blog_posts.json yet are appended to it
+with metadata taken from the post (h1, meta description, category label,
+read time), so publishing a post is just writing the file and rebuilding.
+
+Usage:
+    python catalog.py      # rebuild everything
+    python blog_index.py   # same, printing only the blog index outputs
+"""
+import re
+import json
+from html import escape, unescape
+from pathlib import Path
+
+from catalog import artifact, build
+from facet_index import ANY, facet_index
+
+BLOG_FILE = 'blog.html'
+BLOG_POSTS_FILE = 'blog_posts.json'
+PAGES_DIR = 'blog'
+FEED_DIR = 'data/blog'
+PAGE_SIZE = 24  # fills whole rows at 2, 3 and 4 columns
+SITE_URL = 'https://artificial.one'
+
+INDEX_START = '<!-- blog-index -->'
+INDEX_END = '<!-- /blog-index -->'
+
+# Filter buttons, in display order; other categories follow by post count
+CATEGORY_BUTTONS = {
+    'productivity': '📊 Productivity',
+    'marketing': '📱 Marketing',
+    'writing': '✍️ Writing',
+    'design': '🎨 Design',
+    'video': '🎬 Video',
+    'coding': '💻 Coding',
+    'data': '📈 Data',
+    'voice': '🎙️ Voice',
+    'seo-content': '🔍 SEO',
+    'education': '🎓 Education',
+    'ecommerce': '🛒 E-commerce',
+    'deals': '💰 Deals',
+    'comparison': '⚖️ Comparison',
+}
+
+# Category label on a post page (first word) -> listing category
+LABEL_CATEGORIES = {
+    'SEO': 'seo-content', 'MARKETING': 'marketing', 'SALES': 'marketing',
+    'SOCIAL': 'marketing', 'DATA': 'data', 'DESIGN': 'design',
+    'E-COMMERCE': 'ecommerce', 'EDUCATION': 'education', 'PRODUCTIVITY': 'productivity',
+    'VIDEO': 'video', 'VOICE': 'voice', 'WRITING': 'writing', 'CODING': 'coding',
+}
+CATEGORY_EMOJI = {
+    'marketing': '📧', 'design': '🎨', 'data': '📊', 'writing': '✍️', 'video': '🎬',
+    'productivity': '⚡', 'education': '🎓', 'ecommerce': '🛒', 'seo-content': '🔍',
+}
+ACCENT_GRADIENTS = {
+    'blue': 'from-blue-500 to-blue-600', 'green': 'from-green-500 to-emerald-600',
+    'purple': 'from-purple-500 to-pink-600', 'pink': 'from-pink-500 to-rose-600',
+    'orange': 'from-orange-500 to-red-600', 'indigo': 'from-indigo-500 to-purple-600',
+}
+
+RELATIVE_URL = re.compile(r'\b(href|src)="(?!https?:|//|#|/|\.\./|mailto:|data:|javascript:)')
+
+
+# --- Post metadata ---------------------------------------------------------
+
+def load_posts(root):
+    path = root / BLOG_POSTS_FILE
+    return json.loads(path.read_text(encoding='utf-8')) if path.exists() else []
+
+
+def post_metadata(path):
+    """Card metadata for a blog post page that is not listed yet."""
+    content = path.read_text(encoding='utf-8', errors='ignore')
+    name = path.stem.replace('blog-', '').replace('-', ' ').title()
+
+    title = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.DOTALL)
+    desc = re.search(r'<meta name="description" content="([^"]+)"', content)
+    label = re.search(r'<div class="text-([a-z]+)-600 font-semibold mb-2">([^<]+)</div>', content)
+    minutes = re.search(r'(\d+) min read', content)
+
+    description = unescape(desc.group(1)) if desc else f"I tested {name} for 30 days. Here's how it went."
+    if len(description) > 150:
+        description = description[:150] + '...'
+    accent, label_text = (label.group(1), unescape(label.group(2)).strip()) if label else ('blue', 'PRODUCTIVITY')
+    category = LABEL_CATEGORIES.get(label_text.split()[0], 'productivity')
+    return {
+        'href': path.name,
+        'title': unescape(re.sub(r'<[^>]+>', '', title.group(1))).replace(' | artificial.one', '').strip()
+                 if title else f"How {name} Transformed My Workflow",
+        'description': description,
+        'category': category,
+        'label': label_text,
+        'accent': accent,
+        'gradient': ACCENT_GRADIENTS.get(accent, f'from-{accent}-500 to-{accent}-600'),
+        'emoji': CATEGORY_EMOJI.get(category, '📱'),
+        'minutes': int(minutes.group(1)) if minutes else 20,
+    }
+
+
+def discover_posts(root, posts):
+    """Posts plus any blog-*.html page not listed yet (appended in name order)."""
+    listed = {post['href'] for post in posts}
+    new = [post_metadata(path) for path in sorted(root.glob('blog-*.html')) if path.name not in listed]
+    return posts + new, new
+
+
+# --- Rendering -------------------------------------------------------------
+
+def page_path(listing, page):
+    """Output path of one page of a listing ('all' or a category)."""
+    if listing == 'all':
+        return BLOG_FILE if page == 1 else f'{PAGES_DIR}/page-{page}.html'
+    return f'{PAGES_DIR}/{listing}.html' if page == 1 else f'{PAGES_DIR}/{listing}-page-{page}.html'
+
+
+def feed_path(listing, page):
+    return f'{FEED_DIR}/{listing}-{page}.json'
+
+
+def render_card(post, prefix):
+    """Static HTML for one card; must stay in step with cardHtml() in the page script."""
+    e = {k: escape(str(v)) for k, v in post.items()}
+    href = escape(prefix) + e['href']
+    return f'''
+                <article class="article-card bg-white rounded-xl overflow-hidden h-full flex flex-col" data-category="{e['category']}">
+                    <div class="bg-gradient-to-br {e['gradient']} h-48 flex items-center justify-center">
+                        <span class="text-white text-6xl">{e['emoji']}</span>
+                    </div>
+                    <div class="p-6 flex-grow flex flex-col">
+                        <div class="text-sm text-{e['accent']}-600 font-semibold mb-2">{e['label']}</div>
+                        <h2 class="text-xl lg:text-2xl font-bold text-gray-900 mb-3">
+                            <a href="{href}" class="hover:text-{e['accent']}-600 transition-colors">{e['title']}</a>
+                        </h2>
+                        <p class="text-gray-600 mb-4 flex-grow">{e['description']}</p>
+                        <div class="flex items-center justify-between text-sm mt-auto">
+                            <span class="text-gray-500">{e['minutes']} min read</span>
+                            <a href="{href}" class="text-{e['accent']}-600 hover:text-{e['accent']}-700 font-medium">Read More →</a>
+                        </div>
+                    </div>
+                </article>
+'''
+
+
+LOAD_MORE_SCRIPT = '''
+    <script>
+    // "Load more" appends the next page from the JSON feed (data/blog/); the
+    // pagination links stay in the HTML for crawlers and no-JS visitors.
+    (function() {
+        const grid = document.getElementById('blog-cards');
+        const button = document.getElementById('load-more');
+        if (!grid || !button) return;
+        let page = Number(grid.dataset.page);
+        const pages = Number(grid.dataset.pages);
+        const prefix = grid.dataset.prefix;
+
+        function esc(value) {
+            return String(value).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+        }
+
+        // Same markup as render_card() in blog_index.py
+        function cardHtml(post) {
+            const href = esc(prefix + post.href);
+            const accent = esc(post.accent);
+            return `<article class="article-card bg-white rounded-xl overflow-hidden h-full flex flex-col" data-category="${esc(post.category)}">` +
+                `<div class="bg-gradient-to-br ${esc(post.gradient)} h-48 flex items-center justify-center"><span class="text-white text-6xl">${esc(post.emoji)}</span></div>` +
+                `<div class="p-6 flex-grow flex flex-col">` +
+                `<div class="text-sm text-${accent}-600 font-semibold mb-2">${esc(post.label)}</div>` +
+                `<h2 class="text-xl lg:text-2xl font-bold text-gray-900 mb-3"><a href="${href}" class="hover:text-${accent}-600 transition-colors">${esc(post.title)}</a></h2>` +
+                `<p class="text-gray-600 mb-4 flex-grow">${esc(post.description)}</p>` +
+                `<div class="flex items-center justify-between text-sm mt-auto"><span class="text-gray-500">${esc(post.minutes)} min read</span>` +
+                `<a href="${href}" class="text-${accent}-600 hover:text-${accent}-700 font-medium">Read More →</a></div>` +
+                `</div></article>`;
+        }
+
+        if (page < pages) button.classList.remove('hidden');
+        button.addEventListener('click', function() {
+            button.disabled = true;
+            fetch(prefix + grid.dataset.feed + (page + 1) + '.json')
+                .then(r => {
+                    if (!r.ok) throw new Error('Failed to load page ' + (page + 1));
+                    return r.json();
+                })
+                .then(feed => {
+                    grid.insertAdjacentHTML('beforeend', feed.items.map(cardHtml).join(''));
+                    page = feed.page;
+                    document.getElementById('blog-pagination').classList.add('hidden');
+                    button.disabled = false;
+                    if (page >= pages) button.classList.add('hidden');
+                })
+                .catch(err => {
+                    console.error(err);
+                    button.disabled = false;
+                });
+        });
+    })();
+    </script>
+'''
+
+
+def category_buttons(posts, counts):
+    """[(listing, label, count)] for the filter bar."""
+    labels = {}
+    for post in posts:
+        labels.setdefault(post['category'], post['label'].title())
+    extra = sorted((c for c in labels if c not in CATEGORY_BUTTONS), key=lambda c: -counts[c])
+    buttons = [('all', 'All', counts[ANY])]
+    for cat in [c for c in CATEGORY_BUTTONS if c in labels] + extra:
+        buttons.append((cat, CATEGORY_BUTTONS.get(cat, labels[cat]), counts[cat]))
+    return buttons
+
+
+def category_name(cat, label):
+    """'📱 Marketing' -> 'Marketing' for curated buttons; other labels as-is."""
+    return label.split(' ', 1)[-1] if cat in CATEGORY_BUTTONS else label
+
+
+def render_region(listing, page, pages, posts_on_page, buttons, heading):
+    path = page_path(listing, page)
+    prefix = '../' * path.count('/')
+    btn_class = ('px-3 sm:px-4 py-2 rounded-lg border border-gray-300 text-gray-700 '
+                 'hover:border-blue-600 text-sm sm:text-base whitespace-nowrap')
+    links = ''.join(
+        f'\n                    <a href="{prefix}{page_path(cat, 1)}" class="cat-btn{" active" if cat == listing else ""} {btn_class}">'
+        f'{escape(label)} ({count})</a>'
+        for cat, label, count in buttons
+    )
+    cards = ''.join(render_card(post, prefix) for post in posts_on_page)
+
+    nav = []
+    if page > 1:
+        nav.append(f'<a href="{prefix}{page_path(listing, page - 1)}" rel="prev" class="text-blue-600 hover:text-blue-700 font-medium">← Newer posts</a>')
+    nav.append(f'<span class="text-gray-500">Page {page} of {pages}</span>')
+    if page < pages:
+        nav.append(f'<a href="{prefix}{page_path(listing, page + 1)}" rel="next" class="text-blue-600 hover:text-blue-700 font-medium">Older posts →</a>')
+    heading_html = (f'\n            <h2 class="text-3xl font-bold text-gray-900 mb-8">{escape(heading)}</h2>'
+                    if heading else '')
+
+    return f'''
+    <!-- Filter Section -->
+    <section id="blog-filters" class="py-6 sm:py-8 bg-white border-b border-gray-200">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 xl:px-12">
+            <div>
+                <h3 class="text-sm font-semibold text-gray-700 mb-3">Filter by Category:</h3>
+                <div class="flex flex-wrap gap-2 sm:gap-3">{links}
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <!-- Blog Grid -->
+    <section id="blog-grid" class="py-16 bg-white">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 xl:px-12">{heading_html}
+            <div id="blog-cards" class="grid md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6 lg:gap-8" data-prefix="{prefix}" data-feed="{FEED_DIR}/{listing}-" data-page="{page}" data-pages="{pages}">{cards}
+            </div>
+            <nav id="blog-pagination" class="flex items-center justify-center gap-6 mt-12">{"".join(nav)}</nav>
+            <div class="text-center mt-8">
+                <button type="button" id="load-more" class="hidden bg-gradient-to-r from-purple-600 to-blue-600 text-white px-6 py-3 rounded-lg font-semibold">Load more articles</button>
+            </div>
+        </div>
+    </section>
+{LOAD_MORE_SCRIPT}    '''
+
+
+def relocate(shell):
+    """The blog.html shell for a page one directory down."""
+    shell = RELATIVE_URL.sub(lambda m: f'{m.group(1)}="../', shell)
+    # The FAQ structured data describes blog.html only
+    return re.sub(r'\s*<script type="application/ld\+json">.*?</script>', '', shell, flags=re.DOTALL)
+
+
+def page_head(shell, title, url):
+    shell = re.sub(r'<title>.*?</title>', lambda m: f'<title>{escape(title, quote=False)}</title>', shell, count=1)
+    for attr in ('property="og:title"', 'name="twitter:title"', 'property="og:image:alt"'):
+        shell = re.sub(r'(<meta ' + re.escape(attr) + r' content=")[^"]*', lambda m: m.group(1) + escape(title), shell)
+    shell = re.sub(r'(<link rel="canonical" href=")[^"]*', lambda m: m.group(1) + url, shell)
+    return re.sub(r'(<meta property="og:url" content=")[^"]*', lambda m: m.group(1) + url, shell)
+
+
+def replace_index(shell, region):
+    pattern = re.compile(re.escape(INDEX_START) + r'.*?' + re.escape(INDEX_END), re.DOTALL)
+    if not pattern.search(shell):
+        raise ValueError(f"{BLOG_FILE}: missing blog index markers ({INDEX_START} ... {INDEX_END})")
+    return pattern.sub(lambda m: INDEX_START + region + INDEX_END, shell, count=1)
+
+
+@artifact
+def blog_pages(tools, root):
+    posts, new = discover_posts(root, load_posts(root))
+    shell = (root / BLOG_FILE).read_text(encoding='utf-8')
+    subpage_shell = relocate(shell)
+
+    counts = facet_index(posts, ['category'])['n']
+    buttons = category_buttons(posts, counts)
+    listings = [('all', posts, None)] + [
+        (cat, [p for p in posts if p['category'] == cat], f'{category_name(cat, label)} Articles')
+        for cat, label, _ in buttons[1:]
+    ]
+
+    outputs = {}
+    if new:
+        outputs[BLOG_POSTS_FILE] = json.dumps(posts, indent=2, ensure_ascii=False) + '\n'
+    for listing, items, heading in listings:
+        pages = max(1, -(-len(items) // PAGE_SIZE))
+        for page in range(1, pages + 1):
+            on_page = items[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+            outputs[feed_path(listing, page)] = json.dumps(
+                {'listing': listing, 'page': page, 'pages': pages, 'items': on_page},
+                ensure_ascii=False, separators=(',', ':'),
+            ) + '\n'
+
+            path = page_path(listing, page)
+            region = render_region(listing, page, pages, on_page, buttons, heading)
+            if path == BLOG_FILE:
+                outputs[path] = replace_index(shell, region)
+                continue
+            title = f"{heading or 'AI Blog'}{f' - Page {page}' if page > 1 else ''} | artificial.one"
+            outputs[path] = replace_index(page_head(subpage_shell, title, f'{SITE_URL}/{path}'), region)
+    return outputs
+
+
+def main():
+    root = Path('.')
+    posts, new = discover_posts(root, load_posts(root))
+    for post in new:
+        print(f"[NEW] {post['href']} ({post['category']})")
+    print(f"Blog index: {len(posts)} posts, {PAGE_SIZE} per page")
+    written = [path for path, changed in build()
+               if changed and (path in (BLOG_FILE, BLOG_POSTS_FILE) or path.startswith((PAGES_DIR + '/', FEED_DIR)))]
+    for path in written:
+        print(f"[OK] Wrote {path}")
+    if not written:
+        print("Everything up to date")
+
+
+if __name__ == '__main__':
+    main()
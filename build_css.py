@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+"""
+Build-time replacement for the Tailwind CDN compiler.
+
+Pages load https://cdn.tailwindcss.com, which downloads the Tailwind compiler
+and generates CSS in the browser on every page view. This stage does that
+work once: it takes the class names of every page from the page index
+(class attributes, including the ones inside JS template strings, and
+classList calls), expands runtime placeholders such as text-${accent}-600
+with the values the listings are rendered from (data/blog/*.json,
+data/reviews/*.json), generates the Tailwind v3 CSS for the utilities in use
+and writes it to one content-hashed stylesheet, css/site.<hash>.css.
+
+Each page's CDN <script> is then replaced by a <link> to the stylesheet at the
+end of <head>, the position where the CDN injected its styles, so the page's
+own <style> rules keep losing to utilities exactly as before. A page that uses
+a utility this generator does not know keeps the CDN and is listed in the
+report. Nothing renders unstyled. Re-running the build updates the hash in
+pages already converted.
+
+Pages rendered through templates.py link the current stylesheet directly.
+Re-run this after generating pages that use utilities the sheet does not
+have yet: the new sheet gets a new hash, and every linked page is updated.
+
+Usage:
+    python build_css.py            # write the stylesheet and convert pages
+    python build_css.py --check    # report only, write nothing
+    python build_css.py --report   # also list the CSS each page uses
+"""
+import re
+import sys
+import json
+import time
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from page_index import build_index
+from templates import root_prefix
+
+CSS_DIR = 'css'
+SHEET_PREFIX = 'site.'
+CDN_SCRIPT_RE = re.compile(
+    r'[ \t]*<script\s+src=["\']https://cdn\.tailwindcss\.com/?["\']\s*>\s*</script>[ \t]*\n?', re.IGNORECASE
+)
+SHEET_LINK_RE = re.compile(
+    r'<link rel="stylesheet" href="(?:\.\./)*' + CSS_DIR + r'/' + re.escape(SHEET_PREFIX) + r'[0-9a-f]+\.css">'
+)
+HEAD_END_RE = re.compile(r'</head\s*>', re.IGNORECASE)
+PLACEHOLDER_RE = re.compile(r'\$\{([^}]*)\}')
+IDENT_RE = re.compile(r'[A-Za-z_]\w*')
+
+SCREENS = (('sm', 640), ('md', 768), ('lg', 1024), ('xl', 1280), ('2xl', 1536))
+STATES = (('hover', ':hover'), ('focus', ':focus'), ('active', ':active'))
+
+# Tailwind v3 default palette (the colour families the site uses)
+PALETTE = {
+    'gray': 'f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712',
+    'red': 'fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a',
+    'orange': 'fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407',
+    'amber': 'fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f 451a03',
+    'yellow': 'fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006',
+    'green': 'f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16',
+    'emerald': 'ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22',
+    'teal': 'f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a 042f2e',
+    'cyan': 'ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63 083344',
+    'blue': 'eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554',
+    'indigo': 'eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b',
+    'violet': 'f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95 2e1065',
+    'purple': 'faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764',
+    'pink': 'fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724',
+    'rose': 'fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337 4c0519',
+}
+SHADES = ('50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950')
+COLORS = {'white': 'ffffff', 'black': '000000'}
+for _family, _hexes in PALETTE.items():
+    COLORS.update({f'{_family}-{shade}': h for shade, h in zip(SHADES, _hexes.split())})
+
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+    '6xl': ('3.75rem', '1'), '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1'),
+}
+FONT_WEIGHTS = {'thin': 100, 'extralight': 200, 'light': 300, 'normal': 400, 'medium': 500,
+                'semibold': 600, 'bold': 700, 'extrabold': 800, 'black': 900}
+LEADING = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2'}
+MAX_WIDTHS = {'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem', '2xl': '42rem',
+              '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem',
+              'full': '100%', 'none': 'none', 'prose': '65ch'}
+RADII = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem',
+         'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+SHADOWS = {
+    'sm': ('0 1px 2px 0 rgb(0 0 0 / 0.05)', '0 1px 2px 0 var(--tw-shadow-color)'),
+    '': ('0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+         '0 1px 3px 0 var(--tw-shadow-color), 0 1px 2px -1px var(--tw-shadow-color)'),
+    'md': ('0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+           '0 4px 6px -1px var(--tw-shadow-color), 0 2px 4px -2px var(--tw-shadow-color)'),
+    'lg': ('0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+           '0 10px 15px -3px var(--tw-shadow-color), 0 4px 6px -4px var(--tw-shadow-color)'),
+    'xl': ('0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+           '0 20px 25px -5px var(--tw-shadow-color), 0 8px 10px -6px var(--tw-shadow-color)'),
+    '2xl': ('0 25px 50px -12px rgb(0 0 0 / 0.25)', '0 25px 50px -12px var(--tw-shadow-color)'),
+    'none': ('0 0 #0000', '0 0 #0000'),
+}
+TRANSITIONS = {
+    '': 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, '
+        'box-shadow, transform, filter, -webkit-backdrop-filter, backdrop-filter',
+    'all': 'all',
+    'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity',
+    'shadow': 'box-shadow',
+    'transform': 'transform',
+}
+GRADIENT_DIRECTIONS = {'t': 'top', 'tr': 'top right', 'r': 'right', 'br': 'bottom right',
+                       'b': 'bottom', 'bl': 'bottom left', 'l': 'left', 'tl': 'top left'}
+DISPLAYS = {'block': 'block', 'inline-block': 'inline-block', 'inline': 'inline', 'flex': 'flex',
+            'inline-flex': 'inline-flex', 'grid': 'grid', 'table': 'table', 'hidden': 'none'}
+POSITIONS = ('static', 'fixed', 'absolute', 'relative', 'sticky')
+SIDES = {'t': ('top',), 'r': ('right',), 'b': ('bottom',), 'l': ('left',),
+         'x': ('left', 'right'), 'y': ('top', 'bottom'), '': ('',)}
+TRANSFORM = ('translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) '
+             'skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))')
+MONO = 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace'
+SANS = 'ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol", "Noto Color Emoji"'
+
+PREFLIGHT = f"""*,::before,::after{{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}}
+::before,::after{{--tw-content:''}}
+html,:host{{line-height:1.5;-webkit-text-size-adjust:100%;-moz-tab-size:4;tab-size:4;font-family:{SANS};font-feature-settings:normal;font-variation-settings:normal;-webkit-tap-highlight-color:transparent}}
+body{{margin:0;line-height:inherit}}
+hr{{height:0;color:inherit;border-top-width:1px}}
+abbr:where([title]){{-webkit-text-decoration:underline dotted;text-decoration:underline dotted}}
+h1,h2,h3,h4,h5,h6{{font-size:inherit;font-weight:inherit}}
+a{{color:inherit;text-decoration:inherit}}
+b,strong{{font-weight:bolder}}
+code,kbd,samp,pre{{font-family:{MONO};font-feature-settings:normal;font-variation-settings:normal;font-size:1em}}
+small{{font-size:80%}}
+sub,sup{{font-size:75%;line-height:0;position:relative;vertical-align:baseline}}
+sub{{bottom:-0.25em}}
+sup{{top:-0.5em}}
+table{{text-indent:0;border-color:inherit;border-collapse:collapse}}
+button,input,optgroup,select,textarea{{font-family:inherit;font-feature-settings:inherit;font-variation-settings:inherit;font-size:100%;font-weight:inherit;line-height:inherit;letter-spacing:inherit;color:inherit;margin:0;padding:0}}
+button,select{{text-transform:none}}
+button,input:where([type='button']),input:where([type='reset']),input:where([type='submit']){{-webkit-appearance:button;background-color:transparent;background-image:none}}
+:-moz-focusring{{outline:auto}}
+:-moz-ui-invalid{{box-shadow:none}}
+progress{{vertical-align:baseline}}
+::-webkit-inner-spin-button,::-webkit-outer-spin-button{{height:auto}}
+[type='search']{{-webkit-appearance:textfield;outline-offset:-2px}}
+::-webkit-search-decoration{{-webkit-appearance:none}}
+::-webkit-file-upload-button{{-webkit-appearance:button;font:inherit}}
+summary{{display:list-item}}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{{margin:0}}
+fieldset{{margin:0;padding:0}}
+legend{{padding:0}}
+ol,ul,menu{{list-style:none;margin:0;padding:0}}
+dialog{{padding:0}}
+textarea{{resize:vertical}}
+input::placeholder,textarea::placeholder{{opacity:1;color:#9ca3af}}
+button,[role="button"]{{cursor:pointer}}
+:disabled{{cursor:default}}
+img,svg,video,canvas,audio,iframe,embed,object{{display:block;vertical-align:middle}}
+img,video{{max-width:100%;height:auto}}
+[hidden]:where(:not([hidden="until-found"])){{display:none}}
+*,::before,::after,::backdrop{{--tw-translate-x:0;--tw-translate-y:0;--tw-rotate:0;--tw-skew-x:0;--tw-skew-y:0;--tw-scale-x:1;--tw-scale-y:1;--tw-gradient-from-position: ;--tw-gradient-via-position: ;--tw-gradient-to-position: ;--tw-ring-offset-shadow:0 0 #0000;--tw-ring-shadow:0 0 #0000;--tw-shadow:0 0 #0000;--tw-shadow-colored:0 0 #0000}}
+"""
+
+# Anything shaped like a Tailwind utility; unknown ones keep a page on the CDN
+UTILITY_SHAPE_RE = re.compile(
+    r'^(?:-?(?:[mp][trblxy]?|inset|top|right|bottom|left|gap|space-[xy]|[wh]|min-[wh]|max-[wh]|z|order'
+    r'|col|row|grid|flex|basis|grow|shrink|text|font|leading|tracking|bg|from|via|to|border|rounded'
+    r'|shadow|ring|outline|opacity|transition|duration|ease|delay|scale|rotate|translate|skew|overflow'
+    r'|whitespace|break|cursor|list|items|justify|content|self|place|object|aspect|divide|decoration'
+    r'|underline|line-clamp|animate|blur|select|pointer-events|align|fill|stroke|truncate|sr)(?:-|$)'
+    r'|block$|inline|hidden$|table|contents$|static$|fixed$|absolute$|relative$|sticky$|container$'
+    r'|uppercase$|lowercase$|capitalize$|italic$|antialiased$|no-underline$|line-through$)'
+)
+
+
+def spacing(value):
+    """Tailwind spacing scale: 4 -> 1rem, 2.5 -> 0.625rem, px -> 1px, auto."""
+    if value == 'px':
+        return '1px'
+    if value == 'auto':
+        return 'auto'
+    if value == 'full':
+        return '100%'
+    if value == 'screen':
+        return '100vh'
+    if not re.fullmatch(r'\d+(?:\.5)?', value):
+        return None
+    if value == '0':
+        return '0px'
+    rem = float(value) / 4
+    return f"{rem:g}rem"
+
+
+def color(name, opacity_var=None):
+    """(css colour value, [vars]) for a palette name with an optional /NN modifier."""
+    name, _, alpha = name.partition('/')
+    if name == 'transparent':
+        return 'transparent', []
+    if name == 'current':
+        return 'currentColor', []
+    hexa = COLORS.get(name)
+    if hexa is None or (alpha and not alpha.isdigit()):
+        return None
+    r, g, b = (int(hexa[i:i + 2], 16) for i in (0, 2, 4))
+    if alpha:
+        return f"rgb({r} {g} {b} / {int(alpha) / 100:g})", []
+    if opacity_var:
+        return f"rgb({r} {g} {b} / var({opacity_var}))", [f"{opacity_var}: 1"]
+    return f"rgb({r} {g} {b})", []
+
+
+def color_rule(name, prop, opacity_var):
+    value = color(name, opacity_var)
+    if value is None:
+        return None
+    css, extra = value
+    return extra + [f"{prop}: {css}"]
+
+
+def side_rules(prefix, value, prop_for):
+    """Margin/padding style utilities: (sub-order, declarations)."""
+    m = re.fullmatch(rf'(-?){prefix}([trblxy]?)-(.+)', value)
+    if not m:
+        return None
+    negative, side, amount = m.groups()
+    size = spacing(amount)
+    if size is None or (negative and size == 'auto'):
+        return None
+    if negative:
+        size = f"-{size}"
+    order = 0 if not side else 1 if side in 'xy' else 2
+    return order, [f"{prop_for(s)}: {size}" for s in SIDES[side]]
+
+
+# --- Utilities, in Tailwind's plugin order ----------------------------------
+# Each takes the class name (without variants) and returns declarations,
+# (sub-order, declarations) or (sub-order, declarations, selector suffix).
+
+def u_container(c):
+    return [] if c == 'container' else None  # media rules are added in stylesheet()
+
+
+def u_position(c):
+    return [f"position: {c}"] if c in POSITIONS else None
+
+
+def u_inset(c):
+    m = re.fullmatch(r'(-?)(top|right|bottom|left|inset)-(.+)', c)
+    if not m or spacing(m.group(3)) is None:
+        return None
+    size = ('-' if m.group(1) else '') + spacing(m.group(3))
+    props = ('top', 'right', 'bottom', 'left') if m.group(2) == 'inset' else (m.group(2),)
+    return [f"{p}: {size}" for p in props]
+
+
+def u_z(c):
+    m = re.fullmatch(r'z-(\d+|auto)', c)
+    return [f"z-index: {m.group(1)}"] if m else None
+
+
+def u_grid_column(c):
+    m = re.fullmatch(r'col-span-(\d+|full)', c)
+    if not m:
+        return None
+    n = m.group(1)
+    return ["grid-column: 1 / -1"] if n == 'full' else [f"grid-column: span {n} / span {n}"]
+
+
+def u_margin(c):
+    return side_rules('m', c, lambda s: f"margin-{s}" if s else 'margin')
+
+
+def u_display(c):
+    return [f"display: {DISPLAYS[c]}"] if c in DISPLAYS else None
+
+
+def u_height(c):
+    m = re.fullmatch(r'h-(.+)', c)
+    return [f"height: {spacing(m.group(1))}"] if m and spacing(m.group(1)) else None
+
+
+def u_min_height(c):
+    sizes = {'min-h-screen': '100vh', 'min-h-full': '100%', 'min-h-0': '0px'}
+    return [f"min-height: {sizes[c]}"] if c in sizes else None
+
+
+def u_width(c):
+    m = re.fullmatch(r'w-(.+)', c)
+    if not m:
+        return None
+    if m.group(1) == 'screen':
+        return ["width: 100vw"]
+    return [f"width: {spacing(m.group(1))}"] if spacing(m.group(1)) else None
+
+
+def u_max_width(c):
+    m = re.fullmatch(r'max-w-(.+)', c)
+    return [f"max-width: {MAX_WIDTHS[m.group(1)]}"] if m and m.group(1) in MAX_WIDTHS else None
+
+
+def u_flex_shrink(c):
+    return {'flex-shrink-0': ["flex-shrink: 0"], 'flex-shrink': ["flex-shrink: 1"],
+            'shrink-0': ["flex-shrink: 0"], 'shrink': ["flex-shrink: 1"]}.get(c)
+
+
+def u_flex_grow(c):
+    return {'flex-grow': ["flex-grow: 1"], 'flex-grow-0': ["flex-grow: 0"],
+            'grow': ["flex-grow: 1"], 'grow-0': ["flex-grow: 0"]}.get(c)
+
+
+def u_scale(c):
+    m = re.fullmatch(r'scale-(\d+)', c)
+    if not m:
+        return None
+    value = f"{int(m.group(1)) / 100:g}"
+    return [f"--tw-scale-x: {value}", f"--tw-scale-y: {value}", f"transform: {TRANSFORM}"]
+
+
+def u_cursor(c):
+    m = re.fullmatch(r'cursor-(pointer|default|auto|not-allowed|wait|text|move|help)', c)
+    return [f"cursor: {m.group(1)}"] if m else None
+
+
+def u_list_style(c):
+    return {'list-disc': ["list-style-type: disc"], 'list-decimal': ["list-style-type: decimal"],
+            'list-none': ["list-style-type: none"]}.get(c)
+
+
+def u_grid_cols(c):
+    m = re.fullmatch(r'grid-cols-(\d+|none)', c)
+    if not m:
+        return None
+    n = m.group(1)
+    return ["grid-template-columns: none"] if n == 'none' else [f"grid-template-columns: repeat({n}, minmax(0, 1fr))"]
+
+
+def u_flex_direction(c):
+    return {'flex-row': ["flex-direction: row"], 'flex-row-reverse': ["flex-direction: row-reverse"],
+            'flex-col': ["flex-direction: column"], 'flex-col-reverse': ["flex-direction: column-reverse"]}.get(c)
+
+
+def u_flex_wrap(c):
+    return {'flex-wrap': ["flex-wrap: wrap"], 'flex-nowrap': ["flex-wrap: nowrap"]}.get(c)
+
+
+def u_align_items(c):
+    m = re.fullmatch(r'items-(start|end|center|baseline|stretch)', c)
+    if not m:
+        return None
+    return [f"align-items: {'flex-' + m.group(1) if m.group(1) in ('start', 'end') else m.group(1)}"]
+
+
+def u_justify(c):
+    values = {'start': 'flex-start', 'end': 'flex-end', 'center': 'center', 'between': 'space-between',
+              'around': 'space-around', 'evenly': 'space-evenly'}
+    m = re.fullmatch(r'justify-(\w+)', c)
+    return [f"justify-content: {values[m.group(1)]}"] if m and m.group(1) in values else None
+
+
+def u_gap(c):
+    m = re.fullmatch(r'gap-([xy]-)?(.+)', c)
+    if not m or spacing(m.group(2)) is None:
+        return None
+    prop = {'x-': 'column-gap', 'y-': 'row-gap', None: 'gap'}[m.group(1)]
+    return (0 if prop == 'gap' else 1), [f"{prop}: {spacing(m.group(2))}"]
+
+
+def u_space(c):
+    m = re.fullmatch(r'space-([xy])-(.+)', c)
+    if not m or spacing(m.group(2)) in (None, 'auto'):
+        return None
+    axis, size = m.group(1), spacing(m.group(2))
+    start, end = ('left', 'right') if axis == 'x' else ('top', 'bottom')
+    return 0, [
+        f"--tw-space-{axis}-reverse: 0",
+        f"margin-{start}: calc({size} * calc(1 - var(--tw-space-{axis}-reverse)))",
+        f"margin-{end}: calc({size} * var(--tw-space-{axis}-reverse))",
+    ], ' > :not([hidden]) ~ :not([hidden])'
+
+
+def u_overflow(c):
+    m = re.fullmatch(r'overflow-(x-|y-)?(auto|hidden|visible|scroll|clip)', c)
+    if not m:
+        return None
+    prop = 'overflow' + ('-' + m.group(1)[0] if m.group(1) else '')
+    return [f"{prop}: {m.group(2)}"]
+
+
+def u_whitespace(c):
+    m = re.fullmatch(r'whitespace-(normal|nowrap|pre|pre-line|pre-wrap)', c)
+    return [f"white-space: {m.group(1)}"] if m else None
+
+
+def u_word_break(c):
+    return {'break-all': ["word-break: break-all"], 'break-words': ["overflow-wrap: break-word"],
+            'break-normal': ["overflow-wrap: normal", "word-break: normal"]}.get(c)
+
+
+def u_rounded(c):
+    m = re.fullmatch(r'rounded(?:-(.+))?', c)
+    key = m.group(1) or '' if m else None
+    return [f"border-radius: {RADII[key]}"] if key in RADII else None
+
+
+def u_border_width(c):
+    m = re.fullmatch(r'border(?:-([trblxy]))?(?:-(\d+))?', c)
+    if not m:
+        return None
+    side, width = m.group(1) or '', m.group(2)
+    width = f"{width or 1}px"
+    order = 0 if not side else 1 if side in 'xy' else 2
+    return order, [f"border-{s}-width: {width}" if s else f"border-width: {width}" for s in SIDES[side]]
+
+
+def u_border_color(c):
+    m = re.fullmatch(r'border-([a-z]+(?:-\d+)?(?:/\d+)?)', c)
+    return color_rule(m.group(1), 'border-color', '--tw-border-opacity') if m else None
+
+
+def u_bg_color(c):
+    m = re.fullmatch(r'bg-([a-z]+(?:-\d+)?(?:/\d+)?)', c)
+    return color_rule(m.group(1), 'background-color', '--tw-bg-opacity') if m else None
+
+
+def u_bg_image(c):
+    m = re.fullmatch(r'bg-gradient-to-(\w+)', c)
+    if not m or m.group(1) not in GRADIENT_DIRECTIONS:
+        return None
+    return [f"background-image: linear-gradient(to {GRADIENT_DIRECTIONS[m.group(1)]}, var(--tw-gradient-stops))"]
+
+
+def u_gradient_stops(c):
+    m = re.fullmatch(r'(from|via|to)-([a-z]+(?:-\d+)?)', c)
+    if not m or color(m.group(2)) is None or m.group(2) in ('transparent', 'current'):
+        return None
+    stop, name = m.groups()
+    value = '#' + COLORS[name]
+    r, g, b = (int(COLORS[name][i:i + 2], 16) for i in (0, 2, 4))
+    clear = f"rgb({r} {g} {b} / 0)"
+    if stop == 'from':
+        return 0, [f"--tw-gradient-from: {value} var(--tw-gradient-from-position)",
+                   f"--tw-gradient-to: {clear} var(--tw-gradient-to-position)",
+                   "--tw-gradient-stops: var(--tw-gradient-from), var(--tw-gradient-to)"]
+    if stop == 'via':
+        return 1, [f"--tw-gradient-to: {clear} var(--tw-gradient-to-position)",
+                   f"--tw-gradient-stops: var(--tw-gradient-from), {value} var(--tw-gradient-via-position), var(--tw-gradient-to)"]
+    return 2, [f"--tw-gradient-to: {value} var(--tw-gradient-to-position)"]
+
+
+def u_bg_clip(c):
+    m = re.fullmatch(r'bg-clip-(text|border|padding|content)', c)
+    if not m:
+        return None
+    value = m.group(1) if m.group(1) == 'text' else f"{m.group(1)}-box"
+    return [f"-webkit-background-clip: {value}", f"background-clip: {value}"]
+
+
+def u_padding(c):
+    return side_rules('p', c, lambda s: f"padding-{s}" if s else 'padding')
+
+
+def u_text_align(c):
+    m = re.fullmatch(r'text-(left|center|right|justify)', c)
+    return [f"text-align: {m.group(1)}"] if m else None
+
+
+def u_font_family(c):
+    return {'font-mono': [f"font-family: {MONO}"], 'font-sans': [f"font-family: {SANS}"]}.get(c)
+
+
+def u_font_size(c):
+    m = re.fullmatch(r'text-(\w+)', c)
+    if not m or m.group(1) not in FONT_SIZES:
+        return None
+    size, line_height = FONT_SIZES[m.group(1)]
+    return [f"font-size: {size}", f"line-height: {line_height}"]
+
+
+def u_font_weight(c):
+    m = re.fullmatch(r'font-(\w+)', c)
+    return [f"font-weight: {FONT_WEIGHTS[m.group(1)]}"] if m and m.group(1) in FONT_WEIGHTS else None
+
+
+def u_leading(c):
+    m = re.fullmatch(r'leading-(\w+)', c)
+    return [f"line-height: {LEADING[m.group(1)]}"] if m and m.group(1) in LEADING else None
+
+
+def u_text_color(c):
+    m = re.fullmatch(r'text-([a-z]+(?:-\d+)?(?:/\d+)?)', c)
+    return color_rule(m.group(1), 'color', '--tw-text-opacity') if m else None
+
+
+def u_text_decoration(c):
+    return {'underline': ["text-decoration-line: underline"], 'line-through': ["text-decoration-line: line-through"],
+            'no-underline': ["text-decoration-line: none"]}.get(c)
+
+
+def u_opacity(c):
+    m = re.fullmatch(r'opacity-(\d+)', c)
+    return [f"opacity: {int(m.group(1)) / 100:g}"] if m else None
+
+
+def u_shadow(c):
+    m = re.fullmatch(r'shadow(?:-(\w+))?', c)
+    key = m.group(1) or '' if m else None
+    if key not in SHADOWS:
+        return None
+    shadow, colored = SHADOWS[key]
+    return [f"--tw-shadow: {shadow}", f"--tw-shadow-colored: {colored}",
+            "box-shadow: var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)"]
+
+
+def u_transition(c):
+    m = re.fullmatch(r'transition(?:-(\w+))?', c)
+    key = m.group(1) or '' if m else None
+    if key not in TRANSITIONS:
+        return None
+    return [f"transition-property: {TRANSITIONS[key]}",
+            "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)", "transition-duration: 150ms"]
+
+
+UTILITIES = (
+    u_container, u_position, u_inset, u_z, u_grid_column, u_margin, u_display, u_height,
+    u_min_height, u_width, u_max_width, u_flex_shrink, u_flex_grow, u_scale, u_cursor,
+    u_list_style, u_grid_cols, u_flex_direction, u_flex_wrap, u_align_items, u_justify, u_gap,
+    u_space, u_overflow, u_whitespace, u_word_break, u_rounded, u_border_width, u_border_color,
+    u_bg_color, u_bg_image, u_gradient_stops, u_bg_clip, u_padding, u_text_align, u_font_family,
+    u_font_size, u_font_weight, u_leading, u_text_color, u_text_decoration, u_opacity, u_shadow,
+    u_transition,
+)
+VARIANTS = [state for state, _ in STATES] + [screen for screen, _ in SCREENS]
+
+
+def escape_class(name):
+    return re.sub(r'([^A-Za-z0-9_-])', r'\\\1', name)
+
+
+@lru_cache(maxsize=None)
+def compile_class(token):
+    """(variant, sort key, css rule) for one class name, or None if it is not a utility."""
+    variant, _, base = token.rpartition(':')
+    if variant and variant not in VARIANTS:
+        return None
+    for index, utility in enumerate(UTILITIES):
+        result = utility(base)
+        if result is None:
+            continue
+        if isinstance(result, list):
+            result = (0, result)
+        order, decls, suffix = (result + ('',))[:3]
+        selector = '.' + escape_class(token) + dict(STATES).get(variant, '') + suffix
+        rule = selector + '{' + ';'.join(d.replace(': ', ':', 1) for d in decls) + '}' if decls else ''
+        return variant, (index, order, base), rule
+    return None
+
+
+def stylesheet(classes):
+    """The CSS for a set of class names: preflight, container, then utilities by variant."""
+    compiled = sorted(filter(None, map(compile_class, classes)), key=lambda c: (c[1], c[2]))
+    by_variant = {}
+    for variant, _, rule in compiled:
+        if rule:
+            by_variant.setdefault(variant, []).append(rule)
+
+    parts = [PREFLIGHT]
+    if 'container' in classes:
+        parts.append('.container{width:100%}\n')
+        parts.extend(f'@media (min-width:{px}px){{.container{{max-width:{px}px}}}}\n' for _, px in SCREENS)
+    parts.extend(rule + '\n' for rule in by_variant.get('', []))
+    for state, _ in STATES:
+        parts.extend(rule + '\n' for rule in by_variant.get(state, []))
+    for screen, px in SCREENS:
+        if by_variant.get(screen):
+            parts.append(f'@media (min-width:{px}px){{\n' + ''.join(r + '\n' for r in by_variant[screen]) + '}\n')
+    return ''.join(parts)
+
+
+# --- Class names in use ------------------------------------------------------
+
+def data_values(root):
+    """{key: {string values}} from the JSON shards the listings render at runtime."""
+    values = {}
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    values.setdefault(key, set()).add(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    for shard in sorted((Path(root) / 'data').glob('*/*.json')):
+        walk(json.loads(shard.read_text(encoding='utf-8')))
+    return values
+
+
+def expand(token, values):
+    """Class names a token with ${...} placeholders can become at runtime."""
+    names = PLACEHOLDER_RE.findall(token)
+    if not names:
+        return {token}
+    # ${esc(post.accent)} -> the 'accent' values; a placeholder with no data is unknowable
+    key = IDENT_RE.findall(names[0])[-1] if IDENT_RE.findall(names[0]) else None
+    expanded = set()
+    for value in values.get(key, ()):
+        expanded |= expand(PLACEHOLDER_RE.sub(lambda _: value, token, count=1), values)
+    if not expanded:
+        return {token}  # reported by unsupported() if it is utility-shaped
+    return {name for option in expanded for name in option.split()}
+
+
+def page_classes(facts, values):
+    classes = set()
+    for token in facts['classes']:
+        classes |= expand(token, values)
+    return classes
+
+
+def unsupported(classes, content):
+    """Utility-shaped classes the generator cannot produce and the page does not define itself."""
+    missing = []
+    for name in sorted(classes):
+        base = name.rpartition(':')[2]
+        if compile_class(name) or not UTILITY_SHAPE_RE.match(base):
+            continue
+        if re.search(r'\.' + re.escape(escape_class(name)) + r'(?![\w-])', content):
+            continue  # styled by the page's own <style>
+        missing.append(name)
+    return missing
+
+
+# --- Build -------------------------------------------------------------------
+
+def convert_page(content, href):
+    """Content with the CDN script (or an older stylesheet link) replaced by href."""
+    link = f'<link rel="stylesheet" href="{href}">'
+    if SHEET_LINK_RE.search(content):
+        return SHEET_LINK_RE.sub(link, content)
+    content = CDN_SCRIPT_RE.sub('', content, count=1)
+    m = HEAD_END_RE.search(content)
+    return content[:m.start()] + f'    {link}\n' + content[m.start():]
+
+
+def build_css(root='.', check=False):
+    """
+    Returns (sheet path, css, {page: bytes of utility CSS it uses},
+    {page: [unsupported classes]}, [pages rewritten]).
+    """
+    root = Path(root)
+    index = build_index(root)
+    values = data_values(root)
+
+    converted, kept = {}, {}
+    for page, facts in sorted(index.items()):
+        path = root / page
+        content = path.read_text(encoding='utf-8', errors='ignore')
+        if not CDN_SCRIPT_RE.search(content) and not SHEET_LINK_RE.search(content):
+            continue
+        if not HEAD_END_RE.search(content):
+            continue
+        classes = page_classes(facts, values)
+        missing = unsupported(classes, content)
+        if missing:
+            kept[page] = missing
+            continue
+        converted[page] = (content, classes)
+
+    all_classes = set().union(*(classes for _, classes in converted.values())) if converted else set()
+    css = stylesheet(all_classes)
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]
+    sheet = root / CSS_DIR / f'{SHEET_PREFIX}{digest}.css'
+
+    written = []
+    usage = {}
+    preflight_bytes = len(PREFLIGHT.encode('utf-8'))
+    for page, (content, classes) in converted.items():
+        usage[page] = len(stylesheet(classes).encode('utf-8')) - preflight_bytes
+        href = root_prefix(root / page, root) + f'{CSS_DIR}/{sheet.name}'
+        updated = convert_page(content, href)
+        if updated != content:
+            written.append(page)
+            if not check:
+                (root / page).write_text(updated, encoding='utf-8')
+
+    if not check:
+        sheet.parent.mkdir(exist_ok=True)
+        if not sheet.exists():
+            sheet.write_text(css, encoding='utf-8')
+        for old in sheet.parent.glob(f'{SHEET_PREFIX}*.css'):
+            if old != sheet:
+                old.unlink()
+    return sheet, css, usage, kept, written
+
+
+def main():
+    args = sys.argv[1:]
+    check = '--check' in args
+    started = time.perf_counter()
+    sheet, css, usage, kept, written = build_css('.', check=check)
+    elapsed = time.perf_counter() - started
+
+    size = len(css.encode('utf-8'))
+    print(f"Stylesheet: {sheet.as_posix()} ({size:,} bytes, {css.count('{') - css.count('@media')} rules)")
+    print(f"Pages on the stylesheet: {len(usage)} ({len(written)} {'to update' if check else 'updated'})")
+    print(f"Pages kept on the CDN: {len(kept)}")
+    for page, missing in sorted(kept.items()):
+        print(f"  {page}: {', '.join(missing[:8])}{' ...' if len(missing) > 8 else ''}")
+
+    if usage:
+        total = sum(usage.values())
+        print(f"Utility CSS per page: {total // len(usage):,} bytes on average, "
+              f"{max(usage.values()):,} at most; the Tailwind compiler script is no longer loaded")
+    if '--report' in args:
+        for page, used in sorted(usage.items()):
+            print(f"  {page}: {used:,} bytes of utilities")
+    print(f"Done in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Dependency graph for partial rebuilds.
+
+Records which generated outputs depend on which inputs, so editing one tool
+record rebuilds only what shows it instead of re-running every whole-tree
+script (update_appsumo_links.py, add_structured_data.py,
+add_related_tools_sections.py, generate_og_images.py, generate_sitemap.py).
+
+Inputs and their fingerprints:
+    tool:<slug>      a catalog record (catalog.py), hashed field by field
+    partial:<name>   a shared partial (templates/partials/<name>.tmpl)
+
+Outputs of a tool record:
+    its review page and blog post (blog-<slug>.html), every page that links
+    to its review page or carries its affiliate link, the OG image of its
+    review page and the sitemap entries of all those pages.
+Outputs of a partial: every page that contains its <!-- partial:name --> marker.
+
+The sitemap is the exception: when any sitemap entry is affected,
+generate_sitemap.build_sitemaps runs over the whole tree (through the page
+index, so unchanged pages are not re-read). It re-dates only the pages whose
+content hash changed and rewrites only the shards that contain them.
+
+The graph and the per-page references it was built from are cached in
+.build_graph.json (pages are only re-scanned when their mtime or size changes).
+
+Usage:
+    python build_graph.py            # rebuild what depends on changed inputs
+    python build_graph.py --dry-run  # list what would be rebuilt
+    python build_graph.py --why tools/tidycal-review.html   # inputs of one output
+"""
+import re
+import sys
+import json
+import hashlib
+from dataclasses import asdict
+from pathlib import Path
+
+from catalog import build, compile_catalog
+from page_index import build_index, iter_html_files, page_key
+from templates import TEMPLATE_DIR, TEMPLATE_SUFFIX, refresh_partials, root_prefix
+
+GRAPH_FILE = '.build_graph.json'
+GRAPH_VERSION = 1
+
+REVIEW_LINK_RE = re.compile(r'([a-z0-9][a-z0-9.-]*?)-review\.html')
+PARTIAL_MARK_RE = re.compile(r'<!-- partial:(\w+) -->')
+OG_TOOLS_DIR = 'images/og-tools'
+SITEMAP_PREFIX = 'sitemap:'
+
+
+def fingerprint(value):
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def tool_fingerprint(tool):
+    # sources only says where a field came from, not what is rendered
+    record = asdict(tool)
+    record.pop('sources')
+    return fingerprint(record)
+
+
+def current_inputs(tools):
+    """{input node: fingerprint} for every tool record and partial."""
+    inputs = {f'tool:{tool.slug}': tool_fingerprint(tool) for tool in tools}
+    for path in sorted((TEMPLATE_DIR / 'partials').glob(f'*{TEMPLATE_SUFFIX}')):
+        inputs[f'partial:{path.stem}'] = fingerprint(path.read_text(encoding='utf-8'))
+    return inputs
+
+
+def scan_pages(root, cached):
+    """
+    {page: {'reviews': [...], 'partials': [...]}}: the review-page slugs each
+    page links to and the partials it contains. Unchanged pages come from cached.
+    """
+    root = Path(root)
+    pages = {}
+    for filepath in iter_html_files(root):
+        key = page_key(filepath, root)
+        st = filepath.stat()
+        entry = cached.get(key)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            pages[key] = entry
+            continue
+        content = filepath.read_text(encoding='utf-8', errors='ignore')
+        pages[key] = {
+            'reviews': sorted(set(REVIEW_LINK_RE.findall(content))),
+            'partials': sorted(set(PARTIAL_MARK_RE.findall(content))),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+        }
+    return pages
+
+
+def og_image(review_page):
+    return f"{OG_TOOLS_DIR}/{Path(review_page).stem.replace('-review', '').lower()}.jpg"
+
+
+def tool_outputs(tool, pages, by_review, by_affiliate):
+    """Pages, images and sitemap entries that show this tool."""
+    names = {tool.slug, *tool.aliases}
+    if tool.review_page:
+        names.add(Path(tool.review_page).stem.replace('-review', ''))
+
+    outputs = set()
+    if tool.review_page and tool.review_page in pages:
+        outputs.add(tool.review_page)
+        outputs.add(og_image(tool.review_page))
+    for name in names:
+        outputs.update(by_review.get(name, ()))
+        blog_post = f'blog-{name}.html'
+        if blog_post in pages:
+            outputs.add(blog_post)
+    if tool.affiliate_link:
+        outputs.update(by_affiliate.get(tool.affiliate_link, ()))
+    outputs.update(SITEMAP_PREFIX + page for page in list(outputs) if page in pages)
+    return sorted(outputs)
+
+
+def build_graph(tools, root='.', cached_pages=None):
+    """Return (edges {input: [outputs]}, scanned pages)."""
+    pages = scan_pages(root, cached_pages or {})
+    by_review, by_partial = {}, {}
+    for page, refs in pages.items():
+        for slug in refs['reviews']:
+            by_review.setdefault(slug, set()).add(page)
+        for name in refs['partials']:
+            by_partial.setdefault(name, set()).add(page)
+    by_affiliate = {}
+    for page, facts in build_index(root).items():
+        for link in facts['affiliate_links']:
+            by_affiliate.setdefault(link, set()).add(page)
+
+    edges = {f'tool:{tool.slug}': tool_outputs(tool, pages, by_review, by_affiliate) for tool in tools}
+    for name, users in by_partial.items():
+        edges[f'partial:{name}'] = sorted(users)
+    return edges, pages
+
+
+def load_graph(root='.'):
+    try:
+        data = json.loads((Path(root) / GRAPH_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if data.get('version') == GRAPH_VERSION else {}
+
+
+def save_graph(root, inputs, edges, pages):
+    path = Path(root) / GRAPH_FILE
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(
+        {'version': GRAPH_VERSION, 'inputs': inputs, 'edges': edges, 'pages': pages},
+        ensure_ascii=False,
+    ), encoding='utf-8')
+    tmp.replace(path)
+
+
+def changed_inputs(old, new):
+    """Inputs that were added, removed or whose fingerprint changed."""
+    return sorted(node for node in set(old) | set(new) if old.get(node) != new.get(node))
+
+
+def dirty_outputs(changed, old_edges, new_edges):
+    """Outputs of the changed inputs, before and after (so removed mentions rebuild too)."""
+    dirty = set()
+    for node in changed:
+        dirty.update(old_edges.get(node, ()))
+        dirty.update(new_edges.get(node, ()))
+    return sorted(dirty)
+
+
+# --- Rebuild steps -----------------------------------------------------------
+
+def related_key(tool):
+    from add_related_tools_sections import RELATED_TOOLS_MAP
+    return next((key for key in (tool.slug, *tool.aliases) if key in RELATED_TOOLS_MAP), None)
+
+
+def rebuild_pages(pages, tools, root):
+    """Per-page versions of the whole-tree fixers, for the dirty pages only."""
+    from add_structured_data import process_file
+    from add_related_tools_sections import add_related_tools_section
+    from update_appsumo_links import EXCEL_FILE, read_excel_links, resolve_fuzzy, update_links_in_file
+    from link_rewriter import build_rewrite_engine
+
+    product_links = read_excel_links(EXCEL_FILE)
+    engine = build_rewrite_engine(product_links, resolve=resolve_fuzzy(product_links))
+    related = {tool.review_page: tool for tool in tools if tool.review_page and tool.related}
+
+    for page in pages:
+        filepath = Path(root) / page
+        if not filepath.exists():
+            continue
+        updates = update_links_in_file(str(filepath), engine)
+        if updates:
+            print(f"[OK] {page}: {len(updates)} link(s) updated")
+        if process_file(filepath):
+            print(f"[OK] {page}: structured data updated")
+        tool = related.get(page)
+        if tool and related_key(tool):
+            before = filepath.read_bytes()
+            add_related_tools_section(filepath, related_key(tool), tool.name)
+            if filepath.read_bytes() != before:
+                print(f"[OK] {page}: related tools updated")
+
+        content = filepath.read_text(encoding='utf-8', errors='ignore')
+        updated = refresh_partials(content, {'root': root_prefix(filepath, root)})
+        if updated != content:
+            filepath.write_text(updated, encoding='utf-8')
+            print(f"[OK] {page}: partials refreshed")
+
+
+def rebuild_images(review_pages, root):
+    from generate_og_images import build_og_images
+    if review_pages:
+        build_og_images([Path(root) / page for page in review_pages], Path(root) / 'images', partial=True)
+
+
+def rebuild_sitemap(pages, root):
+    # The sitemap builder is incremental itself: it re-dates pages whose content
+    # hash changed and rewrites only the shards containing them
+    from generate_sitemap import build_sitemaps
+    _, written = build_sitemaps(root)
+    print(f"sitemap: {len(pages)} affected entr{'y' if len(pages) == 1 else 'ies'}, "
+          f"{len(written)} file(s) rewritten")
+
+
+def main():
+    args = sys.argv[1:]
+    root = '.'
+    tools = compile_catalog(root)
+    old = load_graph(root)
+    inputs = current_inputs(tools)
+    edges, pages = build_graph(tools, root, old.get('pages'))
+
+    if '--why' in args:
+        target = args[args.index('--why') + 1]
+        sources = sorted(node for node, outputs in edges.items() if target in outputs)
+        print(f"{target} depends on: {', '.join(sources) if sources else 'nothing recorded'}")
+        return
+
+    if not old:
+        if '--dry-run' in args:
+            print(f"No {GRAPH_FILE} yet: would record the graph ({len(edges)} inputs, "
+                  f"{sum(len(outputs) for outputs in edges.values())} edges); nothing to rebuild")
+            return
+        print(f"No {GRAPH_FILE} yet: recording the graph ({len(edges)} inputs); nothing to rebuild")
+        save_graph(root, inputs, edges, pages)
+        return
+
+    changed = changed_inputs(old['inputs'], inputs)
+    dirty = dirty_outputs(changed, old['edges'], edges)
+    dirty_pages = [p for p in dirty if p.endswith('.html') and not p.startswith(SITEMAP_PREFIX)]
+    dirty_images = [p for p in dirty if p.startswith(OG_TOOLS_DIR)]
+    dirty_entries = [p[len(SITEMAP_PREFIX):] for p in dirty if p.startswith(SITEMAP_PREFIX)]
+
+    print(f"{len(changed)} changed input(s), {len(dirty)} output(s) to rebuild")
+    for node in changed:
+        print(f"  {node}")
+    if '--dry-run' in args:
+        for output in dirty:
+            print(f"  -> {output}")
+        return
+    if not changed:
+        save_graph(root, inputs, edges, pages)
+        return
+
+    if any(node.startswith('tool:') for node in changed):
+        for path, written in build(root, tools):
+            if written:
+                print(f"[OK] Wrote {path}")
+    rebuild_pages(dirty_pages, tools, root)
+    review_pages = [p for p in dirty_pages if og_image(p) in dirty_images]
+    rebuild_images(review_pages, root)
+    rebuild_sitemap(dirty_entries, root)
+
+    # Pages were rewritten: rescan them so the saved graph matches the tree
+    edges, pages = build_graph(tools, root, pages)
+    save_graph(root, inputs, edges, pages)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Structured tool catalog: one validated dataset built from every place tool
+facts currently live, and a compiled build step that emits derived artifacts
+from it instead of each script re-scraping the rendered pages.
+
+Sources, merged by review slug or tool name (later sources only fill gaps,
+except where noted):
+1. reviews_data.json   the tool listing shown on reviews.html (published data;
+                       before the migration it was reviews.html's inline
+                       `const tools = [...]` array, which is still read as a
+                       fallback)
+2. new_apps_data.json  deals added by add_new_appsumo_apps.py
+3. the Excel tracker   affiliate link and deal status (authoritative)
+4. RELATED_TOOLS_MAP   related tools / category from add_related_tools_sections.py
+5. tools/*.html        review page path, plus title/rating/category fallbacks
+                       taken from the page index
+
+Ratings are normalised to a 0-5 float ("9.5/10" -> 4.75, "4.91" -> 4.91,
+"4.5/5" -> 4.5); the raw value is kept in rating_text.
+
+Usage:
+    python catalog.py            # compile catalog.json and every registered artifact
+                                 # (reviews.html grid + shards, paginated blog index;
+                                 # see prerender_reviews.py, blog_index.py)
+    python catalog.py --check    # validate only; exit 1 on problems
+
+    from catalog import load_catalog
+    for tool in load_catalog():
+        print(tool.name, tool.rating, tool.review_page)
+"""
+import re
+import sys
+import json
+import importlib
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from page_index import build_index
+from xlsx_reader import EXCEL_FILE, read_tracker
+
+REVIEWS_FILE = 'reviews.html'
+REVIEWS_DATA_FILE = 'reviews_data.json'
+NEW_APPS_FILE = 'new_apps_data.json'
+CATALOG_FILE = 'catalog.json'
+CATALOG_VERSION = 2
+
+# Modules whose @artifact builders run in build()
+ARTIFACT_MODULES = ('prerender_reviews', 'blog_index')
+
+TOOL_TYPES = ('free', 'subscription', 'deal')
+
+# Same mapping as getCategorySlug() in reviews.html
+CATEGORY_SLUGS = {
+    'Writing & Content': 'writing',
+    'Design & Images': 'design',
+    'Video & Animation': 'video',
+    'Coding & Development': 'coding',
+    'Productivity & Business': 'productivity',
+    'Voice & Audio': 'voice',
+    'Research & Data': 'research',
+    'Marketing & Social': 'marketing',
+    'Data & Analytics': 'data',
+}
+
+
+@dataclass
+class Tool:
+    """One tool in the catalog. rating is on a 0-5 scale (None if unknown)."""
+    slug: str
+    name: str
+    category: str = ''
+    category_label: str = ''  # as displayed, e.g. '✍️ Writing & Content'
+    category_slug: str = 'other'
+    type: str = ''
+    tag: str = ''
+    rating: Optional[float] = None
+    rating_text: str = ''
+    description: str = ''
+    pros: List[str] = field(default_factory=list)
+    cons: List[str] = field(default_factory=list)
+    best_for: str = ''
+    pricing: str = ''
+    link: str = ''
+    affiliate_link: str = ''
+    deal_status: str = ''
+    review_page: Optional[str] = None
+    listing_order: Optional[int] = None  # position on reviews.html, None if not listed
+    related: Optional[dict] = None
+    aliases: List[str] = field(default_factory=list)  # other slugs seen for this tool
+    sources: List[str] = field(default_factory=list)  # one entry per contributing record
+
+
+class CatalogError(ValueError):
+    """A source could not be parsed."""
+
+
+# --- JS literal parsing (reviews.html) ------------------------------------
+
+_JS_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_JS_TOKEN = re.compile(r'\s*(?://[^\n]*\n\s*)*')
+_JS_NUMBER = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_JS_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+
+
+def _skip(text, pos):
+    return _JS_TOKEN.match(text, pos).end()
+
+
+def _parse_string(text, pos):
+    quote = text[pos]
+    pos += 1
+    parts = []
+    while True:
+        if pos >= len(text):
+            raise CatalogError("Unterminated string in JS literal")
+        ch = text[pos]
+        if ch == quote:
+            return ''.join(parts), pos + 1
+        if ch == '\\':
+            nxt = text[pos + 1]
+            if nxt == 'u':
+                parts.append(chr(int(text[pos + 2:pos + 6], 16)))
+                pos += 6
+                continue
+            parts.append(_JS_ESCAPES.get(nxt, nxt))
+            pos += 2
+            continue
+        parts.append(ch)
+        pos += 1
+
+
+def parse_js_literal(text, pos=0):
+    """
+    Parse a JS object/array literal (unquoted keys, single or double quotes,
+    trailing commas). Returns (value, end_position).
+    """
+    pos = _skip(text, pos)
+    ch = text[pos]
+    if ch in '"\'':
+        return _parse_string(text, pos)
+    if ch == '[':
+        items = []
+        pos = _skip(text, pos + 1)
+        while text[pos] != ']':
+            value, pos = parse_js_literal(text, pos)
+            items.append(value)
+            pos = _skip(text, pos)
+            if text[pos] == ',':
+                pos = _skip(text, pos + 1)
+        return items, pos + 1
+    if ch == '{':
+        obj = {}
+        pos = _skip(text, pos + 1)
+        while text[pos] != '}':
+            if text[pos] in '"\'':
+                key, pos = _parse_string(text, pos)
+            else:
+                m = _JS_IDENT.match(text, pos)
+                if not m:
+                    raise CatalogError(f"Bad object key at offset {pos}")
+                key, pos = m.group(), m.end()
+            pos = _skip(text, pos)
+            if text[pos] != ':':
+                raise CatalogError(f"Expected ':' at offset {pos}")
+            obj[key], pos = parse_js_literal(text, pos + 1)
+            pos = _skip(text, pos)
+            if text[pos] == ',':
+                pos = _skip(text, pos + 1)
+        return obj, pos + 1
+    m = _JS_NUMBER.match(text, pos)
+    if m:
+        number = float(m.group())
+        return (int(number) if number.is_integer() and '.' not in m.group() else number), m.end()
+    m = _JS_IDENT.match(text, pos)
+    if m and m.group() in ('true', 'false', 'null'):
+        return {'true': True, 'false': False, 'null': None}[m.group()], m.end()
+    raise CatalogError(f"Unexpected {ch!r} at offset {pos}")
+
+
+def read_reviews_tools(reviews_file=REVIEWS_FILE):
+    """The `const tools = [...]` array from reviews.html as a list of dicts."""
+    content = Path(reviews_file).read_text(encoding='utf-8')
+    m = re.search(r'const tools\s*=\s*\[', content)
+    if not m:
+        raise CatalogError(f"No `const tools` array in {reviews_file}")
+    tools, _ = parse_js_literal(content, m.end() - 1)
+    return tools
+
+
+# --- Normalisation ---------------------------------------------------------
+
+def review_slug(name):
+    """Slug used for tools/<slug>-review.html (same rule as reviews.html)."""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def normalize_name(name):
+    return re.sub(r'\s+', ' ', str(name).strip().lower())
+
+
+def normalize_rating(value):
+    """
+    Rating on a 0-5 scale from '9.5/10', '4.91', '4.5/5', 8 ... Bare numbers
+    above 5 are read as out of 10. Returns None if unparseable or out of range.
+    """
+    if value is None:
+        return None
+    m = re.match(r'\s*(\d+(?:\.\d+)?)\s*(?:/\s*(\d+(?:\.\d+)?))?', str(value))
+    if not m:
+        return None
+    score = float(m.group(1))
+    scale = float(m.group(2)) if m.group(2) else (10.0 if score > 5 else 5.0)
+    if scale <= 0 or score > scale:
+        return None
+    return round(score / scale * 5, 2)
+
+
+def clean_category(cat):
+    """Category without its emoji prefix: '✍️ Writing & Content' -> 'Writing & Content'."""
+    return re.sub(r'[^\w\s&]', '', cat or '').strip()
+
+
+def category_slug(cat):
+    return CATEGORY_SLUGS.get(clean_category(cat), 'other')
+
+
+# --- Merging ---------------------------------------------------------------
+
+def _fill(tool, **values):
+    """Set fields that are still empty."""
+    for key, value in values.items():
+        if value not in (None, '', []) and getattr(tool, key) in (None, '', []):
+            setattr(tool, key, value)
+
+
+def read_listing(root='.'):
+    """The reviews.html tool listing: reviews_data.json, or the page's inline array."""
+    data_path = Path(root) / REVIEWS_DATA_FILE
+    if data_path.exists():
+        return json.loads(data_path.read_text(encoding='utf-8'))
+    return read_reviews_tools(Path(root) / REVIEWS_FILE)
+
+
+def _from_js_entry(entry, source):
+    tool = Tool(slug=review_slug(entry.get('name', '')), name=entry.get('name', '').strip())
+    _fill(
+        tool,
+        category=clean_category(entry.get('cat')),
+        category_label=entry.get('cat', ''),
+        type=entry.get('type', ''),
+        tag=entry.get('tag', ''),
+        rating_text=str(entry.get('rating', '')),
+        description=entry.get('desc', ''),
+        pros=list(entry.get('pros', [])),
+        cons=list(entry.get('cons', [])),
+        best_for=entry.get('bestFor', ''),
+        pricing=entry.get('pricing', ''),
+        link=entry.get('link', ''),
+    )
+    tool.sources.append(source)
+    return tool
+
+
+def _related_tools_map():
+    # Imported lazily: the module is a script with its own top-level data
+    from add_related_tools_sections import RELATED_TOOLS_MAP
+    return RELATED_TOOLS_MAP
+
+
+def _review_page_for(tool, pages):
+    for slug in [tool.slug] + tool.aliases:
+        for candidate in (f'tools/{slug}-review.html', f'tools/{slug}.html'):
+            if candidate in pages:
+                return candidate
+    return None
+
+
+def _page_tool_name(page):
+    title = page.get('h1') or page.get('title') or ''
+    return re.split(r'\s+Review\b|:|\|', title)[0].strip()
+
+
+def compile_catalog(root='.', excel_file=EXCEL_FILE):
+    """Merge every source into a list of Tool, sorted by slug."""
+    root = Path(root)
+    tools: Dict[str, Tool] = {}
+    by_name: Dict[str, Tool] = {}
+
+    def add_alias(tool, slug):
+        if slug and slug != tool.slug and slug not in tool.aliases:
+            tool.aliases.append(slug)
+
+    def merge(tool, alias=None):
+        existing = tools.get(tool.slug) or by_name.get(normalize_name(tool.name))
+        if existing is None:
+            tools[tool.slug] = existing = tool
+            by_name.setdefault(normalize_name(tool.name), tool)
+        else:
+            _fill(existing, **{k: v for k, v in asdict(tool).items()
+                               if k not in ('slug', 'aliases', 'sources')})
+            existing.sources.extend(tool.sources)
+        add_alias(existing, alias)
+        return existing
+
+    # 1. The reviews.html listing
+    for position, entry in enumerate(read_listing(root)):
+        tool = _from_js_entry(entry, 'reviews.html')
+        tool.listing_order = position
+        merge(tool)
+
+    # 2. new_apps_data.json (its slug is the review page slug)
+    new_apps_path = root / NEW_APPS_FILE
+    if new_apps_path.exists():
+        for entry in json.loads(new_apps_path.read_text(encoding='utf-8')):
+            merge(_from_js_entry(dict(entry, type='deal'), NEW_APPS_FILE), alias=entry.get('slug'))
+
+    # 3. Tracker: affiliate link and status win over page data
+    excel_path = root / excel_file
+    if excel_path.exists():
+        for row in read_tracker(str(excel_path)):
+            if not row.name:
+                continue
+            tool = by_name.get(normalize_name(row.name)) or tools.get(row.slug)
+            if tool is None:
+                continue  # deals not on the site yet
+            add_alias(tool, row.slug)
+            if row.tracking_link:
+                tool.affiliate_link = row.tracking_link
+            if row.status:
+                tool.deal_status = row.status
+            if 'tracker' not in tool.sources:
+                tool.sources.append('tracker')
+
+    # 4. RELATED_TOOLS_MAP
+    for key, related in _related_tools_map().items():
+        tool = tools.get(key) or next((t for t in tools.values() if key in t.aliases), None)
+        if tool is not None:
+            tool.related = json.loads(json.dumps(related))  # tuples -> lists, as in catalog.json
+            tool.sources.append('related_tools_map')
+
+    # 5. Review pages: link each tool to its page; pages without an entry
+    #    become catalog entries of their own
+    pages = {path: page for path, page in build_index(root).items() if path.startswith('tools/')}
+    linked = set()
+    for tool in tools.values():
+        tool.review_page = _review_page_for(tool, pages)
+        if tool.review_page:
+            linked.add(tool.review_page)
+    for path in sorted(pages):
+        slug = Path(path).stem
+        if path in linked or slug.endswith('-review') and f'tools/{slug[:-7]}.html' in linked:
+            continue
+        slug = slug[:-7] if slug.endswith('-review') else slug
+        page = pages[path]
+        if slug in tools or any(slug in t.aliases for t in tools.values()):
+            continue  # e.g. both foo.html and foo-review.html exist
+        name = _page_tool_name(page) or slug
+        existing = by_name.get(normalize_name(name))
+        if existing is not None:
+            add_alias(existing, slug)  # a misspelt copy (kingumo-review.html), see link_graph.py
+            continue
+        tool = Tool(slug=slug, name=name, review_page=path, sources=['page'])
+        tools[slug] = tool
+        by_name.setdefault(normalize_name(name), tool)
+
+    for tool in tools.values():
+        page = pages.get(tool.review_page) if tool.review_page else None
+        if page:
+            _fill(tool, category=clean_category(page.get('category')))
+            if not tool.rating_text and page.get('rating'):
+                tool.rating_text = f"{page['rating']}/{page['rating_scale']}"
+        tool.rating = normalize_rating(tool.rating_text)
+        tool.category_slug = category_slug(tool.category)
+
+    return [tools[slug] for slug in sorted(tools)]
+
+
+# --- Validation ------------------------------------------------------------
+
+def validate_catalog(tools):
+    """Problems as human-readable strings (empty list if the catalog is clean)."""
+    problems = []
+    seen_names = {}
+    for tool in tools:
+        label = f"{tool.slug} ({', '.join(dict.fromkeys(tool.sources))})"
+        if not tool.name:
+            problems.append(f"{label}: missing name")
+        if tool.rating_text and tool.rating is None:
+            problems.append(f"{label}: unparseable rating {tool.rating_text!r}")
+        if tool.type and tool.type not in TOOL_TYPES:
+            problems.append(f"{label}: unknown type {tool.type!r}")
+        for attr in ('link', 'affiliate_link'):
+            value = getattr(tool, attr)
+            if value and not re.match(r'https?://', value):
+                problems.append(f"{label}: {attr} is not a URL: {value!r}")
+        if tool.type == 'deal' and not (tool.affiliate_link or tool.link):
+            problems.append(f"{label}: deal without a link")
+        for source in set(tool.sources):
+            if tool.sources.count(source) > 1:
+                problems.append(f"{tool.slug}: listed {tool.sources.count(source)} times in {source}")
+        if not tool.review_page:
+            problems.append(f"{label}: no review page (reviews.html links to tools/{tool.slug}-review.html)")
+        name = normalize_name(tool.name)
+        if name in seen_names:
+            problems.append(f"{label}: same name as {seen_names[name]}")
+        seen_names.setdefault(name, tool.slug)
+    return problems
+
+
+# --- Build step ------------------------------------------------------------
+
+def artifact(fn):
+    """Mark fn(tools, root) -> {path: content} as a builder of derived files."""
+    fn.is_artifact = True
+    return fn
+
+
+def registered_artifacts():
+    """Artifact builders in this module and every ARTIFACT_MODULES module."""
+    modules = [sys.modules[__name__]] + [importlib.import_module(m) for m in ARTIFACT_MODULES]
+    builders = []
+    for module in modules:
+        builders.extend(obj for obj in vars(module).values()
+                        if callable(obj) and getattr(obj, 'is_artifact', False) and obj not in builders)
+    return builders
+
+
+def catalog_json(tools):
+    return json.dumps(
+        {'version': CATALOG_VERSION, 'tools': [asdict(t) for t in tools]},
+        ensure_ascii=False, indent=1,
+    ) + '\n'
+
+
+@artifact
+def catalog_file(tools, root):
+    return {CATALOG_FILE: catalog_json(tools)}
+
+
+def write_if_changed(path, content):
+    """Write content unless the file already holds it. Returns True if written."""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(content, encoding='utf-8')
+    tmp.replace(path)
+    return True
+
+
+def build(root='.', tools=None):
+    """Emit every registered artifact. Returns [(path, written)]."""
+    tools = compile_catalog(root) if tools is None else tools
+    written = []
+    for fn in registered_artifacts():
+        for path, content in fn(tools, Path(root)).items():
+            written.append((path, write_if_changed(Path(root) / path, content)))
+    return written
+
+
+def load_catalog(root='.'):
+    """Tools from catalog.json, compiling it first if it is missing or outdated."""
+    path = Path(root) / CATALOG_FILE
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') == CATALOG_VERSION:
+            return [Tool(**t) for t in data['tools']]
+    except (OSError, ValueError, TypeError):
+        pass
+    tools = compile_catalog(root)
+    write_if_changed(path, catalog_json(tools))
+    return tools
+
+
+def main():
+    tools = compile_catalog()
+    problems = validate_catalog(tools)
+
+    by_source = {}
+    for tool in tools:
+        for source in tool.sources:
+            by_source[source] = by_source.get(source, 0) + 1
+    print(f"Catalog: {len(tools)} tools")
+    for source, count in sorted(by_source.items()):
+        print(f"  from {source}: {count}")
+    print(f"  with rating: {sum(1 for t in tools if t.rating is not None)}")
+    print(f"  with review page: {sum(1 for t in tools if t.review_page)}")
+
+    if problems:
+        print(f"\n{len(problems)} problem(s):")
+        for problem in problems:
+            print(f"  - {problem}")
+
+    if '--check' in sys.argv[1:]:
+        sys.exit(1 if problems else 0)
+
+    print()
+    results = build(tools=tools)
+    for path, written in results:
+        if written:
+            print(f"[OK] Wrote {path}")
+    print(f"{sum(1 for _, written in results if not written)} artifact(s) unchanged")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,19 +4,15 @@ Script to check AppSumo affiliate links from Excel file.
 Tests each link and reports which ones work and which are broken.
 """
 
-import requests
-import pandas as pd
 from urllib.parse import urlparse
 import sys
 from datetime import datetime
+from link_cache import check_urls_cached
+from xlsx_reader import read_tracker
 
 # Configuration
 EXCEL_FILE = 'appsumo-affiliate-links-tracker.xlsx'
 OUTPUT_FILE = 'broken_links_report.txt'
-TIMEOUT = 10  # seconds
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
 
 def is_valid_url(url):
     """Check if a string is a valid URL."""
@@ -26,9 +22,9 @@ def is_valid_url(url):
     except:
         return False
 
-def check_link(url):
-    """Check if a link is accessible. Returns (status_code, error_message)."""
-    if not url or pd.isna(url):
+def check_link(url, checked):
+    """Look up a link in the batch results. Returns (status_code, error_message)."""
+    if not url:
         return None, "Empty or NaN value"
     
     url = str(url).strip()
@@ -36,71 +32,50 @@ def check_link(url):
     if not is_valid_url(url):
         return None, "Invalid URL format"
     
-    try:
-        response = requests.head(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
-        return response.status_code, None
-    except requests.exceptions.Timeout:
-        return None, "Timeout"
-    except requests.exceptions.ConnectionError:
-        return None, "Connection Error"
-    except requests.exceptions.TooManyRedirects:
-        return None, "Too Many Redirects"
-    except requests.exceptions.RequestException as e:
-        return None, f"Request Error: {str(e)}"
-    except Exception as e:
-        return None, f"Unexpected Error: {str(e)}"
+    result = checked[url]
+    if result['status_code'] is None:
+        return None, result['error']
+    return result['status_code'], None
 
 def main():
     """Main function to read Excel, check links, and generate report."""
     print(f"Reading links from {EXCEL_FILE}...")
     
     try:
-        # Read Excel file
-        df = pd.read_excel(EXCEL_FILE)
-        print(f"Found {len(df)} rows in the Excel file.")
-        
-        # Try to find the column with links
-        # Common column names: 'link', 'url', 'affiliate_link', 'Link', 'URL', etc.
-        link_column = None
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['link', 'url', 'affiliate']):
-                link_column = col
-                break
-        
-        if link_column is None:
-            print("\nAvailable columns:", list(df.columns))
-            print("\nError: Could not find a column with links.")
-            print("Please ensure your Excel file has a column named 'link', 'url', or 'affiliate_link'.")
-            sys.exit(1)
-        
-        print(f"Using column '{link_column}' for links.\n")
+        # Stream the tracker rows (no pandas needed for a few columns)
+        rows = list(read_tracker(EXCEL_FILE))
+        print(f"Found {len(rows)} rows in the Excel file.")
+        print("Using column 'Your Generated Tracking Link' for links.\n")
         
         # Collect results
         working_links = []
         broken_links = []
         invalid_links = []
         
-        total_links = len(df)
+        total_links = len(rows)
         print(f"Checking {total_links} links...\n")
         
-        # Check each link
-        for index, row in df.iterrows():
-            url = row[link_column]
-            status_code, error = check_link(url)
+        # Check every valid link concurrently, then report row by row
+        urls = [row.tracking_link for row in rows if is_valid_url(row.tracking_link)]
+        # Recently checked links come from the local link cache (--fresh rechecks all)
+        checked = check_urls_cached(urls, fresh='--fresh' in sys.argv[1:])
+        
+        for index, row in enumerate(rows):
+            url = row.tracking_link
+            status_code, error = check_link(url, checked)
             
-            # Get additional info if available (like product name, etc.)
-            row_info = {}
-            for col in df.columns:
-                if col != link_column:
-                    row_info[col] = row[col]
+            # Get additional info (product name, slug, status, ...)
+            row_info = {
+                col: value for col, value in row.values.items()
+                if value is not None and str(value).strip() != url
+            }
             
             if status_code is None:
                 # Invalid or error
                 invalid_links.append({
                     'url': url,
                     'error': error,
-                    'row': index + 2,  # +2 because Excel rows start at 1 and header is row 1
+                    'row': row.row,
                     'info': row_info
                 })
                 print(f"[{index + 1}/{total_links}] ❌ {url[:60]}... - {error}")
@@ -108,7 +83,7 @@ def main():
                 working_links.append({
                     'url': url,
                     'status': status_code,
-                    'row': index + 2,
+                    'row': row.row,
                     'info': row_info
                 })
                 print(f"[{index + 1}/{total_links}] ✅ {url[:60]}... - Status: {status_code}")
@@ -116,7 +91,7 @@ def main():
                 broken_links.append({
                     'url': url,
                     'status': status_code,
-                    'row': index + 2,
+                    'row': row.row,
                     'info': row_info
                 })
                 print(f"[{index + 1}/{total_links}] ❌ {url[:60]}... - Status: {status_code}")
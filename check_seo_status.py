@@ -3,55 +3,36 @@
 Check current SEO status of HTML files.
 Reports on canonical tags, structured data, meta tags, etc.
 """
-import re
-from pathlib import Path
 from collections import defaultdict
+from page_index import build_index
 
-def check_file(filepath):
-    """Check SEO elements in a single file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        status = {
-            'file': str(filepath),
-            'has_canonical': bool(re.search(r'<link\s+rel=["\']canonical["\']', content, re.IGNORECASE)),
-            'has_structured_data': bool(re.search(r'<script\s+type=["\']application/ld\+json["\']', content, re.IGNORECASE)),
-            'has_meta_description': bool(re.search(r'<meta\s+name=["\']description["\'][^>]*>', content, re.IGNORECASE)),
-            'has_og_tags': bool(re.search(r'<meta\s+property=["\']og:', content, re.IGNORECASE)),
-            'has_og_image': bool(re.search(r'<meta\s+property=["\']og:image["\']', content, re.IGNORECASE)),
-            'has_title': bool(re.search(r'<title>', content, re.IGNORECASE)),
-            'affiliate_links': len(re.findall(r'https?://appsumo\.8odi\.net', content, re.IGNORECASE)),
-            'affiliate_links_nofollow': len(re.findall(r'https?://appsumo\.8odi\.net[^>]*rel=["\'][^"\']*nofollow', content, re.IGNORECASE)),
-            'has_breadcrumbs': bool(re.search(r'breadcrumb|Breadcrumb', content, re.IGNORECASE)),
-        }
-        
-        return status
-    except Exception as e:
-        return {'file': str(filepath), 'error': str(e)}
+def check_page(page):
+    """Check SEO elements of a single page using its indexed facts."""
+    return {
+        'file': page['path'],
+        'has_canonical': bool(page['canonical']),
+        'has_structured_data': bool(page['json_ld']),
+        'has_meta_description': page['description'] is not None,
+        'has_og_tags': bool(page['og']),
+        'has_og_image': 'og:image' in page['og'],
+        'has_title': bool(page['title']),
+        'affiliate_links': len(page['affiliate_links']),
+        'affiliate_links_nofollow': page['affiliate_links_nofollow'],
+    }
 
 def main():
     """Check SEO status of all HTML files."""
-    root = Path('.')
-    html_files = []
-    
-    # Find all HTML files
-    for html_file in root.rglob('*.html'):
-        # Skip hidden directories and .git
-        if any(part.startswith('.') for part in html_file.parts):
-            continue
-        if '.git' in html_file.parts:
-            continue
-        
-        html_files.append(html_file)
+    # Facts come from the shared page index; only changed pages are re-read
+    index = build_index()
+    html_files = sorted(index)
     
     print(f"Checking {len(html_files)} HTML files...\n")
     
     stats = defaultdict(int)
     issues = []
     
-    for filepath in sorted(html_files):
-        status = check_file(filepath)
+    for path in html_files:
+        status = check_page(index[path])
         
         # Count stats
         if status.get('has_canonical'):
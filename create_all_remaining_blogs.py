@@ -4,17 +4,7 @@
 import os
 from pathlib import Path
 
-# Read the template from an existing blog post
-TEMPLATE_FILE = Path('blog-triplo-ai.html')
-template_content = TEMPLATE_FILE.read_text(encoding='utf-8')
-
-# Extract navigation template (everything before the article content)
-nav_end = template_content.find('<article class="max-w-4xl')
-nav_template = template_content[:nav_end]
-
-# Extract footer template (everything after article content)
-footer_start = template_content.find('<footer class="bg-gray-50')
-footer_template = template_content[footer_start:]
+from templates import render, render_partial
 
 # Blog post data for remaining tools
 BLOG_POSTS = [
@@ -910,16 +900,12 @@ def create_blog_content(post_data):
                 If you're facing this problem, <a href="{post_data['affiliate_link']}" target="_blank" rel="noopener nofollow sponsored" class="text-indigo-600 hover:text-indigo-700 font-semibold underline">try {post_data['tool_name']} with the {post_data['price']} lifetime deal</a>. You get a 60-day money-back guarantee, so there's zero risk. I've been using it daily for months, and I can't imagine working without it.
             </p>
 
-            <div class="bg-gradient-to-r from-{post_data['category_color']}-50 to-{post_data['category_color']}-100 p-8 rounded-xl my-12">
-                <h3 class="text-2xl font-bold text-gray-900 mb-4">Ready to Solve This Problem?</h3>
-                <p class="text-lg text-gray-700 mb-6">
-                    Get {post_data['tool_name']} for {post_data['price']} lifetime. {post_data['solution_intro'][:100]}... 60-day money-back guarantee.
-                </p>
-                <a href="{post_data['affiliate_link']}" target="_blank" rel="noopener nofollow sponsored" class="inline-block bg-gradient-to-r from-{post_data['category_color']}-600 to-{post_data['category_color']}-700 hover:from-{post_data['category_color']}-700 hover:to-{post_data['category_color']}-800 text-white px-8 py-4 rounded-lg font-semibold text-lg transition-all hover:shadow-lg">
-                    Get {post_data['tool_name']} Lifetime Deal →
-                </a>
-                <p class="text-sm text-gray-600 mt-4">✅ 60-day guarantee • We may earn a commission</p>
-            </div>
+            {render_partial('cta_box',
+                            color=post_data['category_color'],
+                            cta_heading='Ready to Solve This Problem?',
+                            cta_text=f"Get {post_data['tool_name']} for {post_data['price']} lifetime. {post_data['solution_intro'][:100]}... 60-day money-back guarantee.",
+                            cta_link=post_data['affiliate_link'],
+                            cta_label=f"Get {post_data['tool_name']} Lifetime Deal →")}
 
             <h2 class="text-3xl font-bold text-gray-900 mt-12 mb-6">Frequently Asked Questions</h2>
 
@@ -954,40 +940,20 @@ def create_blog_post(post_data):
     # Generate content
     content = create_blog_content(post_data)
     
-    # Build the full HTML
-    html = nav_template.replace('blog-triplo-ai.html', post_data['filename'])
-    html = html.replace('Triplo AI', post_data['tool_name'])
-    html = html.replace('How Triplo AI Solved My Context-Switching Problem | artificial.one', post_data['og_title'])
-    html = html.replace('As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck.', post_data['og_description'])
-    html = html.replace('triplo-ai', post_data['image_name'])
-    html = html.replace('PRODUCTIVITY', post_data['category'])
-    html = html.replace('text-purple-600', f'text-{post_data["category_color"]}-600')
-    html = html.replace('How Triplo AI Solved My Context-Switching Problem', post_data['headline'])
-    html = html.replace('As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck.', post_data['subtitle'])
-    html = html.replace('18 min read', f'{post_data["read_time"]} min read')
-    
-    # Add article content
-    html += f'    <article class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">\n'
-    html += f'        <header class="mb-8">\n'
-    html += f'            <div class="text-{post_data["category_color"]}-600 font-semibold mb-2">{post_data["category"]}</div>\n'
-    html += f'            <h1 class="text-4xl md:text-5xl font-bold text-gray-900 mb-4">{post_data["headline"]}</h1>\n'
-    html += f'            <p class="text-xl text-gray-600">{post_data["subtitle"]}</p>\n'
-    html += f'            <p class="text-sm text-gray-500 mt-4">Published: January 2026 • {post_data["read_time"]} min read</p>\n'
-    html += f'        </header>\n'
-    html += f'\n'
-    html += f'        <div class="prose prose-lg max-w-none">\n'
-    html += content
-    html += f'\n        </div>\n'
-    html += f'    </article>\n'
-    html += f'\n'
-    html += footer_template
-    
-    # Update meta tags
-    html = html.replace('"headline": "How Triplo AI Solved My Context-Switching Problem | artificial.one"', f'"headline": "{post_data["og_title"]}"')
-    html = html.replace('"description": "As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck."', f'"description": "{post_data["og_description"]}"')
-    html = html.replace('"name": "Triplo AI"', f'"name": "{post_data["tool_name"]}"')
-    html = html.replace('"item": "https://artificial.one/blog-triplo-ai.html"', f'"item": "https://artificial.one/{post_data["filename"]}"')
-    html = html.replace('"url": "https://artificial.one/blog-triplo-ai.html"', f'"url": "https://artificial.one/{post_data["filename"]}"')
+    html = render('blog_post',
+                  root='',
+                  filename=post_data['filename'],
+                  tool_name=post_data['tool_name'],
+                  page_title=post_data['og_title'],
+                  description=post_data['og_description'],
+                  image_name=post_data['image_name'],
+                  category=post_data['category'],
+                  category_color=post_data['category_color'],
+                  headline=post_data['headline'],
+                  subtitle=post_data['subtitle'],
+                  published='January 2026',
+                  read_time=post_data['read_time'],
+                  body=content)
     
     # Write file
     filepath = Path(post_data['filename'])
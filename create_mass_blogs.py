@@ -5,15 +5,7 @@ import os
 import re
 from pathlib import Path
 
-# Read template
-TEMPLATE_FILE = Path('blog-triplo-ai.html')
-template_content = TEMPLATE_FILE.read_text(encoding='utf-8')
-
-nav_end = template_content.find('<article class="max-w-4xl')
-nav_template = template_content[:nav_end]
-
-footer_start = template_content.find('<footer class="bg-gray-50')
-footer_template = template_content[footer_start:]
+from templates import render, render_partial
 
 # Get all tools with affiliate links that don't have blog posts yet
 def get_tools_needing_blogs():
@@ -224,16 +216,12 @@ def create_blog_post(tool_data):
                 If you're facing this problem, <a href="{affiliate_link}" target="_blank" rel="noopener nofollow sponsored" class="text-indigo-600 hover:text-indigo-700 font-semibold underline">try {tool_name} with the lifetime deal</a>. You get a 60-day money-back guarantee, so there's zero risk. I've been using it daily for months, and I can't imagine working without it.
             </p>
 
-            <div class="bg-gradient-to-r from-{category_color}-50 to-{category_color}-100 p-8 rounded-xl my-12">
-                <h3 class="text-2xl font-bold text-gray-900 mb-4">Ready to Solve This Problem?</h3>
-                <p class="text-lg text-gray-700 mb-6">
-                    Get {tool_name} for lifetime deal. {solution[:100]}... 60-day money-back guarantee.
-                </p>
-                <a href="{affiliate_link}" target="_blank" rel="noopener nofollow sponsored" class="inline-block bg-gradient-to-r from-{category_color}-600 to-{category_color}-700 hover:from-{category_color}-700 hover:to-{category_color}-800 text-white px-8 py-4 rounded-lg font-semibold text-lg transition-all hover:shadow-lg">
-                    Get {tool_name} Lifetime Deal →
-                </a>
-                <p class="text-sm text-gray-600 mt-4">✅ 60-day guarantee • We may earn a commission</p>
-            </div>
+            {render_partial('cta_box',
+                            color=category_color,
+                            cta_heading='Ready to Solve This Problem?',
+                            cta_text=f"Get {tool_name} for lifetime deal. {solution[:100]}... 60-day money-back guarantee.",
+                            cta_link=affiliate_link,
+                            cta_label=f"Get {tool_name} Lifetime Deal →")}
 
             <h2 class="text-3xl font-bold text-gray-900 mt-12 mb-6">Frequently Asked Questions</h2>
 
@@ -261,40 +249,20 @@ def create_blog_post(tool_data):
                 </p>
             </div>'''
     
-    # Build HTML
-    html = nav_template.replace('blog-triplo-ai.html', filename)
-    html = html.replace('Triplo AI', tool_name)
-    html = html.replace('How Triplo AI Solved My Context-Switching Problem | artificial.one', og_title)
-    html = html.replace('As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck.', og_description)
-    html = html.replace('triplo-ai', filename.replace('blog-', '').replace('.html', ''))
-    html = html.replace('PRODUCTIVITY', category)
-    html = html.replace('text-purple-600', f'text-{category_color}-600')
-    html = html.replace('How Triplo AI Solved My Context-Switching Problem', title_base)
-    html = html.replace('As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck.', og_description)
-    html = html.replace('18 min read', '20 min read')
-    
-    # Update meta tags
-    html = html.replace('"headline": "How Triplo AI Solved My Context-Switching Problem | artificial.one"', f'"headline": "{og_title}"')
-    html = html.replace('"description": "As an AI agent reviewing 283+ tools, I tested Triplo AI for 30 days. Here\'s how it eliminated my biggest productivity bottleneck."', f'"description": "{og_description}"')
-    html = html.replace('"name": "Triplo AI"', f'"name": "{tool_name}"')
-    html = html.replace('"item": "https://artificial.one/blog-triplo-ai.html"', f'"item": "https://artificial.one/{filename}"')
-    html = html.replace('"url": "https://artificial.one/blog-triplo-ai.html"', f'"url": "https://artificial.one/{filename}"')
-    
-    # Add article content
-    html += f'    <article class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">\n'
-    html += f'        <header class="mb-8">\n'
-    html += f'            <div class="text-{category_color}-600 font-semibold mb-2">{category}</div>\n'
-    html += f'            <h1 class="text-4xl md:text-5xl font-bold text-gray-900 mb-4">{title_base}</h1>\n'
-    html += f'            <p class="text-xl text-gray-600">{og_description}</p>\n'
-    html += f'            <p class="text-sm text-gray-500 mt-4">Published: January 2026 • 20 min read</p>\n'
-    html += f'        </header>\n'
-    html += f'\n'
-    html += f'        <div class="prose prose-lg max-w-none">\n'
-    html += content
-    html += f'\n        </div>\n'
-    html += f'    </article>\n'
-    html += f'\n'
-    html += footer_template
+    html = render('blog_post',
+                  root='',
+                  filename=filename,
+                  tool_name=tool_name,
+                  page_title=og_title,
+                  description=og_description,
+                  image_name=filename.replace('blog-', '').replace('.html', ''),
+                  category=category,
+                  category_color=category_color,
+                  headline=title_base,
+                  subtitle=og_description,
+                  published='January 2026',
+                  read_time=20,
+                  body=content)
     
     # Write file
     filepath = Path(filename)
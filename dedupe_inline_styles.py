@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Move the <style> blocks the review generators copy into every tools/ page
+into shared, content-hashed stylesheets.
+
+The deal review layout (apply_new_apps_to_site.py), the lifetime review
+fallback (optimize_all_files.py) and the sticky CTA CSS
+(apply_deal_review_improvements.py) put the same few kilobytes of CSS inline
+on hundreds of pages, so none of it is cached between page views. This pass
+fingerprints each block with its colours blanked out. Blocks with the same
+fingerprint on at least MIN_PAGES pages are written once to
+css/shared.<hash>.css. Colours that differ between those pages (the product's
+accent colours) become CSS variables, set inline by the page:
+
+    <style>:root{--c1a2b3c-1:#10b981;--c1a2b3c-2:#059669}</style><link rel="stylesheet" href="../css/shared.<hash>.css">
+
+The link takes the place of the block, so the cascade order is unchanged.
+The pass can always put the original CSS back together from the sheet and the
+page's variables. Re-running it therefore regroups every page from scratch:
+newly generated pages join the existing sheets, and a sheet whose content
+changes gets a new hash on all of its pages. Sheets no page uses any more are
+deleted.
+
+The review layouts (templates/layouts/deal_review.tmpl, lifetime_review.tmpl)
+emit their blocks through shared_style(), so newly generated pages get the
+link straight away.
+
+Usage:
+    python dedupe_inline_styles.py           # extract and rewrite tools/*.html
+    python dedupe_inline_styles.py --check   # report only, write nothing
+"""
+import re
+import sys
+import time
+import hashlib
+from pathlib import Path
+
+from edit_buffer import EditBuffer
+from templates import root_prefix
+
+PAGES_GLOB = 'tools/*.html'
+CSS_DIR = 'css'
+SHEET_PREFIX = 'shared.'
+MIN_PAGES = 3  # a block on fewer pages is cheaper inline than as an extra request
+
+# An extracted block (optional variables + link) or an inline one
+BLOCK_RE = re.compile(
+    r'(?:<style>:root\{(?P<vars>[^{}]*)\}</style>)?'
+    r'<link rel="stylesheet" href="(?:\.\./)*' + CSS_DIR + '/' + re.escape(SHEET_PREFIX) + r'(?P<hash>[0-9a-f]{10})\.css">'
+    r'|<style>(?P<css>.*?)</style>',
+    re.DOTALL,
+)
+DECLARATIONS_RE = re.compile(r'\{([^{}]*)\}')
+COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,8}(?![\w-])')
+VAR_RE = re.compile(r'var\(--(c[0-9a-f]{6}-\d+)\)')
+ROOT_VAR_RE = re.compile(r'--(c[0-9a-f]{6}-\d+):([^;]+)')
+
+
+def normalize(css):
+    """Block text with indentation and blank lines dropped, so layout changes do not split groups."""
+    return '\n'.join(line.strip() for line in css.strip().splitlines() if line.strip())
+
+
+def colors(css):
+    """[(start, end, value)] for hex colours inside declarations (not #id selectors)."""
+    found = []
+    for block in DECLARATIONS_RE.finditer(css):
+        offset = block.start(1)
+        found.extend((offset + m.start(), offset + m.end(), m.group(0)) for m in COLOR_RE.finditer(block.group(1)))
+    return found
+
+
+def fingerprint(css, spans):
+    """Short id of the block with its colours blanked out."""
+    parts, pos = [], 0
+    for start, end, _ in spans:
+        parts.append(css[pos:start])
+        pos = end
+    parts.append(css[pos:])
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()[:6]
+
+
+def read_sheets(root):
+    return {
+        path.name[len(SHEET_PREFIX):-len('.css')]: path.read_text(encoding='utf-8')
+        for path in (Path(root) / CSS_DIR).glob(f'{SHEET_PREFIX}*.css')
+    }
+
+
+def match_sheet(sheet, css):
+    """
+    {variable: colour} if css is the sheet with its variables filled in (in
+    order of first use), else None.
+    """
+    pattern, groups, pos = [], {}, 0
+    for m in VAR_RE.finditer(sheet):
+        pattern.append(re.escape(sheet[pos:m.start()]))
+        name = m.group(1)
+        if name in groups:
+            pattern.append(f'(?P={groups[name]})')
+        else:
+            groups[name] = f'v{len(groups)}'
+            pattern.append(f'(?P<{groups[name]}>{COLOR_RE.pattern})')
+        pos = m.end()
+    pattern.append(re.escape(sheet[pos:]))
+    m = re.fullmatch(''.join(pattern), css)
+    if not m:
+        return None
+    return {name: m.group(group) for name, group in groups.items()}
+
+
+def shared_style(css, prefix, root='.', samples=()):
+    """
+    One style block as dedupe_styles() would leave it: the :root variables and
+    a link to the shared sheet that holds it. samples are other renderings of
+    the same block (a layout's CSS with other colours); if no sheet holds the
+    block yet, one is written from the block and its samples, with the
+    colours that differ between them as variables. Without samples such a
+    block stays inline until the next dedupe run.
+    """
+    css = normalize(css)
+    sheets = read_sheets(root)
+    for digest, sheet in sorted(sheets.items()):
+        values = match_sheet(normalize(sheet), css)
+        if values is not None:
+            declarations = ';'.join(f'--{name}:{value}' for name, value in values.items())
+            break
+    else:
+        group = [(None, block, colors(block)) for block in [css] + [normalize(sample) for sample in samples]]
+        sids = {fingerprint(block, spans) for _, block, spans in group}
+        if len(group) < 2 or len(sids) > 1:
+            return f'<style>\n{css}\n</style>'
+        text, declarations = build_sheet(sids.pop(), group)
+        declarations = declarations[0]
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]
+        sheet = Path(root) / CSS_DIR / f'{SHEET_PREFIX}{digest}.css'
+        if not sheet.exists():
+            sheet.parent.mkdir(exist_ok=True)
+            sheet.write_text(text, encoding='utf-8')
+    variables = f'<style>:root{{{declarations}}}</style>' if declarations else ''
+    return f'{variables}<link rel="stylesheet" href="{prefix}{CSS_DIR}/{SHEET_PREFIX}{digest}.css">'
+
+
+def page_blocks(content, sheets):
+    """
+    [(start, end, normalized css, inline)] for every style block on the page;
+    extracted ones are reassembled from their sheet and variables. Extracted
+    blocks whose sheet is missing are skipped and left as they are.
+    """
+    blocks = []
+    for m in BLOCK_RE.finditer(content):
+        if m.group('css') is not None:
+            blocks.append((m.start(), m.end(), normalize(m.group('css')), True))
+            continue
+        sheet = sheets.get(m.group('hash'))
+        if sheet is None:
+            print(f"  Missing sheet {SHEET_PREFIX}{m.group('hash')}.css; link left alone")
+            continue
+        values = dict(ROOT_VAR_RE.findall(m.group('vars') or ''))
+        blocks.append((m.start(), m.end(), normalize(VAR_RE.sub(lambda v: values[v.group(1)], sheet)), False))
+    return blocks
+
+
+def build_sheet(sid, group):
+    """
+    (sheet text, [variable declarations per block]) for blocks sharing a
+    fingerprint. Colour positions that hold the same values on every page stay
+    literal; positions that vary together share one variable.
+    """
+    css, spans = group[0][1], group[0][2]
+    vectors = list(zip(*[[value for _, _, value in block_spans] for _, _, block_spans in group])) if spans else []
+    numbers = {}
+    names = []
+    for vector in vectors:
+        if len(set(vector)) == 1:
+            names.append(None)
+        else:
+            names.append(f'c{sid}-{numbers.setdefault(vector, len(numbers) + 1)}')
+
+    parts, pos = [], 0
+    for (start, end, value), name in zip(spans, names):
+        parts.append(css[pos:start])
+        parts.append(f'var(--{name})' if name else value)
+        pos = end
+    parts.append(css[pos:])
+
+    declarations = []
+    for _, _, block_spans in group:
+        seen = {}
+        for (_, _, value), name in zip(block_spans, names):
+            if name:
+                seen.setdefault(name, value)
+        declarations.append(';'.join(f'--{name}:{value}' for name, value in seen.items()))
+    return ''.join(parts) + '\n', declarations
+
+
+def dedupe_styles(root='.', check=False):
+    """
+    Returns ({sheet name: (bytes, pages, variable count)}, inline bytes before,
+    inline bytes after, [pages rewritten]).
+    """
+    root = Path(root)
+    sheets = read_sheets(root)
+
+    pages = {}
+    groups = {}  # fingerprint -> [(page, css, colour spans)]
+    refs = {}    # (page, block number) -> (fingerprint, index in group)
+    for path in sorted(root.glob(PAGES_GLOB)):
+        content = path.read_text(encoding='utf-8', errors='ignore')
+        blocks = page_blocks(content, sheets)
+        pages[path] = (content, blocks)
+        for number, (_, _, css, _) in enumerate(blocks):
+            spans = colors(css)
+            sid = fingerprint(css, spans)
+            group = groups.setdefault(sid, [])
+            refs[(path, number)] = (sid, len(group))
+            group.append((path, css, spans))
+
+    built = {}  # fingerprint -> (sheet name, sheet text, [declarations per block])
+    report = {}
+    for sid, group in groups.items():
+        if len({page for page, _, _ in group}) < MIN_PAGES:
+            continue
+        text, declarations = build_sheet(sid, group)
+        name = f'{SHEET_PREFIX}{hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]}.css'
+        built[sid] = (name, text, declarations)
+        report[name] = (len(text.encode('utf-8')), len(group), len(set(VAR_RE.findall(text))))
+
+    before = after = 0
+    written = []
+    for path, (content, blocks) in pages.items():
+        prefix = root_prefix(path, root)
+        edits = EditBuffer(content)
+        for number, (start, end, css, inline) in enumerate(blocks):
+            sid, position = refs[(path, number)]
+            if sid in built:
+                name, _, declarations = built[sid]
+                variables = f'<style>:root{{{declarations[position]}}}</style>' if declarations[position] else ''
+                new = f'{variables}<link rel="stylesheet" href="{prefix}{CSS_DIR}/{name}">'
+            elif inline:
+                new = content[start:end]
+            else:
+                new = f'<style>\n{css}\n</style>'  # its group shrank below MIN_PAGES
+            before += len(content[start:end].encode('utf-8'))
+            after += len(new.encode('utf-8'))
+            if new != content[start:end]:
+                edits.replace(start, end, new)
+        if edits:
+            written.append(path.relative_to(root).as_posix())
+            if not check:
+                path.write_text(edits.apply(), encoding='utf-8')
+
+    if not check:
+        (root / CSS_DIR).mkdir(exist_ok=True)
+        for name, text, _ in built.values():
+            sheet = root / CSS_DIR / name
+            if not sheet.exists():
+                sheet.write_text(text, encoding='utf-8')
+        keep = {name for name, _, _ in built.values()}
+        for old in (root / CSS_DIR).glob(f'{SHEET_PREFIX}*.css'):
+            if old.name not in keep:
+                old.unlink()
+    return report, before, after, written
+
+
+def main():
+    check = '--check' in sys.argv[1:]
+    started = time.perf_counter()
+    report, before, after, written = dedupe_styles('.', check=check)
+    elapsed = time.perf_counter() - started
+
+    print(f"Shared stylesheets: {len(report)}")
+    for name, (size, count, variables) in sorted(report.items(), key=lambda kv: -kv[1][1]):
+        print(f"  {CSS_DIR}/{name}: {size:,} bytes, {count} page(s), {variables} colour variable(s)")
+    print(f"Inline CSS on {PAGES_GLOB}: {before:,} -> {after:,} bytes "
+          f"(variables and links count as inline)")
+    print(f"Pages {'to rewrite' if check else 'rewritten'}: {len(written)}")
+    print(f"Done in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Offset-based edit buffer for in-place page rewrites.
+
+Fixer scripts used to splice each change in as it was found
+(`content = content[:start] + new + content[end:]`), which copies the whole
+page per edit and moves every later offset, so matches found up front go stale
+after the first splice. Instead, a transform registers its edits against the
+original text and they are applied together:
+
+    buffer = EditBuffer(content)
+    for m in LINK_RE.finditer(content):
+        buffer.replace(m.start(), m.end(), new_link, product=name)
+    buffer.insert(body_close, script)
+    content = buffer.apply()      # one linear pass over the original
+    for change in buffer.changes: # {'start', 'end', 'old', 'new', **info}
+        ...
+
+All offsets refer to the original text. Overlapping edits are rejected with
+EditConflict when they are registered; insertions at the same position are
+applied in the order they were added.
+"""
+from bisect import bisect_left
+
+
+class EditConflict(ValueError):
+    pass
+
+
+class EditBuffer:
+    """Edits against an immutable text, applied in one pass."""
+
+    def __init__(self, text):
+        self.text = text
+        self._keys = []   # (start, end, seq), kept sorted
+        self._edits = {}  # seq -> (new, info)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __bool__(self):
+        return bool(self._keys)
+
+    def replace(self, start, end, new, **info):
+        """Replace text[start:end] with new. info is kept in the change log."""
+        if not 0 <= start <= end <= len(self.text):
+            raise EditConflict(f"edit {start}:{end} is outside the text (length {len(self.text)})")
+        key = (start, end, len(self._edits))
+        i = bisect_left(self._keys, key)
+        # An edit may touch its neighbours but not cover any of their text,
+        # and nothing may be inserted strictly inside a replaced range
+        if i and self._keys[i - 1][1] > start:
+            raise EditConflict(f"{self._describe(key)} overlaps {self._describe(self._keys[i - 1])}")
+        if i < len(self._keys) and self._keys[i][0] < end:
+            raise EditConflict(f"{self._describe(key)} overlaps {self._describe(self._keys[i])}")
+        self._keys.insert(i, key)
+        self._edits[key[2]] = (new, info)
+
+    def insert(self, pos, new, **info):
+        """Insert new before text[pos]."""
+        self.replace(pos, pos, new, **info)
+
+    def delete(self, start, end, **info):
+        """Remove text[start:end]."""
+        self.replace(start, end, '', **info)
+
+    def _describe(self, key):
+        start, end, _ = key
+        return f"insertion at {start}" if start == end else f"edit {start}:{end}"
+
+    @property
+    def changes(self):
+        """Change log in text order: [{'start', 'end', 'old', 'new', **info}]."""
+        log = []
+        for start, end, seq in self._keys:
+            new, info = self._edits[seq]
+            log.append({'start': start, 'end': end, 'old': self.text[start:end], 'new': new, **info})
+        return log
+
+    def apply(self):
+        """The text with every edit applied (the original if there are none)."""
+        if not self._keys:
+            return self.text
+        pieces = []
+        copied_to = 0
+        for start, end, seq in self._keys:
+            pieces.append(self.text[copied_to:start])
+            pieces.append(self._edits[seq][0])
+            copied_to = end
+        pieces.append(self.text[copied_to:])
+        return ''.join(pieces)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Precomputed facet counts for the reviews.html and blog.html filters.
+
+A facet index maps every combination of facet values, with '*' standing for
+"any", to the number of items in it:
+
+    {"dims": ["type", "cat", "price"],
+     "n": {"deal|writing|lifetime": 12, "deal|writing|*": 15, "*|*|*": 357, ...}}
+
+Every filter button count on a page is then a single lookup
+(facetCount(facets, {type: 'deal', cat: 'writing'})) instead of a pass over
+the items in the browser or a regex pass by a fixer script. The index is
+built once per `python catalog.py`:
+- reviews.html: type x category x price band over the catalog listing,
+  injected between /* facets */ ... /* /facets */ (prerender_reviews.py)
+- blog index: category over blog_posts.json, rendered into the filter
+  links (blog_index.py)
+"""
+import re
+import json
+from itertools import product
+
+FACETS_START = '/* facets */'
+FACETS_END = '/* /facets */'
+ANY = '*'
+
+# Entry price bands, in filter-button order
+PRICE_BANDS = ('free', 'under-20', '20-50', '50-plus', 'lifetime', 'custom')
+
+MONTHLY_PRICE = re.compile(r'\$(\d+(?:\.\d+)?)\s*/\s*(?:user\s*/\s*)?(mo|month|year|yr)\b')
+
+
+def price_band(pricing):
+    """
+    Band of a tool's entry price (the first option in "Free | $20/mo"):
+    'Free | $20/mo' -> 'free', '$29/mo' -> '20-50', '$69 lifetime' -> 'lifetime',
+    'Contact sales' -> 'custom'.
+    """
+    entry = (pricing or '').split('|')[0].strip().lower()
+    if entry.startswith('free'):
+        return 'free'
+    if 'lifetime' in entry or 'one-time' in entry:
+        return 'lifetime'
+    match = MONTHLY_PRICE.search(entry)
+    if not match:
+        return 'custom'
+    monthly = float(match.group(1))
+    if match.group(2) in ('year', 'yr'):
+        monthly /= 12
+    if monthly < 20:
+        return 'under-20'
+    return '20-50' if monthly <= 50 else '50-plus'
+
+
+def facet_index(items, dims):
+    """
+    Count items (dicts) over every combination of dims, including the '*'
+    rollups, so no count has to be summed on the page.
+    """
+    counts = {}
+    for item in items:
+        values = [(item[dim], ANY) for dim in dims]
+        for key in product(*values):
+            key = '|'.join(key)
+            counts[key] = counts.get(key, 0) + 1
+    return {'dims': list(dims), 'n': dict(sorted(counts.items()))}
+
+
+def facets_json(index):
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+
+
+def replace_facets(content, index, label):
+    pattern = re.compile(re.escape(FACETS_START) + r'.*?' + re.escape(FACETS_END), re.DOTALL)
+    if not pattern.search(content):
+        raise ValueError(f"{label}: missing facet markers ({FACETS_START} ... {FACETS_END})")
+    return pattern.sub(lambda m: FACETS_START + facets_json(index) + FACETS_END, content, count=1)
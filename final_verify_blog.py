@@ -1,34 +1,56 @@
 #!/usr/bin/env python3
-"""Final verification of blog.html"""
+"""Final verification of the generated blog index (blog.html and blog/)"""
 
 import re
+import json
 from pathlib import Path
 
-content = Path('blog.html').read_text(encoding='utf-8')
-
-# Count properly
-article_opens = len(re.findall(r'<article[^>]*class="article-card', content))
-article_closes = content.count('</article>')
-
-print(f"Opening article tags: {article_opens}")
-print(f"Closing article tags: {article_closes}")
-
-if article_opens == article_closes:
-    print("[SUCCESS] All articles properly closed!")
-else:
-    print(f"[WARNING] Mismatch: {article_opens - article_closes} difference")
-
-# Check data-category
-data_cat = content.count('data-category=')
-print(f"\nArticles with data-category: {data_cat}")
-
-# Check filter buttons
-filter_buttons = content.count('filterByCategory')
-print(f"Filter buttons: {filter_buttons}")
-
-# Check for corruption (articles without line breaks)
-no_breaks = len(re.findall(r'</article>\s*<article', content))
-if no_breaks == 0:
-    print("\n[SUCCESS] No corruption - all articles have proper line breaks")
+from blog_index import BLOG_FILE, FEED_DIR, INDEX_END, INDEX_START, PAGES_DIR, load_posts
+
+root = Path('.')
+posts = load_posts(root)
+problems = 0
+
+listing_pages = [root / BLOG_FILE] + sorted((root / PAGES_DIR).glob('*.html'))
+print(f"Posts in blog_posts.json: {len(posts)}")
+print(f"Listing pages: {len(listing_pages)}")
+
+for page in listing_pages:
+    content = page.read_text(encoding='utf-8')
+    if INDEX_START not in content or INDEX_END not in content:
+        print(f"[WARNING] {page}: missing blog index markers")
+        problems += 1
+        continue
+    article_opens = len(re.findall(r'<article[^>]*class="article-card', content))
+    article_closes = content.count('</article>')
+    if article_opens != article_closes:
+        print(f"[WARNING] {page}: {article_opens} opening vs {article_closes} closing article tags")
+        problems += 1
+    missing = content.count('class="article-card') - content.count('data-category=')
+    if missing > 0:
+        print(f"[WARNING] {page}: {missing} article(s) without data-category")
+        problems += 1
+
+# Every listed post must exist, and be listed once
+hrefs = [post['href'] for post in posts]
+for href in sorted(set(hrefs)):
+    if not (root / href).exists():
+        print(f"[WARNING] Listed post does not exist: {href}")
+        problems += 1
+    if hrefs.count(href) > 1:
+        print(f"[WARNING] Listed {hrefs.count(href)} times: {href}")
+        problems += 1
+
+# The "all" feed must page through every post exactly once
+feed_items = []
+for feed in sorted((root / FEED_DIR).glob('all-*.json')):
+    feed_items.extend(item['href'] for item in json.loads(feed.read_text(encoding='utf-8'))['items'])
+if sorted(feed_items) != sorted(hrefs):
+    print(f"[WARNING] Feed lists {len(feed_items)} posts, blog_posts.json has {len(hrefs)}: "
+          f"run python blog_index.py")
+    problems += 1
+
+if problems:
+    print(f"\n[WARNING] {problems} problem(s) found")
 else:
-    print(f"\n[WARNING] Found {no_breaks} articles without line breaks")
+    print("\n[SUCCESS] Blog index is consistent")
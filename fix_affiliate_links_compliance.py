@@ -4,9 +4,14 @@ Fix affiliate link compliance issues:
 1. Remove duplicate rel="nofollow sponsored" attributes
 2. Ensure all AppSumo links have rel="nofollow sponsored"
 3. Normalize rel attribute format
+Pass --incremental to skip files unchanged since the last run (see incremental.py).
 """
 import re
 from pathlib import Path
+from incremental import is_incremental, load_manifest, is_unchanged, record, save_manifest
+
+# Bump when the transform's output changes so --incremental reprocesses every file
+TRANSFORM_VERSION = 1
 
 def normalize_rel_attribute(rel_value):
     """Normalize and clean rel attribute value."""
@@ -121,11 +126,19 @@ def main():
     print()
     
     updated_count = 0
+    manifest = load_manifest('fix_affiliate_links_compliance', TRANSFORM_VERSION) if is_incremental() else None
     for filepath in sorted(html_files):
+        if manifest is not None and is_unchanged(manifest, filepath):
+            continue
         if process_file(filepath):
             updated_count += 1
             print(f"[OK] Fixed affiliate links in {filepath}")
+        if manifest is not None:
+            record(manifest, filepath)
     
+    if manifest is not None:
+        save_manifest(manifest)
+        print(f"Skipped {manifest['skipped']} unchanged files (--incremental)")
     print(f"\n[SUCCESS] Completed! Fixed {updated_count} files.")
     print("\nNext steps:")
     print("1. Manually verify a few affiliate links")
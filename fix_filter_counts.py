@@ -1,43 +1,20 @@
 #!/usr/bin/env python3
-"""Fix filter counts - ensure they match actual filterable articles"""
+"""Fix filter counts - rebuild the blog index so its category counts match the posts.
 
-import re
-from pathlib import Path
-from collections import Counter
-
-content = Path('blog.html').read_text(encoding='utf-8')
-
-# Get all actual data-category values from articles
-category_pattern = r'<article[^>]*class="article-card[^>]*data-category="([^"]+)"[^>]*>'
-categories = re.findall(category_pattern, content)
-category_counts = Counter(categories)
-
-print("Actual category counts:")
-for cat, count in sorted(category_counts.items()):
-    print(f"  {cat}: {count}")
+The counts on the filter links are rendered from blog_posts.json by
+blog_index.py, so they cannot drift from the listed articles.
+"""
 
-# The JavaScript should be counting these correctly, but let's verify the filter logic
-# Check if there are any articles that might not be getting counted
-
-# Read the JavaScript section
-js_start = content.find('<script>', content.find('let currentCategoryFilter'))
-js_end = content.find('</script>', js_start)
-js_code = content[js_start:js_end]
-
-print("\n\nChecking JavaScript filter logic...")
-print("Current updateCounts function should count all articles with data-category")
-
-# The issue might be that the count is correct, but the filter is not working
-# Let's verify the filter function matches correctly
+from pathlib import Path
 
-# Check if all articles are within the grid container
-grid_start = content.find('<div class="grid md:grid-cols-2')
-grid_end = content.find('</div>', content.rfind('</article>'))
-grid_content = content[grid_start:grid_end]
+from blog_index import discover_posts, load_posts, main
+from facet_index import ANY, facet_index
 
-articles_in_grid = len(re.findall(r'<article[^>]*class="article-card', grid_content))
-print(f"\nArticles in grid container: {articles_in_grid}")
-print(f"Total articles: {len(categories)}")
+posts, _ = discover_posts(Path('.'), load_posts(Path('.')))
+counts = facet_index(posts, ['category'])['n']
 
-if articles_in_grid != len(categories):
-    print("WARNING: Some articles might be outside the grid!")
+print("Category counts:")
+for key, count in counts.items():
+    print(f"  {'all' if key == ANY else key}: {count}")
+print()
+main()
@@ -4,6 +4,7 @@ Fix OG image URLs to point to correct tool-specific images instead of default.
 """
 import re
 from pathlib import Path
+from parallel_runner import run_parallel, jobs_from_argv, report_failures
 
 def get_correct_og_image_url(filepath):
     """Get the correct OG image URL for a file."""
@@ -58,20 +59,16 @@ def fix_og_image_urls(content, filepath):
 
 def process_file(filepath):
     """Process a single HTML file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        updated_content = fix_og_image_urls(content, filepath)
-        
-        if updated_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    
+    updated_content = fix_og_image_urls(content, filepath)
+    
+    if updated_content != content:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(updated_content)
+        return True
+    return False
 
 def main():
     """Fix OG image URLs in all HTML files."""
@@ -89,11 +86,13 @@ def main():
     print("Fixing OG image URLs...\n")
     
     updated_count = 0
-    for filepath in sorted(html_files):
-        if process_file(filepath):
+    results = run_parallel(process_file, sorted(html_files), jobs_from_argv())
+    for filepath, updated, error in results:
+        if updated:
             updated_count += 1
             if updated_count <= 20:
                 print(f"[OK] Fixed OG image URL in {filepath}")
+    report_failures(results)
     
     print(f"\nCompleted! Fixed {updated_count} files.")
 
@@ -2,12 +2,31 @@
 """
 Generate OG images programmatically using Pillow.
 Creates 1200x630px images with tool names, ratings, and branding.
+
+Usage:
+    python generate_og_images.py                  # render images that don't exist yet
+    python generate_og_images.py --build          # re-render tool/category images whose
+                                                  # inputs changed (see .og_manifest.json)
+    python generate_og_images.py --build --prune  # ...and delete unused og-tools images
+    python generate_og_images.py --build --jobs 4
 """
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
+from functools import lru_cache
+import numpy as np
+import hashlib
+import json
+import sys
 import re
 import os
 
+from html_extract import extract_page
+from parallel_runner import jobs_from_argv, run_parallel, report_failures
+
+# Bump when the image layout changes so --build re-renders everything
+OG_TEMPLATE_VERSION = 2
+OG_MANIFEST_FILE = '.og_manifest.json'
+
 # Try to import fonts, use default if not available
 try:
     # Try to use system fonts
@@ -29,21 +48,97 @@ try:
 except:
     pass
 
-def create_gradient_background(width, height, color1, color2):
-    """Create a gradient background."""
-    img = Image.new('RGB', (width, height), color1)
-    draw = ImageDraw.Draw(img)
-    
-    # Simple gradient effect
-    for i in range(height):
-        ratio = i / height
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        draw.line([(0, i), (width, i)], fill=(r, g, b))
-    
+GRADIENT_DIRECTIONS = ('vertical', 'horizontal', 'diagonal')
+
+WIDTH, HEIGHT = 1200, 630
+TEXT_MARGIN = 60  # left/right margin wrapped titles must stay inside
+TITLE_MAX_LINES = 2
+
+# --- Fonts and text layout --------------------------------------------------
+# Every image draws the same few strings in the same few sizes, so fonts,
+# word widths, wraps and bounding boxes are computed once per process and
+# reused across a bulk render.
+
+@lru_cache(maxsize=None)
+def get_font(path, size):
+    """The font at path in size, loaded once (Pillow's default if path is unusable)."""
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+# Scratch surface for measuring; same mode as the images so boxes match exactly
+_MEASURE = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+@lru_cache(maxsize=4096)
+def text_bbox(path, size, text):
+    """Bounding box of text (may contain newlines) drawn at (0, 0)."""
+    return _MEASURE.textbbox((0, 0), text, font=get_font(path, size))
+
+@lru_cache(maxsize=None)
+def word_width(path, size, word):
+    """Advance width of one word in pixels."""
+    return get_font(path, size).getlength(word)
+
+@lru_cache(maxsize=4096)
+def wrap_text(path, size, text, max_width, max_lines):
+    """
+    Greedy word wrap to max_width pixels, measured with the font itself rather
+    than a character count. Lines past max_lines are dropped; a single word
+    wider than max_width gets a line of its own.
+    """
+    space = word_width(path, size, ' ')
+    lines, current, current_width = [], [], 0
+    for word in text.split():
+        width = word_width(path, size, word)
+        if current and current_width + space + width > max_width:
+            lines.append(' '.join(current))
+            current, current_width = [word], width
+        else:
+            current_width += space + width if current else width
+            current.append(word)
+    if current:
+        lines.append(' '.join(current))
+    return '\n'.join(lines[:max_lines])
+
+def draw_centered(draw, y, text, path, size, shadow=3):
+    """Draw white text with a drop shadow, centered horizontally. Returns its bbox."""
+    bbox = text_bbox(path, size, text)
+    x = (WIDTH - (bbox[2] - bbox[0])) // 2
+    font = get_font(path, size)
+    draw.text((x + shadow, y + shadow), text, fill=(0, 0, 0, 128), font=font)
+    draw.text((x, y), text, fill=(255, 255, 255), font=font)
+    return bbox
+
+@lru_cache(maxsize=32)
+def _gradient_image(width, height, color1, color2, direction):
+    """Render a gradient as one NumPy array (cached per colors, size and direction)."""
+    ys = np.arange(height, dtype=np.float64)[:, None, None] / height
+    xs = np.arange(width, dtype=np.float64)[None, :, None] / width
+    if direction == 'vertical':
+        ratio = ys
+    elif direction == 'horizontal':
+        ratio = xs
+    elif direction == 'diagonal':
+        ratio = (ys + xs) / 2
+    else:
+        raise ValueError(f"Unknown gradient direction: {direction}")
+    
+    # Blend only along the axes that vary (a 1px strip for vertical/horizontal)
+    c1 = np.array(color1, dtype=np.float64)
+    c2 = np.array(color2, dtype=np.float64)
+    pixels = (c1 * (1 - ratio) + c2 * ratio).astype(np.uint8)
+    img = Image.fromarray(np.ascontiguousarray(pixels), 'RGB')
+    if img.size != (width, height):
+        img = img.resize((width, height), Image.NEAREST)
     return img
 
+def create_gradient_background(width, height, color1, color2, direction='vertical'):
+    """Create a gradient background (a fresh copy of the cached base image)."""
+    return _gradient_image(width, height, tuple(color1), tuple(color2), direction).copy()
+
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB."""
     hex_color = hex_color.lstrip('#')
@@ -51,7 +146,7 @@ def hex_to_rgb(hex_color):
 
 def create_tool_og_image(tool_name, rating, category, output_path):
     """Create OG image for a tool review."""
-    width, height = 1200, 630
+    width, height = WIDTH, HEIGHT
     
     # Color scheme based on category
     color_schemes = {
@@ -80,78 +175,26 @@ def create_tool_og_image(tool_name, rating, category, output_path):
     img = create_gradient_background(width, height, color1, color2)
     draw = ImageDraw.Draw(img)
     
-    # Try to load fonts
-    try:
-        if title_font_path:
-            title_font = ImageFont.truetype(title_font_path, 72)
-            subtitle_font = ImageFont.truetype(title_font_path, 36)
-            rating_font = ImageFont.truetype(title_font_path, 48)
-        else:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            rating_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        rating_font = ImageFont.load_default()
-    
     # Add logo/brand text (top left)
-    brand_text = "artificial.one"
-    try:
-        brand_font = ImageFont.truetype(title_font_path, 32) if title_font_path else ImageFont.load_default()
-    except:
-        brand_font = ImageFont.load_default()
-    
-    draw.text((60, 40), brand_text, fill=(255, 255, 255), font=brand_font)
+    draw.text((60, 40), "artificial.one", fill=(255, 255, 255), font=get_font(title_font_path, 32))
     
-    # Add tool name (center, large)
+    # Add tool name (center, large), wrapped to the image width
     tool_name_clean = tool_name.replace(' Review', '').replace(' review', '').strip()
-    # Wrap text if too long
-    if len(tool_name_clean) > 25:
-        words = tool_name_clean.split()
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if len(test_line) <= 25:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            lines.append(' '.join(current_line))
-        tool_name_clean = '\n'.join(lines[:2])  # Max 2 lines
-    
-    # Calculate text position (centered)
-    bbox = draw.textbbox((0, 0), tool_name_clean, font=title_font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) // 2
+    tool_name_clean = wrap_text(title_font_path, 72, tool_name_clean, width - 2 * TEXT_MARGIN, TITLE_MAX_LINES)
     y = height // 2 - 80
-    
-    # Add shadow for text readability
-    draw.text((x + 3, y + 3), tool_name_clean, fill=(0, 0, 0, 128), font=title_font)
-    draw.text((x, y), tool_name_clean, fill=(255, 255, 255), font=title_font)
+    bbox = draw_centered(draw, y, tool_name_clean, title_font_path, 72)
+    text_height = bbox[3] - bbox[1]
     
     # Add rating
     if rating:
         rating_text = f"{rating}/5"
         stars = "⭐" * min(5, int(float(rating)))
-        rating_display = f"{rating_text} {stars}"
-        
-        bbox = draw.textbbox((0, 0), rating_display, font=rating_font)
-        text_width = bbox[2] - bbox[0]
-        x_rating = (width - text_width) // 2
-        y_rating = y + text_height + 30
-        
-        draw.text((x_rating + 2, y_rating + 2), rating_display, fill=(0, 0, 0, 128), font=rating_font)
-        draw.text((x_rating, y_rating), rating_display, fill=(255, 255, 255), font=rating_font)
+        draw_centered(draw, y + text_height + 30, f"{rating_text} {stars}", title_font_path, 48, shadow=2)
     
     # Add category badge (bottom)
     if category:
-        category_text = category.replace('&', '&').strip()
-        bbox = draw.textbbox((0, 0), category_text, font=subtitle_font)
+        category_text = category.strip()
+        bbox = text_bbox(title_font_path, 36, category_text)
         text_width = bbox[2] - bbox[0]
         x_cat = (width - text_width) // 2
         y_cat = height - 100
@@ -163,7 +206,7 @@ def create_tool_og_image(tool_name, rating, category, output_path):
             radius=10,
             fill=(255, 255, 255, 200)
         )
-        draw.text((x_cat, y_cat), category_text, fill=(50, 50, 50), font=subtitle_font)
+        draw.text((x_cat, y_cat), category_text, fill=(50, 50, 50), font=get_font(title_font_path, 36))
     
     # Save image
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -172,7 +215,7 @@ def create_tool_og_image(tool_name, rating, category, output_path):
 
 def create_homepage_og_image(output_path):
     """Create homepage OG image."""
-    width, height = 1200, 630
+    width, height = WIDTH, HEIGHT
     
     # Purple/indigo gradient
     color1 = hex_to_rgb('#6366f1')
@@ -181,48 +224,16 @@ def create_homepage_og_image(output_path):
     img = create_gradient_background(width, height, color1, color2)
     draw = ImageDraw.Draw(img)
     
-    try:
-        if title_font_path:
-            title_font = ImageFont.truetype(title_font_path, 80)
-            subtitle_font = ImageFont.truetype(title_font_path, 40)
-            stats_font = ImageFont.truetype(title_font_path, 36)
-        else:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            stats_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        stats_font = ImageFont.load_default()
-    
     # Brand
-    brand_text = "artificial.one"
-    try:
-        brand_font = ImageFont.truetype(title_font_path, 42) if title_font_path else ImageFont.load_default()
-    except:
-        brand_font = ImageFont.load_default()
-    draw.text((60, 50), brand_text, fill=(255, 255, 255), font=brand_font)
+    draw.text((60, 50), "artificial.one", fill=(255, 255, 255), font=get_font(title_font_path, 42))
     
     # Main title
-    title = "Find the Right AI Tool\nin 5 Minutes"
-    bbox = draw.textbbox((0, 0), title, font=title_font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) // 2
     y = height // 2 - 100
-    
-    draw.text((x + 3, y + 3), title, fill=(0, 0, 0, 128), font=title_font)
-    draw.text((x, y), title, fill=(255, 255, 255), font=title_font)
+    bbox = draw_centered(draw, y, "Find the Right AI Tool\nin 5 Minutes", title_font_path, 80)
     
     # Stats
     stats = "220+ Tools Reviewed | Zero BS | Honest Reviews"
-    bbox = draw.textbbox((0, 0), stats, font=stats_font)
-    text_width = bbox[2] - bbox[0]
-    x_stats = (width - text_width) // 2
-    y_stats = y + text_height + 40
-    
-    draw.text((x_stats + 2, y_stats + 2), stats, fill=(0, 0, 0, 128), font=stats_font)
-    draw.text((x_stats, y_stats), stats, fill=(255, 255, 255), font=stats_font)
+    draw_centered(draw, y + bbox[3] - bbox[1] + 40, stats, title_font_path, 36, shadow=2)
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(output_path, 'JPEG', quality=85, optimize=True)
@@ -230,7 +241,7 @@ def create_homepage_og_image(output_path):
 
 def create_category_og_image(category_name, tool_count, output_path):
     """Create OG image for category page."""
-    width, height = 1200, 630
+    width, height = WIDTH, HEIGHT
     
     color1 = hex_to_rgb('#6366f1')
     color2 = hex_to_rgb('#8b5cf6')
@@ -238,37 +249,13 @@ def create_category_og_image(category_name, tool_count, output_path):
     img = create_gradient_background(width, height, color1, color2)
     draw = ImageDraw.Draw(img)
     
-    try:
-        if title_font_path:
-            title_font = ImageFont.truetype(title_font_path, 72)
-            count_font = ImageFont.truetype(title_font_path, 48)
-        else:
-            title_font = ImageFont.load_default()
-            count_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-        count_font = ImageFont.load_default()
-    
     # Category name
     category_clean = category_name.replace(' AI Tools', '').replace(' Tools', '').strip()
-    bbox = draw.textbbox((0, 0), category_clean, font=title_font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) // 2
     y = height // 2 - 60
-    
-    draw.text((x + 3, y + 3), category_clean, fill=(0, 0, 0, 128), font=title_font)
-    draw.text((x, y), category_clean, fill=(255, 255, 255), font=title_font)
+    bbox = draw_centered(draw, y, category_clean, title_font_path, 72)
     
     # Tool count
-    count_text = f"{tool_count} Tools Reviewed"
-    bbox = draw.textbbox((0, 0), count_text, font=count_font)
-    text_width = bbox[2] - bbox[0]
-    x_count = (width - text_width) // 2
-    y_count = y + text_height + 40
-    
-    draw.text((x_count + 2, y_count + 2), count_text, fill=(0, 0, 0, 128), font=count_font)
-    draw.text((x_count, y_count), count_text, fill=(255, 255, 255), font=count_font)
+    draw_centered(draw, y + bbox[3] - bbox[1] + 40, f"{tool_count} Tools Reviewed", title_font_path, 48, shadow=2)
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(output_path, 'JPEG', quality=85, optimize=True)
@@ -276,7 +263,7 @@ def create_category_og_image(category_name, tool_count, output_path):
 
 def create_default_og_image(output_path):
     """Create default OG image."""
-    width, height = 1200, 630
+    width, height = WIDTH, HEIGHT
     
     color1 = hex_to_rgb('#6366f1')
     color2 = hex_to_rgb('#8b5cf6')
@@ -284,23 +271,9 @@ def create_default_og_image(output_path):
     img = create_gradient_background(width, height, color1, color2)
     draw = ImageDraw.Draw(img)
     
-    try:
-        if title_font_path:
-            title_font = ImageFont.truetype(title_font_path, 64)
-        else:
-            title_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-    
     title = "artificial.one\nAI Tool Reviews"
-    bbox = draw.textbbox((0, 0), title, font=title_font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    x = (width - text_width) // 2
-    y = (height - text_height) // 2
-    
-    draw.text((x + 3, y + 3), title, fill=(0, 0, 0, 128), font=title_font)
-    draw.text((x, y), title, fill=(255, 255, 255), font=title_font)
+    bbox = text_bbox(title_font_path, 64, title)
+    draw_centered(draw, (height - (bbox[3] - bbox[1])) // 2, title, title_font_path, 64)
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(output_path, 'JPEG', quality=85, optimize=True)
@@ -309,11 +282,11 @@ def create_default_og_image(output_path):
 def extract_tool_info(content, filepath):
     """Extract tool information from HTML."""
     info = {}
+    page = extract_page(content)
     
     # Extract title
-    title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-    if title_match:
-        title = re.sub(r'<[^>]+>', '', title_match.group(1)).strip()
+    if page['title']:
+        title = page['title']
         tool_match = re.search(r'^([^R]+?)\s+Review', title, re.IGNORECASE)
         if tool_match:
             info['name'] = tool_match.group(1).strip()
@@ -321,23 +294,166 @@ def extract_tool_info(content, filepath):
             info['name'] = title.split('Review')[0].strip()
     
     # Extract rating
-    rating_match = re.search(r'(\d+\.?\d*)/10|(\d+\.?\d*)/5', content)
-    if rating_match:
-        rating = rating_match.group(1) or rating_match.group(2)
-        info['rating'] = rating
-    
-    # Extract category
-    cat_match = re.search(r'category["\']:\s*["\']([^"\']+)["\']', content, re.IGNORECASE)
-    if not cat_match:
-        # Try H1 or other patterns
-        h1_match = re.search(r'<h1[^>]*>.*?([A-Z][a-z]+ & [A-Z][a-z]+).*?</h1>', content, re.IGNORECASE | re.DOTALL)
-        if h1_match:
-            info['category'] = h1_match.group(1)
-    else:
-        info['category'] = cat_match.group(1)
+    if page['rating']:
+        info['rating'] = page['rating']
+    
+    # Extract category, falling back to a "Design & Images" style phrase in the H1
+    category = page['category'] or page['h1_category']
+    if category:
+        info['category'] = category
     
     return info
 
+def find_html_files(root):
+    """All HTML pages under root, skipping hidden directories."""
+    html_files = []
+    for html_file in root.rglob('*.html'):
+        if any(part.startswith('.') for part in html_file.parts):
+            continue
+        if '.git' in html_file.parts:
+            continue
+        html_files.append(html_file)
+    return sorted(html_files)
+
+def tool_image_inputs(filepath, images_dir):
+    """(tool_name, rating, category, output_path) for a tool review page."""
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    
+    info = extract_tool_info(content, filepath)
+    tool_name = info.get('name', filepath.stem.replace('-review', '').replace('-', ' ').title())
+    rating = info.get('rating', '')
+    category = info.get('category', '')
+    
+    # Clean tool name for filename
+    tool_name_clean = filepath.stem.replace('-review', '').replace('-', '-').lower()
+    output_path = images_dir / 'og-tools' / f'{tool_name_clean}.jpg'
+    return tool_name, rating, category, output_path
+
+def category_image_inputs(filepath, images_dir):
+    """(category_name, tool_count, output_path) for a category page."""
+    category_name = filepath.stem.replace('-', ' ').title()
+    # Estimate tool count (you can improve this)
+    tool_count = 25  # Default estimate
+    
+    output_path = images_dir / 'og-categories' / f'{filepath.stem}.jpg'
+    return category_name, tool_count, output_path
+
+def font_fingerprint():
+    """Identify the font the images are drawn with, so a font change re-renders."""
+    if not title_font_path:
+        return 'default'
+    stat = os.stat(title_font_path)
+    return f"{title_font_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def image_job_hash(kind, inputs):
+    """Content address of one image: its inputs, the template version and the font."""
+    payload = json.dumps([kind, list(inputs), OG_TEMPLATE_VERSION, font_fingerprint()])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def render_image_job(job):
+    """Render one (kind, inputs, output_path) job. Module-level so workers can pickle it."""
+    kind, inputs, output_path = job
+    if kind == 'tool':
+        return create_tool_og_image(*inputs, Path(output_path))
+    return create_category_og_image(*inputs, Path(output_path))
+
+def load_og_manifest(manifest_file=OG_MANIFEST_FILE):
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_og_manifest(manifest, manifest_file=OG_MANIFEST_FILE):
+    tmp = Path(manifest_file).with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    tmp.replace(manifest_file)
+
+def build_og_images(html_files, images_dir, jobs=None, prune=False, partial=False):
+    """
+    Content-addressed build of the tool and category images: only images whose
+    input hash differs from the manifest (or whose file is missing) are
+    rendered, in parallel. Images under og-tools that no page uses any more
+    are reported, and deleted with prune=True.
+    partial=True means html_files is only a subset of the site (build_graph.py):
+    other manifest entries are kept and unused images are not looked for.
+    foo.html and foo-review.html share og-tools/foo.jpg (the URL their og:image
+    tags use); when their inputs differ the -review page's are drawn and the
+    pair is reported.
+    """
+    wanted = {}  # output path -> (kind, inputs, hash)
+    owners = {}  # output path -> page whose inputs it is drawn from
+    shared = 0
+    conflicts = []
+    for filepath in html_files:
+        path_str = str(filepath).replace('\\', '/')
+        if filepath.name == 'index.html':
+            continue
+        if '/tools/' in path_str or filepath.parent.name == 'tools':
+            *inputs, output_path = tool_image_inputs(filepath, images_dir)
+            kind = 'tool'
+        elif '/category/' in path_str or filepath.parent.name == 'category':
+            *inputs, output_path = category_image_inputs(filepath, images_dir)
+            kind = 'category'
+        else:
+            continue
+        output = output_path.as_posix()
+        if output in owners:
+            shared += 1
+            if wanted[output][1] != tuple(inputs):
+                conflicts.append((output, owners[output], filepath))
+            # Otherwise the order of html_files would decide which page is drawn
+            if owners[output].stem.endswith('-review') or not filepath.stem.endswith('-review'):
+                continue
+        wanted[output] = (kind, tuple(inputs), image_job_hash(kind, inputs))
+        owners[output] = filepath
+    
+    if shared:
+        print(f"{shared} image(s) shared by two pages, {len(conflicts)} with different inputs")
+        for output, first, second in conflicts:
+            print(f"  - {output}: {first} vs {second} (drawn from the -review page)")
+    
+    manifest = load_og_manifest()
+    pending = [
+        (kind, inputs, output)
+        for output, (kind, inputs, digest) in sorted(wanted.items())
+        if manifest.get(output) != digest or not Path(output).exists()
+    ]
+    print(f"{len(wanted)} images, {len(wanted) - len(pending)} up to date, {len(pending)} to render")
+    
+    results = run_parallel(render_image_job, pending, jobs)
+    rendered = 0
+    for (kind, inputs, output), ok, error in results:
+        if error is None:
+            manifest[output] = wanted[output][2]
+            rendered += 1
+            if rendered <= 50:  # Show first 50
+                print(f"[OK] Generated: {output}")
+    report_failures([(job[2], ok, error) for job, ok, error in results])
+    if partial:
+        save_og_manifest(manifest)
+        print(f"\nRendered: {rendered} images")
+        return
+    
+    # Forget entries for pages that no longer exist
+    manifest = {output: digest for output, digest in manifest.items() if output in wanted}
+    save_og_manifest(manifest)
+    
+    unused = sorted(
+        path for path in (images_dir / 'og-tools').glob('*.jpg')
+        if path.as_posix() not in wanted
+    )
+    print(f"\nRendered: {rendered} images")
+    if unused:
+        action = "Pruned" if prune else "Unused (pass --prune to delete)"
+        print(f"{action}: {len(unused)} images in {images_dir / 'og-tools'}/")
+        for path in unused:
+            print(f"  - {path}")
+            if prune:
+                path.unlink()
+
 def main():
     """Generate OG images for all pages."""
     root = Path('.')
@@ -349,7 +465,7 @@ def main():
     (images_dir / 'og-blog').mkdir(parents=True, exist_ok=True)
     
     print("Generating OG images...")
-    print("Note: Install Pillow if not installed: pip install Pillow\n")
+    print("Note: Install Pillow and NumPy if not installed: pip install Pillow numpy\n")
     
     # Check if Pillow is installed
     try:
@@ -359,16 +475,13 @@ def main():
         print("Install it with: pip install Pillow")
         return
     
-    html_files = []
-    for html_file in root.rglob('*.html'):
-        if any(part.startswith('.') for part in html_file.parts):
-            continue
-        if '.git' in html_file.parts:
-            continue
-        html_files.append(html_file)
-    
+    html_files = find_html_files(root)
     print(f"Found {len(html_files)} HTML files\n")
     
+    if '--build' in sys.argv[1:]:
+        build_og_images(html_files, images_dir, jobs_from_argv(), prune='--prune' in sys.argv[1:])
+        return
+    
     generated = 0
     skipped = 0
     default_created = False
@@ -390,17 +503,7 @@ def main():
             
             elif '/tools/' in path_str or filepath.parent.name == 'tools':
                 # Tool review
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                info = extract_tool_info(content, filepath)
-                tool_name = info.get('name', filepath.stem.replace('-review', '').replace('-', ' ').title())
-                rating = info.get('rating', '')
-                category = info.get('category', '')
-                
-                # Clean tool name for filename
-                tool_name_clean = filepath.stem.replace('-review', '').replace('-', '-').lower()
-                output_path = images_dir / 'og-tools' / f'{tool_name_clean}.jpg'
+                tool_name, rating, category, output_path = tool_image_inputs(filepath, images_dir)
                 
                 if not output_path.exists():
                     create_tool_og_image(tool_name, rating, category, output_path)
@@ -412,11 +515,7 @@ def main():
             
             elif '/category/' in path_str or filepath.parent.name == 'category':
                 # Category page
-                category_name = filepath.stem.replace('-', ' ').title()
-                # Estimate tool count (you can improve this)
-                tool_count = 25  # Default estimate
-                
-                output_path = images_dir / 'og-categories' / f'{filepath.stem}.jpg'
+                category_name, tool_count, output_path = category_image_inputs(filepath, images_dir)
                 if not output_path.exists():
                     create_category_og_image(category_name, tool_count, output_path)
                     print(f"[OK] Generated: {output_path}")
@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
 """
-Generate a complete sitemap.xml with all HTML pages on the site.
-Updates lastmod to today's date (2026-01-24).
+Generate the sitemaps: a sitemap index (sitemap.xml) with one child per
+section (tools, blog, best, compare, guides, pages), each also written as
+.xml.gz.
+
+- lastmod is the date a page's content hash last changed, kept in
+  .sitemap_history.json (seeded from the lastmod values already published,
+  so a fresh checkout does not mark every page as modified today)
+- one entry per URL; pages whose canonical URL points at another page are
+  left out (the canonical page is listed instead)
+- a shard is only rewritten when its entries change, so crawlers re-fetch
+  only the sections that moved
+
+Usage:
+    python generate_sitemap.py
 """
+import re
+import gzip
+import json
+import hashlib
 from pathlib import Path
 from datetime import date
+from page_index import build_index, iter_html_files, page_key
+
+BASE_URL = 'https://artificial.one'
+INDEX_FILE = 'sitemap.xml'
+SHARD_PREFIX = 'sitemap-'
+HISTORY_FILE = '.sitemap_history.json'
+SECTIONS = ('tools', 'blog', 'best', 'compare', 'guides', 'pages')
+MAX_URLS = 50000  # per sitemap file (sitemaps.org limit)
+LOC_LASTMOD_RE = re.compile(r'<loc>([^<]+)</loc>\s*<lastmod>([^<]+)</lastmod>')
 
 def get_priority(path):
     """Determine priority based on page location."""
@@ -62,62 +87,164 @@ def get_changefreq(path):
     # Everything else is monthly
     return 'monthly'
 
-def generate_sitemap():
-    """Generate sitemap.xml with all HTML pages."""
-    root = Path('.')
-    base_url = 'https://artificial.one'
-    today = '2026-01-24'
-    
-    # Find all HTML files
-    html_files = []
-    for html_file in root.rglob('*.html'):
-        # Skip hidden directories and node_modules
-        if any(part.startswith('.') for part in html_file.parts):
-            continue
-        if 'node_modules' in html_file.parts:
+def page_url(url_path):
+    """Sitemap <loc> of a page path relative to the site root."""
+    return f'{BASE_URL}/' if url_path == 'index.html' else f'{BASE_URL}/{url_path}'
+
+def section_of(url_path):
+    """Child sitemap a page belongs to."""
+    top = url_path.split('/')[0]
+    if top in ('tools', 'best', 'compare', 'guides'):
+        return top
+    if top == 'blog' or url_path.startswith('blog-') or url_path == 'blog.html':
+        return 'blog'
+    return 'pages'
+
+def content_hash(filepath):
+    return hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+
+def published_lastmods(root):
+    """{loc: lastmod} from the sitemap files currently on disk."""
+    lastmods = {}
+    for path in [Path(root) / INDEX_FILE, *sorted(Path(root).glob(f'{SHARD_PREFIX}*.xml'))]:
+        if path.exists():
+            lastmods.update(LOC_LASTMOD_RE.findall(path.read_text(encoding='utf-8')))
+    return lastmods
+
+def load_history(root):
+    try:
+        return json.loads((Path(root) / HISTORY_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def save_history(root, history):
+    path = Path(root) / HISTORY_FILE
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(history, indent=0, sort_keys=True), encoding='utf-8')
+    tmp.replace(path)
+
+def is_duplicate(url_path, facts):
+    """True if the page declares another page as its canonical URL."""
+    canonical = (facts or {}).get('canonical')
+    if not canonical or not canonical.startswith(BASE_URL):
+        return False
+    return canonical.rstrip('/') != page_url(url_path).rstrip('/')
+
+def collect_entries(root, today):
+    """
+    [(section, loc, lastmod, changefreq, priority)] for every listed page, and
+    the updated content-hash history.
+    """
+    root = Path(root)
+    history = load_history(root)
+    published = None
+    index = build_index(root)
+    entries = {}
+    new_history = {}
+    for html_file in iter_html_files(root):
+        url_path = page_key(html_file, root)
+        loc = page_url(url_path)
+        if loc in entries or is_duplicate(url_path, index.get(url_path)):
             continue
-        
-        html_files.append(html_file)
-    
-    # Sort files for consistent ordering
-    html_files.sort()
-    
-    # Generate sitemap XML
-    sitemap = ['<?xml version="1.0" encoding="UTF-8"?>']
-    sitemap.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-    
-    for html_file in html_files:
-        # Convert path to URL
-        url_path = str(html_file).replace('\\', '/')
-        
-        # Remove leading './' if present
-        if url_path.startswith('./'):
-            url_path = url_path[2:]
-        
-        # Handle index.html at root
-        if url_path == 'index.html':
-            url = f'{base_url}/'
+
+        digest = content_hash(html_file)
+        seen = history.get(url_path)
+        if seen and seen['hash'] == digest:
+            lastmod = seen['lastmod']
+        elif seen is None:
+            if published is None:
+                published = published_lastmods(root)
+            lastmod = published.get(loc, today)
         else:
-            url = f'{base_url}/{url_path}'
-        
-        priority = get_priority(html_file)
-        changefreq = get_changefreq(html_file)
-        
-        sitemap.append('  <url>')
-        sitemap.append(f'    <loc>{url}</loc>')
-        sitemap.append(f'    <lastmod>{today}</lastmod>')
-        sitemap.append(f'    <changefreq>{changefreq}</changefreq>')
-        sitemap.append(f'    <priority>{priority}</priority>')
-        sitemap.append('  </url>')
-    
-    sitemap.append('</urlset>')
-    
-    # Write sitemap
-    sitemap_content = '\n'.join(sitemap)
-    Path('sitemap.xml').write_text(sitemap_content, encoding='utf-8')
-    
-    print(f'Generated sitemap.xml with {len(html_files)} URLs')
-    print(f'Last modified date: {today}')
+            lastmod = today
+        new_history[url_path] = {'hash': digest, 'lastmod': lastmod}
+
+        # get_priority/get_changefreq match on '/tools/'-style segments
+        path = Path('/' + url_path)
+        entries[loc] = (section_of(url_path), loc, lastmod, get_changefreq(path), get_priority(path))
+    return list(entries.values()), new_history
+
+def render_urlset(entries):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for _, loc, lastmod, changefreq, priority in entries:
+        lines.append('  <url>')
+        lines.append(f'    <loc>{loc}</loc>')
+        lines.append(f'    <lastmod>{lastmod}</lastmod>')
+        lines.append(f'    <changefreq>{changefreq}</changefreq>')
+        lines.append(f'    <priority>{priority}</priority>')
+        lines.append('  </url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+def render_index(shards):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for name, lastmod in shards:
+        lines.append('  <sitemap>')
+        lines.append(f'    <loc>{BASE_URL}/{name}.gz</loc>')
+        lines.append(f'    <lastmod>{lastmod}</lastmod>')
+        lines.append('  </sitemap>')
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+def write_sitemap(path, content):
+    """Write path and path.gz unless path already holds content. Returns True if written."""
+    path = Path(path)
+    gz_path = path.with_name(path.name + '.gz')
+    if path.exists() and gz_path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    data = content.encode('utf-8')
+    for target, payload in ((path, data), (gz_path, gzip.compress(data, mtime=0))):
+        tmp = target.with_name(target.name + '.tmp')
+        tmp.write_bytes(payload)
+        tmp.replace(target)
+    return True
+
+def build_sitemaps(root='.', today=None):
+    """Write the changed shards and the index. Returns (urls, [written files])."""
+    root = Path(root)
+    today = today or date.today().isoformat()
+    entries, history = collect_entries(root, today)
+
+    by_section = {}
+    for entry in entries:
+        by_section.setdefault(entry[0], []).append(entry)
+    shards = []
+    for section in SECTIONS:
+        items = by_section.get(section, [])
+        for start in range(0, len(items), MAX_URLS):
+            chunk = items[start:start + MAX_URLS]
+            suffix = f'-{start // MAX_URLS + 1}' if start else ''
+            shards.append((f'{SHARD_PREFIX}{section}{suffix}.xml', chunk))
+
+    written = []
+    for name, chunk in shards:
+        if write_sitemap(root / name, render_urlset(chunk)):
+            written.append(name)
+    index = [(name, max(entry[2] for entry in chunk)) for name, chunk in shards]
+    if write_sitemap(root / INDEX_FILE, render_index(index)):
+        written.append(INDEX_FILE)
+
+    # Sections that no longer have pages
+    current = {name for name, _ in shards}
+    for stale in root.glob(f'{SHARD_PREFIX}*.xml'):
+        if stale.name not in current:
+            stale.unlink()
+            stale.with_name(stale.name + '.gz').unlink(missing_ok=True)
+            written.append(f'{stale.name} (removed)')
+
+    save_history(root, history)
+    return len(entries), written
+
+def generate_sitemap():
+    """Generate the sitemap index and its section shards."""
+    urls, written = build_sitemaps()
+    print(f'Sitemaps: {urls} URLs in {len(SECTIONS)} sections')
+    for name in written:
+        print(f'[OK] Wrote {name}')
+    if not written:
+        print('Everything up to date')
 
 if __name__ == '__main__':
     generate_sitemap()
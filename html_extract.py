@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Single-pass page extractor for the meta/schema scripts.
+
+add_structured_data.py, generate_og_images.py, add_complete_og_tags.py,
+add_twitter_cards.py, improve_meta_descriptions.py and add_faq_schema.py used
+to run their own re.DOTALL searches over whole documents (extract_faqs had
+`(?:FAQ|...).*?(?=<h[12]|...)`, which backtracks badly on large pages such as
+blog.html). They now share one html.parser pass per page: the document is fed
+in chunks, each tag and text node is seen once, and only the fields being
+collected are buffered, so memory does not grow with the page.
+
+Values are decoded text (entities resolved, tags stripped), as a browser
+would read them; scripts that write them back into attributes escape them.
+
+Usage:
+    from html_extract import extract_page, extract_file
+    info = extract_page(content)                 # whole page
+    info = extract_page(content, head_only=True) # stop at </head>
+    info['title'], info['description'], info['og']['og:image'], info['faqs']
+
+    python html_extract.py tools/tidycal-review.html   # print what was found
+"""
+import re
+import sys
+import json
+from html.parser import HTMLParser
+
+CHUNK_SIZE = 64 * 1024
+HEADINGS = ('h2', 'h3')
+FAQ_WORDS = ('what', 'how', 'why', 'when', 'where', 'is', 'are', 'can', 'does', 'do')
+MAX_FAQS = 10
+
+# Text facts, first match of each wins; one alternation so each text node is searched once
+SCAN_RE = re.compile(
+    r'(?P<rating>(?P<rating10>\d+\.?\d*)/10|(?P<rating5>\d+\.?\d*)/5)'
+    r'|(?P<price>\$(?P<price_value>\d+)\s*(?:one-time|lifetime|super|deal))'
+    r'|(?P<monthly_price>\$(?P<monthly_value>\d+)/mo)'
+    r'|(?P<category>category["\']:\s*["\'](?P<category_value>[^"\']+)["\'])',
+    re.IGNORECASE,
+)
+SCANNED = ('rating', 'price', 'monthly_price', 'category')
+DEAL_WORDS = ('lifetime', 'one-time', 'super deal')
+H1_CATEGORY_RE = re.compile(r'([A-Z][a-z]+ & [A-Z][a-z]+)')
+
+HEAD_END_RE = re.compile(r'</head\s*>|<body[\s>]', re.IGNORECASE)
+
+# Text kept from the previous data event: the parser splits a text node at chunk
+# boundaries, and a pattern straddling one must still be found
+OVERLAP = 64
+
+
+def collapse(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class PageExtractor(HTMLParser):
+    """Collects the page facts from parser events; read .facts after close()."""
+
+    def __init__(self, head_only=False):
+        super().__init__(convert_charrefs=True)
+        self.head_only = head_only
+        self.done = False
+        self.facts = {
+            'title': '',
+            'description': None,
+            'canonical': None,
+            'og': {},
+            'h1': '',
+            'rating': None,
+            'rating_scale': None,
+            'price': None,
+            'monthly_price': None,
+            'category': None,
+            'h1_category': None,  # "Writing & Content" style phrase in the h1
+            'is_deal': False,
+            'faqs': [],
+        }
+        self._captures = {}     # field -> list of text pieces while inside its element
+        self._question = None   # heading text waiting for the <p> that answers it
+        self._pending = set(SCANNED)
+        self._tail = ''
+
+    # --- streaming text scan (ratings, prices, category, deal words) ---
+
+    def _scan(self, text):
+        if not text.strip():
+            return
+        window = self._tail + text
+        self._tail = window[-OVERLAP:]
+        if not self.facts['is_deal']:
+            lowered = window.lower()
+            self.facts['is_deal'] = any(word in lowered for word in DEAL_WORDS)
+        if not self._pending:
+            return
+        for m in SCAN_RE.finditer(window):
+            kind = m.lastgroup  # the outer group of the alternative that matched
+            if kind not in self._pending:
+                continue
+            self._pending.discard(kind)
+            if kind == 'rating':
+                self.facts['rating'] = m.group('rating10') or m.group('rating5')
+                self.facts['rating_scale'] = 10 if m.group('rating10') else 5
+            elif kind == 'price':
+                self.facts['price'] = f"${m.group('price_value')}"
+            elif kind == 'monthly_price':
+                self.facts['monthly_price'] = f"${m.group('monthly_value')}/mo"
+            else:
+                self.facts['category'] = m.group('category_value')
+            if not self._pending:
+                break
+
+    # --- parser events ---
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = {k.lower(): v or '' for k, v in attrs}
+        for value in attrs.values():
+            self._tail = ''
+            self._scan(value)
+        self._tail = ''
+
+        if tag == 'meta':
+            self._meta(attrs)
+        elif tag == 'link' and 'canonical' in attrs.get('rel', '').lower().split():
+            if self.facts['canonical'] is None:
+                self.facts['canonical'] = attrs.get('href', '').strip()
+        elif tag == 'title' and not self.facts['title']:
+            self._captures['title'] = []
+        elif tag == 'h1' and not self.facts['h1']:
+            self._captures['h1'] = []
+        elif tag == 'body' and self.head_only:
+            self.done = True
+
+        if tag in HEADINGS:
+            self._captures['question'] = []
+            self._question = None
+        elif tag == 'p' and self._question is not None and 'answer' not in self._captures:
+            self._captures['answer'] = []
+        elif 'question' not in self._captures and 'answer' not in self._captures:
+            # Only whitespace may sit between a question heading and its answer
+            self._question = None
+
+    def _meta(self, attrs):
+        content = attrs.get('content', '').strip()
+        name = attrs.get('name', '').lower()
+        prop = attrs.get('property', '').lower()
+        if name == 'description' and self.facts['description'] is None:
+            self.facts['description'] = content
+        if prop.startswith('og:'):
+            # First occurrence wins (same as remove_duplicate_og_tags.py)
+            self.facts['og'].setdefault(prop, content)
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        self._tail = ''
+        if tag == 'title' and 'title' in self._captures:
+            self.facts['title'] = collapse(''.join(self._captures.pop('title')))
+        elif tag == 'h1' and 'h1' in self._captures:
+            self.facts['h1'] = collapse(''.join(self._captures.pop('h1')))
+        elif tag in HEADINGS and 'question' in self._captures:
+            self._question = collapse(''.join(self._captures.pop('question')))
+        elif tag == 'p' and 'answer' in self._captures:
+            self._add_faq(self._question, collapse(''.join(self._captures.pop('answer'))))
+            self._question = None
+        elif tag == 'head' and self.head_only:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.done:
+            return
+        self._scan(data)
+        for pieces in self._captures.values():
+            pieces.append(data)
+        if data.strip() and not self._captures:
+            self._question = None
+
+    def _add_faq(self, question, answer):
+        faqs = self.facts['faqs']
+        if not question or len(faqs) >= MAX_FAQS:
+            return
+        lowered = question.lower()
+        if '?' not in question and not any(word in lowered for word in FAQ_WORDS):
+            return
+        if len(question) <= 10 or len(answer) <= 20:
+            return
+        if any(faq['question'] == question[:200] for faq in faqs):
+            return
+        faqs.append({'question': question[:200], 'answer': answer[:500]})
+
+    def close(self):
+        super().close()
+        if self.facts['category'] is None and self.facts['h1']:
+            m = H1_CATEGORY_RE.search(self.facts['h1'])
+            if m:
+                self.facts['h1_category'] = m.group(1)
+        return self.facts
+
+
+def extract_chunks(chunks, head_only=False):
+    """Run the extractor over an iterable of text chunks, stopping early when done."""
+    parser = PageExtractor(head_only=head_only)
+    for chunk in chunks:
+        if head_only:
+            # Don't tokenize the body at all: feed up to the end of the head
+            m = HEAD_END_RE.search(chunk)
+            if m:
+                parser.feed(chunk[:m.end()])
+                break
+        parser.feed(chunk)
+        if parser.done:
+            break
+    return parser.close()
+
+
+def extract_page(content, head_only=False):
+    """Facts of one page given as a string."""
+    return extract_chunks(
+        (content[i:i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE)),
+        head_only,
+    )
+
+
+def extract_file(path, head_only=False):
+    """Facts of one page read from disk chunk by chunk."""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return extract_chunks(iter(lambda: f.read(CHUNK_SIZE), ''), head_only)
+
+
+def main():
+    for path in sys.argv[1:]:
+        print(f"{path}:")
+        print(json.dumps(extract_file(path), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
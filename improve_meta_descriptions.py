@@ -4,33 +4,29 @@ Improve meta descriptions for review pages with better format.
 """
 import re
 from pathlib import Path
+from html_extract import extract_page
 
 def extract_tool_info(content):
     """Extract tool information from HTML."""
     info = {}
+    page = extract_page(content)
     
     # Extract title
-    title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE)
-    if title_match:
-        title = title_match.group(1).replace(' | artificial.one', '').replace('Review 2026:', 'Review:').strip()
+    if page['title']:
+        title = page['title'].replace(' | artificial.one', '').replace('Review 2026:', 'Review:').strip()
         info['name'] = title.split(' Review')[0].strip()
     
     # Extract rating
-    rating_match = re.search(r'(\d+\.?\d*)/10|(\d+\.?\d*)/5', content)
-    if rating_match:
-        info['rating'] = rating_match.group(1) or rating_match.group(2)
+    if page['rating']:
+        info['rating'] = page['rating']
     
-    # Extract price
-    price_match = re.search(r'\$(\d+)\s*(one-time|lifetime|super|deal)', content, re.IGNORECASE)
-    if price_match:
-        info['price'] = f"${price_match.group(1)}"
-    else:
-        monthly_match = re.search(r'\$(\d+)/mo', content, re.IGNORECASE)
-        if monthly_match:
-            info['price'] = f"${monthly_match.group(1)}/mo"
+    # Extract price (one-time price first, then monthly)
+    price = page['price'] or page['monthly_price']
+    if price:
+        info['price'] = price
     
     # Check if it's a deal
-    info['is_deal'] = 'lifetime' in content.lower() or 'one-time' in content.lower() or 'super deal' in content.lower()
+    info['is_deal'] = page['is_deal']
     
     return info
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Shared --incremental support for the tree-rewriting scripts.
+Keeps a manifest (.transform_manifest.json) of per-file content hashes and the
+transform version last applied by each script. In incremental mode a file whose
+content and transform version are unchanged since the last run is skipped
+entirely, so routine runs only touch new or edited pages and leave mtimes (and
+CDN caches) alone for everything else.
+
+Usage from a script:
+    manifest = load_manifest('add_canonical_tags', TRANSFORM_VERSION) if is_incremental() else None
+    for filepath in html_files:
+        if manifest is not None and is_unchanged(manifest, filepath):
+            continue
+        process_file(filepath)
+        if manifest is not None:
+            record(manifest, filepath)
+    if manifest is not None:
+        save_manifest(manifest)
+"""
+import sys
+import json
+import hashlib
+from pathlib import Path
+
+MANIFEST_FILE = '.transform_manifest.json'
+
+
+def is_incremental(argv=None):
+    """True if --incremental was passed on the command line."""
+    argv = sys.argv[1:] if argv is None else argv
+    return '--incremental' in argv
+
+
+def file_hash(filepath):
+    """SHA-256 of the file's raw bytes."""
+    return hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+
+
+def _key(filepath):
+    return Path(filepath).as_posix()
+
+
+def load_manifest(transform, version, manifest_file=MANIFEST_FILE):
+    """
+    Load the manifest entries for one transform.
+    Entries recorded under a different transform version are dropped, so bumping
+    a script's TRANSFORM_VERSION makes the next incremental run reprocess everything.
+    """
+    try:
+        data = json.loads(Path(manifest_file).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        data = {}
+
+    entries = data.get(transform, {})
+    files = {
+        path: entry for path, entry in entries.get('files', {}).items()
+        if entry.get('version') == version
+    }
+    return {
+        'transform': transform,
+        'version': version,
+        'manifest_file': manifest_file,
+        'files': files,
+        'skipped': 0,
+    }
+
+
+def is_unchanged(manifest, filepath):
+    """
+    True if filepath still has the content recorded after the last run of this
+    transform version. mtime + size are checked first so untouched files are
+    skipped without being read at all.
+    """
+    entry = manifest['files'].get(_key(filepath))
+    if not entry:
+        return False
+    try:
+        st = Path(filepath).stat()
+        if entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+            manifest['skipped'] += 1
+            return True
+        if entry['hash'] == file_hash(filepath):
+            # Touched but identical (e.g. checkout); refresh stat for next time
+            entry['mtime_ns'] = st.st_mtime_ns
+            entry['size'] = st.st_size
+            manifest['skipped'] += 1
+            return True
+    except OSError:
+        return False
+    return False
+
+
+def record(manifest, filepath):
+    """Record filepath's current (post-transform) content hash."""
+    try:
+        st = Path(filepath).stat()
+        manifest['files'][_key(filepath)] = {
+            'hash': file_hash(filepath),
+            'version': manifest['version'],
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+        }
+    except OSError as e:
+        print(f"Error recording {filepath} in manifest: {e}")
+
+
+def save_manifest(manifest):
+    """Write this transform's entries back, preserving other transforms' entries."""
+    manifest_path = Path(manifest['manifest_file'])
+    try:
+        data = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        data = {}
+
+    data[manifest['transform']] = {
+        'version': manifest['version'],
+        'files': manifest['files'],
+    }
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding='utf-8')
+    tmp_path.replace(manifest_path)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Persistent link-status cache for the link checkers.
+Stores status code, final redirect URL, latency, ETag/Last-Modified and the
+time each URL was checked in a local SQLite file (.link_cache.sqlite3).
+URLs are deduplicated before any network call; entries younger than the TTL
+are served from the cache and stale entries are revalidated with conditional
+requests (If-None-Match / If-Modified-Since) where the server gave validators.
+
+Usage:
+    python link_cache.py               # check every affiliate link on the site
+    python link_cache.py --ttl 6       # treat entries older than 6 hours as stale
+    python link_cache.py --fresh       # ignore the cache and recheck everything
+"""
+import sys
+import time
+import sqlite3
+from pathlib import Path
+from collections import defaultdict
+
+from link_checker import check_urls, is_working
+from page_index import build_index
+
+DB_FILE = '.link_cache.sqlite3'
+DEFAULT_TTL_HOURS = 24
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER,
+    final_url TEXT,
+    error TEXT,
+    method TEXT,
+    latency REAL,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at REAL NOT NULL
+)
+'''
+COLUMNS = ['url', 'status_code', 'final_url', 'error', 'method', 'latency',
+           'etag', 'last_modified', 'checked_at']
+
+
+def open_cache(db_path=DB_FILE):
+    """Open (creating if needed) the cache database."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(SCHEMA)
+    return conn
+
+
+def load_entries(conn, urls):
+    """Cached rows for the given URLs as {url: dict}."""
+    entries = {}
+    urls = list(urls)
+    # Stay well under SQLite's bound-parameter limit
+    for i in range(0, len(urls), 500):
+        batch = urls[i:i + 500]
+        placeholders = ','.join('?' * len(batch))
+        rows = conn.execute(f'SELECT {", ".join(COLUMNS)} FROM links WHERE url IN ({placeholders})', batch)
+        for row in rows:
+            entries[row[0]] = dict(zip(COLUMNS, row))
+    return entries
+
+
+def store_results(conn, results, checked_at=None):
+    """Insert or replace result rows."""
+    checked_at = checked_at or time.time()
+    conn.executemany(
+        f'INSERT OR REPLACE INTO links ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})',
+        [
+            (r['url'], r['status_code'], r['final_url'], r['error'], r['method'], r['latency'],
+             r.get('etag'), r.get('last_modified'), r.get('checked_at', checked_at))
+            for r in results
+        ]
+    )
+    conn.commit()
+
+
+def check_urls_cached(urls, ttl_hours=DEFAULT_TTL_HOURS, db_path=DB_FILE, fresh=False, on_result=None):
+    """
+    Like link_checker.check_urls(), but only stale or unknown URLs hit the network.
+    Every result carries 'cached': True when it came from (or was revalidated
+    against) the cache without a full recheck.
+    """
+    urls = list(dict.fromkeys(urls))
+    conn = open_cache(db_path)
+    try:
+        now = time.time()
+        cached = {} if fresh else load_entries(conn, urls)
+        max_age = ttl_hours * 3600
+
+        results = {}
+        stale = []
+        validators = {}
+        for url in urls:
+            entry = cached.get(url)
+            if entry and now - entry['checked_at'] < max_age:
+                results[url] = dict(entry, cached=True)
+                continue
+            stale.append(url)
+            if entry and (entry['etag'] or entry['last_modified']) and entry['status_code'] is not None:
+                validators[url] = {'etag': entry['etag'], 'last_modified': entry['last_modified']}
+
+        if stale:
+            checked = check_urls(stale, validators=validators)
+            to_store = []
+            for url in stale:
+                result = checked[url]
+                if result['status_code'] == 304 and url in cached:
+                    # Not modified: keep the cached outcome, refresh its timestamp
+                    result = dict(cached[url], latency=result['latency'], checked_at=now, cached=True)
+                else:
+                    result = dict(result, checked_at=now, cached=False)
+                results[url] = result
+                to_store.append(result)
+            store_results(conn, to_store, now)
+    finally:
+        conn.close()
+
+    if on_result:
+        for url in urls:
+            on_result(results[url])
+    return {url: results[url] for url in urls}
+
+
+def collect_site_links(root='.'):
+    """Deduplicated affiliate links across every page, with the pages using each."""
+    pages_by_link = defaultdict(set)
+    for path, page in build_index(root).items():
+        for link in page['affiliate_links']:
+            pages_by_link[link].add(path)
+    return pages_by_link
+
+
+def parse_ttl(args):
+    if '--ttl' in args:
+        i = args.index('--ttl')
+        try:
+            return float(args[i + 1])
+        except (IndexError, ValueError):
+            print(f"Invalid --ttl value; using {DEFAULT_TTL_HOURS} hours")
+    return DEFAULT_TTL_HOURS
+
+
+def main():
+    args = sys.argv[1:]
+    ttl = parse_ttl(args)
+    fresh = '--fresh' in args
+
+    print("Collecting affiliate links from the page index...")
+    pages_by_link = collect_site_links()
+    total_refs = sum(len(pages) for pages in pages_by_link.values())
+    print(f"Found {len(pages_by_link)} unique links ({total_refs} page references)")
+
+    started = time.monotonic()
+    results = check_urls_cached(sorted(pages_by_link), ttl_hours=ttl, fresh=fresh)
+    from_cache = sum(1 for r in results.values() if r['cached'])
+    broken = sorted(url for url, r in results.items() if not is_working(r))
+
+    print(f"Checked in {time.monotonic() - started:.1f}s: "
+          f"{len(results) - from_cache} requested, {from_cache} from cache (TTL {ttl:g}h)")
+    print(f"Working: {len(results) - len(broken)}")
+    print(f"Broken: {len(broken)}")
+
+    for url in broken:
+        result = results[url]
+        detail = result['error'] or f"Status {result['status_code']}"
+        print(f"\n{url} - {detail}")
+        for path in sorted(pages_by_link[url]):
+            print(f"    - {path}")
+
+    print(f"\nCache: {Path(DB_FILE).resolve()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Async concurrent link checker shared by check_links.py and test_appsumo_links.py.
+- keep-alive connection pooling with a bounded per-host concurrency limit
+- token-bucket rate limiting per host instead of fixed sleeps
+- HEAD first, falling back to GET when a server rejects or fails HEAD
+- retries with exponential backoff on 429/5xx (honours Retry-After)
+
+Usage:
+    python link_checker.py URL [URL ...]
+    python link_checker.py --rate 5 --per-host 4 tools/foo-review.html
+
+Nothing is specific to the live affiliate host, so check_urls() can be pointed
+at a local stub HTTP server (e.g. http.server on 127.0.0.1) for testing.
+"""
+import re
+import sys
+import time
+import asyncio
+from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
+
+TIMEOUT = 10  # seconds per request
+PER_HOST_LIMIT = 4  # concurrent connections per host
+RATE_PER_HOST = 5.0  # requests per second per host
+BURST = 5  # tokens a host can bank while idle
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds; doubled after each retry
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 501}
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+APPSUMO_DOMAIN = "appsumo.8odi.net"
+APPSUMO_PATTERN = r'https?://' + re.escape(APPSUMO_DOMAIN) + r'/[^\s"\'<>)]+'
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def is_valid_url(url):
+    """Check if a string is a valid http(s) URL."""
+    try:
+        result = urlparse(str(url))
+        return result.scheme in ('http', 'https') and bool(result.netloc)
+    except ValueError:
+        return False
+
+
+def retry_delay(response, attempt):
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff."""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), 60.0)
+    return BACKOFF_BASE * (2 ** attempt)
+
+
+async def _request(session, bucket, method, url, headers=None):
+    """One rate-limited request with retries. Returns (status, final_url, headers)."""
+    for attempt in range(MAX_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            async with session.request(method, url, allow_redirects=True, headers=headers) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    delay = retry_delay(response, attempt)
+                else:
+                    if method == 'GET':
+                        # Drain a little so the connection can go back to the pool
+                        await response.content.read(1024)
+                    return response.status, str(response.url), response.headers
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+            delay = BACKOFF_BASE * (2 ** attempt)
+        await asyncio.sleep(delay)
+
+
+def conditional_headers(validators):
+    """If-None-Match / If-Modified-Since headers from a cached ETag / Last-Modified."""
+    headers = {}
+    if validators and validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators and validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers or None
+
+
+async def check_url(session, buckets, url, rate=RATE_PER_HOST, validators=None):
+    """
+    Check one URL: HEAD, then GET if HEAD is rejected or fails.
+    validators ({'etag', 'last_modified'}) turn it into a conditional request,
+    in which case a 304 status means the cached result is still valid.
+    """
+    result = {'url': url, 'status_code': None, 'final_url': None, 'error': None,
+              'method': None, 'latency': None, 'etag': None, 'last_modified': None}
+    request_headers = conditional_headers(validators)
+    if not is_valid_url(url):
+        result['error'] = "Invalid URL format"
+        return result
+
+    host = urlparse(url).netloc
+    if host not in buckets:
+        buckets[host] = TokenBucket(rate, BURST)
+    bucket = buckets[host]
+    started = time.monotonic()
+
+    for method in ('HEAD', 'GET'):
+        try:
+            status, final_url, headers = await _request(session, bucket, method, url, request_headers)
+        except asyncio.TimeoutError:
+            result['error'] = "Timeout"
+            continue
+        except aiohttp.TooManyRedirects:
+            result['error'] = "Too Many Redirects"
+            continue
+        except aiohttp.ClientConnectionError:
+            result['error'] = "Connection Error"
+            continue
+        except aiohttp.ClientError as e:
+            result['error'] = f"Request Error: {e}"
+            continue
+
+        result.update(status_code=status, final_url=final_url, error=None, method=method,
+                      etag=headers.get('ETag'), last_modified=headers.get('Last-Modified'))
+        if method == 'HEAD' and status in HEAD_FALLBACK_STATUSES:
+            continue
+        break
+
+    result['latency'] = round(time.monotonic() - started, 3)
+    return result
+
+
+async def check_urls_async(urls, per_host=PER_HOST_LIMIT, rate=RATE_PER_HOST, timeout=TIMEOUT,
+                           on_result=None, validators=None):
+    """
+    Check all URLs concurrently. Returns {url: result} in input order.
+    validators optionally maps url -> {'etag', 'last_modified'} for revalidation.
+    """
+    validators = validators or {}
+    urls = list(dict.fromkeys(urls))  # dedupe, keep order
+    connector = aiohttp.TCPConnector(limit_per_host=per_host, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    buckets = {}
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers=HEADERS) as session:
+        async def run(url):
+            result = await check_url(session, buckets, url, rate, validators.get(url))
+            if on_result:
+                on_result(result)
+            return result
+
+        results = await asyncio.gather(*(run(url) for url in urls))
+    return {r['url']: r for r in results}
+
+
+def check_urls(urls, per_host=PER_HOST_LIMIT, rate=RATE_PER_HOST, timeout=TIMEOUT, on_result=None,
+               validators=None):
+    """Blocking wrapper around check_urls_async() for the sync scripts."""
+    return asyncio.run(check_urls_async(urls, per_host, rate, timeout, on_result, validators))
+
+
+def is_working(result):
+    """2xx and 3xx count as working (same rule as test_appsumo_links.py)."""
+    return result['status_code'] is not None and result['status_code'] < 400
+
+
+def extract_appsumo_links(content):
+    """All AppSumo affiliate links in a page, trailing punctuation stripped."""
+    return {m.rstrip('.,;:!?)') for m in re.findall(APPSUMO_PATTERN, content)}
+
+
+def main():
+    args = sys.argv[1:]
+    per_host = PER_HOST_LIMIT
+    rate = RATE_PER_HOST
+    for flag in ('--rate', '--per-host'):
+        if flag in args:
+            i = args.index(flag)
+            value = float(args[i + 1])
+            del args[i:i + 2]
+            if flag == '--rate':
+                rate = value
+            else:
+                per_host = int(value)
+
+    urls = []
+    for arg in args:
+        if is_valid_url(arg):
+            urls.append(arg)
+        elif Path(arg).is_file():
+            urls.extend(sorted(extract_appsumo_links(Path(arg).read_text(encoding='utf-8', errors='ignore'))))
+        else:
+            print(f"Skipping '{arg}': not a URL or file")
+
+    if not urls:
+        print("Usage: python link_checker.py [--rate N] [--per-host N] URL|FILE ...")
+        sys.exit(1)
+
+    def show(result):
+        mark = "[OK]" if is_working(result) else "[X]"
+        detail = result['error'] or f"Status: {result['status_code']} via {result['method']}"
+        print(f"{mark} {result['url']} - {detail}")
+
+    started = time.monotonic()
+    results = check_urls(urls, per_host=per_host, rate=rate, on_result=show)
+    broken = [r for r in results.values() if not is_working(r)]
+    print(f"\nChecked {len(results)} links in {time.monotonic() - started:.1f}s: "
+          f"{len(results) - len(broken)} working, {len(broken)} broken")
+
+
+if __name__ == '__main__':
+    main()
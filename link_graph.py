@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Whole-site internal link graph and broken-link report.
+
+Builds the href graph of every page from the page index (page_index.py keeps
+each page's internal hrefs, so an unchanged tree is not re-read), resolves
+relative, root-relative and absolute https://artificial.one links to files,
+and reports:
+
+- dangling links: hrefs whose target page or asset does not exist
+- orphan pages: pages no other page links to
+- near-duplicate pages: pages in the same directory whose slugs differ by one
+  character (blog-kingsumo / blog-kingumo / blog-kingsmo) and that are about
+  the same product, with the one to keep and the ones to redirect to it.
+  Titles are compared with the product names taken out, and the product has
+  to agree: same name in the title or h1, or a shared affiliate link
+  (blog-vanchat / blog-anychat share a template, not a product). The page to
+  keep is the one under the catalog's slug for the product; inbound links
+  only break ties
+
+Links that are only built at runtime are read from the data they are built
+from: the review cards of reviews.html (data/reviews/*.json 'review') and the
+blog listings (data/blog/*.json 'href'). The hardcoded RELATED_TOOLS_MAP paths
+are resolved relative to tools/ like the sections they generate.
+
+Usage:
+    python link_graph.py           # print the report
+    python link_graph.py --all     # list every entry instead of the first 20
+"""
+import re
+import sys
+import json
+import time
+import difflib
+import posixpath
+from itertools import combinations
+from pathlib import Path
+from urllib.parse import unquote
+
+from catalog import compile_catalog
+from page_index import SITE_URL, build_index, internal_links
+
+LIMIT = 20
+MIN_SLUG = 5  # shorter slugs are too close to each other to mean anything
+TITLE_SIMILARITY = 0.6  # titles with the product names taken out
+NAME_SIMILARITY = 0.75  # how close a title's words must be to the slug to name the product
+NAME_TOKENS = 3
+NOT_ORPHANS = {'index.html', '404.html'}
+DIGITS_RE = re.compile(r'\d')
+WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def resolve(href, source):
+    """
+    Site path (relative to the root, POSIX) an href on page source points to,
+    or None for links that cannot be resolved statically.
+    """
+    if href.startswith(SITE_URL):
+        href = href[len(SITE_URL):] or '/'
+    if '${' in href or '{' in href:
+        # Template literal in inline JS, built at runtime
+        return None
+    path = unquote(href.split('#', 1)[0].split('?', 1)[0])
+    if not path:
+        return None
+    if path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/') or '.')
+    else:
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+    if target == '.':
+        target = ''
+    if target.startswith('..'):
+        return target  # climbs out of the site: always dangling
+    if path.endswith('/') or target == '':
+        target = posixpath.join(target, 'index.html')
+    return target
+
+
+def data_links(root):
+    """{page: [href]} for links built at runtime from JSON shards."""
+    root = Path(root)
+    links = {}
+    for shard in sorted((root / 'data' / 'reviews').glob('*.json')):
+        for card in json.loads(shard.read_text(encoding='utf-8')):
+            if card.get('review'):
+                links.setdefault('reviews.html', []).append('/' + card['review'])
+    for shard in sorted((root / 'data' / 'blog').glob('*.json')):
+        feed = json.loads(shard.read_text(encoding='utf-8'))
+        page = 'blog.html' if feed['listing'] == 'all' else f"blog/{feed['listing']}.html"
+        links.setdefault(page, []).extend('/' + item['href'] for item in feed['items'])
+    return links
+
+
+def related_map_links():
+    """{tool slug: [href relative to tools/]} from RELATED_TOOLS_MAP."""
+    from add_related_tools_sections import RELATED_TOOLS_MAP
+    links = {}
+    for slug, data in RELATED_TOOLS_MAP.items():
+        hrefs = [link for link, _ in data.get('similar', []) + data.get('lifetime', [])]
+        if data.get('comparison'):
+            hrefs.append(f"../compare/{data['comparison']}")
+        if data.get('category'):
+            hrefs.append(f"../category/{data['category']}.html")
+        links[slug] = hrefs
+    return links
+
+
+def build_graph(root='.'):
+    """
+    Return (index, outbound {page: {target}}, dangling {target: [source]}).
+    Targets that exist but are not pages (images, PDFs) only count as resolved.
+    """
+    root = Path(root)
+    index = build_index(root)
+    extra = data_links(root)
+    outbound = {page: set() for page in index}
+    dangling = {}
+    exists = {}
+
+    for page in sorted(set(index) | set(extra)):
+        hrefs = index[page]['links'] if page in index else []
+        if page in extra:
+            hrefs = hrefs + internal_links(extra[page])
+        for href in hrefs:
+            target = resolve(href, page)
+            if target is None:
+                continue
+            if target in index:
+                if target != page:
+                    outbound.setdefault(page, set()).add(target)
+                continue
+            if target not in exists:
+                exists[target] = not target.startswith('..') and (root / target).is_file()
+            if not exists[target]:
+                dangling.setdefault(target, []).append(page)
+
+    for slug, hrefs in related_map_links().items():
+        for href in hrefs:
+            target = resolve(href, 'tools/')
+            if target is not None and target not in index and not (root / target).is_file():
+                dangling.setdefault(target, []).append(f'RELATED_TOOLS_MAP[{slug!r}]')
+    return index, outbound, dangling
+
+
+def inbound_counts(outbound):
+    counts = {}
+    for targets in outbound.values():
+        for target in targets:
+            counts[target] = counts.get(target, 0) + 1
+    return counts
+
+
+def slug_of(page):
+    """(directory, slug) with the naming boilerplate removed."""
+    directory, name = posixpath.split(page)
+    stem = name.rsplit('.', 1)[0]
+    for prefix in ('blog-', 'comparison-'):
+        if stem.startswith(prefix):
+            stem = stem[len(prefix):]
+    if stem.endswith('-review'):
+        stem = stem[:-len('-review')]
+    return directory, stem
+
+
+def product_name(text, slug):
+    """
+    (compact product name, text without it) for a title or h1: the run of up
+    to NAME_TOKENS words closest to the page's slug, or (None, text) if no run
+    is close enough. "How KingSumo Solved ..." on blog-kingumo gives
+    ('kingsumo', 'how solved ...').
+    """
+    words = WORD_RE.findall((text or '').lower())
+    target = slug.replace('-', '')
+    runs = [(difflib.SequenceMatcher(None, ''.join(words[i:j]), target).ratio(), i, j)
+            for i in range(len(words)) for j in range(i + 1, min(i + NAME_TOKENS, len(words)) + 1)]
+    ratio, i, j = max(runs, key=lambda run: run[0], default=(0, 0, 0))
+    if ratio < NAME_SIMILARITY:
+        return None, ' '.join(words)
+    return ''.join(words[i:j]), ' '.join(words[:i] + words[j:])
+
+
+def same_product(a, b, index):
+    """
+    True if pages a and b are about the same product: the titles match once
+    the product names are taken out (the titles are templated, so that alone
+    only says the pages are the same kind), and either the names agree or the
+    pages share an affiliate link.
+    """
+    (name_a, template_a), (name_b, template_b) = (product_name(index[p]['title'], slug_of(p)[1]) for p in (a, b))
+    if difflib.SequenceMatcher(None, template_a, template_b).ratio() < TITLE_SIMILARITY:
+        return False
+    if set(index[a]['affiliate_links']) & set(index[b]['affiliate_links']):
+        return True
+    if name_a and name_a == name_b:
+        return True
+    h1_a, h1_b = (product_name(index[p]['h1'], slug_of(p)[1])[0] for p in (a, b))
+    return bool(h1_a) and h1_a == h1_b
+
+
+def product_slugs(root='.'):
+    """Review slugs of the catalog's listed and tracked tools (not of pages that only exist)."""
+    return {tool.slug for tool in compile_catalog(root) if set(tool.sources) - {'page'}}
+
+
+def near_duplicates(index, inbound, products=()):
+    """
+    Groups of same-directory pages whose slugs are at most one edit apart and
+    that are about the same product (same_product). Candidates come from a
+    deletion index: two slugs within one substitution, insertion or deletion
+    share a one-character-deleted variant, so only pages sharing a key are
+    compared.
+
+    The page to keep is the one whose slug is a catalog product (products),
+    then the one with the most inbound links.
+    """
+    keys = {}
+    for page in index:
+        directory, slug = slug_of(page)
+        if len(slug) < MIN_SLUG or slug.isdigit():
+            continue
+        for i in range(len(slug) + 1):
+            variant = slug[:i] + slug[i + 1:] if i < len(slug) else slug
+            keys.setdefault((directory, variant), set()).add(page)
+
+    # Union the matching pairs into groups
+    parent = {}
+
+    def find(page):
+        while parent.get(page, page) != page:
+            page = parent[page]
+        return page
+
+    compared = set()
+    for pages in keys.values():
+        for pair in combinations(sorted(pages), 2):
+            if pair in compared:
+                continue
+            compared.add(pair)
+            a, b = (slug_of(page)[1] for page in pair)
+            if DIGITS_RE.sub('', a) == DIGITS_RE.sub('', b):
+                continue  # numbered series (part-1 / part-2, 2025 / 2026)
+            if not same_product(*pair, index):
+                continue
+            parent[find(pair[1])] = find(pair[0])
+
+    groups = {}
+    for page in parent:
+        groups.setdefault(find(page), set()).add(page)
+    for root_page in list(groups):
+        groups[root_page].add(root_page)
+
+    result = []
+    for pages in groups.values():
+        ranked = sorted(pages, key=lambda p: (slug_of(p)[1] not in products, -inbound.get(p, 0), len(p), p))
+        result.append((ranked[0], ranked[1:]))
+    return sorted(result)
+
+
+def print_list(items, show_all):
+    for item in items if show_all else items[:LIMIT]:
+        print(f"  {item}")
+    if not show_all and len(items) > LIMIT:
+        print(f"  ... and {len(items) - LIMIT} more (--all to list them)")
+
+
+def main():
+    show_all = '--all' in sys.argv[1:]
+    started = time.perf_counter()
+    index, outbound, dangling = build_graph('.')
+    inbound = inbound_counts(outbound)
+    orphans = sorted(p for p in index if not inbound.get(p) and p not in NOT_ORPHANS)
+    duplicates = near_duplicates(index, inbound, product_slugs('.'))
+    elapsed = time.perf_counter() - started
+
+    edges = sum(len(targets) for targets in outbound.values())
+    print(f"Link graph: {len(index)} pages, {edges} internal links ({elapsed:.2f}s)")
+
+    print(f"\nDangling links: {len(dangling)} missing target(s), "
+          f"{sum(len(s) for s in dangling.values())} link(s)")
+    print_list([
+        f"{target}  <- {len(sources)} page(s): {', '.join(sorted(sources)[:3])}"
+        f"{' ...' if len(sources) > 3 else ''}"
+        for target, sources in sorted(dangling.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+    ], show_all)
+
+    print(f"\nOrphan pages (no inbound links): {len(orphans)}")
+    print_list(orphans, show_all)
+
+    print(f"\nNear-duplicate pages: {len(duplicates)} group(s)")
+    print_list([
+        f"keep {keeper} ({inbound.get(keeper, 0)} inbound); redirect "
+        + ', '.join(f"{p} ({inbound.get(p, 0)})" for p in others)
+        for keeper, others in duplicates
+    ], show_all)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compiled affiliate-link rewrite engine for update_appsumo_links.py.
+
+Every tracked product name and slug is compiled into a prefix trie and emitted
+as a single regex, together with the affiliate URL pattern and the `name: "`
+marker that opens a tool object (a JS literal, or `"name": "` in
+reviews_data.json). Each page is scanned once, left to right, and every
+affiliate URL is then resolved against the products mentioned on it. The cost
+per page stays linear in the page size as the tracker grows into thousands of
+deals, instead of one regex pass per pattern.
+
+Resolution rules for each affiliate URL found:
+1. Inside a tool object (`name: "X", ... link: "URL"`) only the declared
+   name counts (via the resolve fallback when it is not an exact match).
+2. Elsewhere, a link is pointed at the page's subject (its most-mentioned
+   product) when the subject is mentioned in the preceding CONTEXT_WINDOW
+   chars and the link's current owner is not mentioned anywhere on the page.
+   Links to tools a roundup or comparison also covers are left alone.
+"""
+import re
+from bisect import bisect_right
+from collections import defaultdict
+
+from edit_buffer import EditBuffer
+
+APPSUMO_DOMAIN = "appsumo.8odi.net"
+CONTEXT_WINDOW = 500  # chars searched backwards for a product mention
+
+
+def trie_regex(words):
+    """
+    Compile words into one regex shaped like their prefix trie, e.g.
+    ['kingsumo', 'kingsmo'] -> 'kings(?:umo|mo)'. Matching a position walks
+    at most one trie path, so the cost does not grow with the word count.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end of word
+
+    def emit(node):
+        ends = '' in node
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends:
+            # Greedy optional: the longest name wins, shorter ones on backtrack
+            body = '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+def build_rewrite_engine(product_links, resolve=None):
+    """
+    Compile product_links ({normalized_name: {'original_name', 'link', 'slug'?}})
+    into a rewrite engine. resolve(name) -> normalized name or None is consulted
+    for tool objects whose declared name is not an exact product match.
+    """
+    aliases = {}
+    for key, data in product_links.items():
+        aliases.setdefault(key, key)
+        if data.get('slug'):
+            aliases.setdefault(data['slug'].lower(), key)
+
+    pattern = (
+        r'(?P<url>https?://' + re.escape(APPSUMO_DOMAIN) + r'/[^\s"\'<>)]+)'
+        r'|(?P<marker>"?name"?:\s*")'
+        r'|(?P<close>\})'
+        r'|(?<![^\W_])(?P<product>' + trie_regex(aliases) + r')(?![^\W_])'
+    )
+    return {
+        # Scanning a lowercased copy is ~2x faster than re.IGNORECASE
+        'scanner': re.compile(pattern),
+        'scanner_ci': re.compile(pattern, re.IGNORECASE),
+        'aliases': aliases,
+        'products': product_links,
+        'link_owners': {data['link']: key for key, data in reversed(list(product_links.items()))},
+        'resolve': resolve,
+    }
+
+
+def rewrite_links(content, engine):
+    """
+    Rewrite outdated affiliate links in one scan (plus a pass over the hits).
+    Returns (new_content, changes); changes is the per-link change log
+    [{'product', 'old_link', 'new_link', 'offset'}] in page order.
+    """
+    products = engine['products']
+    aliases = engine['aliases']
+    link_owners = engine['link_owners']
+
+    lowered = content.lower()
+    if APPSUMO_DOMAIN not in lowered:
+        return content, []
+    # Offsets only line up with the original if lowercasing kept the length
+    if len(lowered) == len(content):
+        text, scanner = lowered, engine['scanner']
+    else:
+        text, scanner = content, engine['scanner_ci']
+
+    in_object = False  # between `name: "` and the closing brace
+    declared = None  # product named by the current tool object
+    marker_end = -1
+    mentions = defaultdict(list)  # product key -> end offsets, outside tool objects
+    links = []  # (start, old_link, product key from a tool object or None, in_object)
+
+    for match in scanner.finditer(text):
+        kind = match.lastgroup
+        if kind == 'marker':
+            in_object, declared, marker_end = True, None, match.end()
+        elif kind == 'close':
+            in_object, declared = False, None
+        elif kind == 'product':
+            key = aliases[match.group().lower()]
+            if not in_object:
+                mentions[key].append(match.end())
+            elif match.start() == marker_end and text[match.end():match.end() + 1] == '"':
+                declared = key
+        else:
+            old_link = content[match.start():match.end()].rstrip('.,;:!?')
+            target = declared
+            if in_object and target is None and engine['resolve']:
+                name_end = content.find('"', marker_end)
+                if name_end != -1:
+                    target = engine['resolve'](content[marker_end:name_end])
+            links.append((match.start(), old_link, target, in_object))
+
+    subject = max(mentions, key=lambda k: len(mentions[k])) if mentions else None
+
+    buffer = EditBuffer(content)
+    for url_start, old_link, target, in_object in links:
+        if not in_object:
+            if subject is None or link_owners.get(old_link) in mentions:
+                continue
+            # Subject must be mentioned within CONTEXT_WINDOW before the link
+            ends = mentions[subject]
+            i = bisect_right(ends, url_start)
+            if not i or url_start - ends[i - 1] > CONTEXT_WINDOW:
+                continue
+            target = subject
+        if target is None:
+            continue
+
+        new_link = products[target]['link']
+        if new_link == old_link:
+            continue
+        buffer.replace(url_start, url_start + len(old_link), new_link,
+                       product=products[target]['original_name'])
+
+    changes = [
+        {'product': c['product'], 'old_link': c['old'], 'new_link': c['new'], 'offset': c['start']}
+        for c in buffer.changes
+    ]
+    return buffer.apply(), changes
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Conservative HTML, CSS and JS minifiers for the publish stage.
+
+Only whitespace and comments are removed, never anything the page depends on.
+This is a text pass, not a rewrite:
+
+- HTML: comments are dropped (conditional comments kept), runs of whitespace
+  between tags and in text collapse to one space or newline, and whitespace
+  next to tags that never render (head elements, <br>) is removed.
+  Whitespace inside tags is collapsed outside attribute values.
+  <pre> and <textarea> are copied as they are.
+- <style> and .css: comments and whitespace around { } ; , > and after :
+  are removed; strings are left alone.
+- <script>: a small lexer that knows strings, template literals (with nested
+  ${...}), regex literals and comments. Comments go, and whitespace shrinks to
+  what separates tokens. A newline is kept wherever automatic semicolon
+  insertion could depend on it. Scripts with a non-JS type (text/babel, ...)
+  are copied as they are.
+- JSON-LD and other JSON scripts: whitespace outside strings is removed,
+  and only if the result parses to the same data.
+
+Usage:
+    from minify import minify_html, minify_css, minify_js
+    python minify.py blog.html     # print the size before and after
+"""
+import re
+import sys
+import json
+
+HTML_SPACE = ' \t\n\r\f'
+TOKEN_RE = re.compile(
+    r'(?P<comment><!--.*?-->)'
+    r'|(?P<raw><(?P<raw_name>script|style|pre|textarea)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)(?P<body>.*?)(?P<close></(?P=raw_name)\s*>)'
+    r'|(?P<tag><!(?:[^>"\']|"[^"]*"|\'[^\']*\')*>|</?(?P<name>[A-Za-z][\w:-]*)(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)',
+    re.DOTALL | re.IGNORECASE,
+)
+TAG_SPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+TAG_END_SPACE_RE = re.compile(r'\s+(/?>)$')
+TYPE_RE = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+TEXT_SPACE_RE = re.compile(f'[{HTML_SPACE}]+')
+# Whitespace next to these is never rendered (<script> is not here: dropping the
+# space on both sides of one would join the words around it)
+SILENT_TAGS = {'!doctype', 'html', 'head', 'body', 'meta', 'link', 'title', 'base', 'br'}
+JS_TYPES = {'', 'text/javascript', 'application/javascript', 'module'}
+JSON_TYPES = {'application/ld+json', 'application/json'}
+
+CSS_TOKEN_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+JSON_SPACE_RE = re.compile(r'("(?:\\.|[^"\\])*")|\s+')
+
+JS_SPACE = ' \t\n\r\f\v\u00a0\ufeff\u2028\u2029'
+JS_NEWLINES = '\n\r\u2028\u2029'
+JS_WORD_RE = re.compile(r'(?:[\w$]|[^\x00-\x7f\s\ufeff])+')
+# A newline after/before these can go without changing where ASI applies
+SAFE_BEFORE_NEWLINE = set(';{(,[=:?&|*%<>!~^')
+SAFE_AFTER_NEWLINE = set(';})],.=:?&|*%<>^')
+REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^}')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void',
+                  'throw', 'instanceof', 'yield', 'await'}
+
+
+# --- CSS ---------------------------------------------------------------------
+
+def _squeeze_css(code):
+    code = CSS_PUNCT_RE.sub(r'\1', re.sub(r'\s+', ' ', code))
+    return re.sub(r':\s+', ':', code).replace(';}', '}')
+
+
+def minify_css(css):
+    """CSS without comments and without whitespace that separates nothing."""
+    pieces, code, pos = [], [], 0
+    for m in CSS_TOKEN_RE.finditer(css):
+        code.append(css[pos:m.start()])
+        pos = m.end()
+        if m.group(1):
+            pieces.extend((_squeeze_css(''.join(code)), m.group(1)))
+            code = []
+        elif not m.group(0).startswith('/*'):
+            code.append(' ')
+    code.append(css[pos:])
+    pieces.append(_squeeze_css(''.join(code)))
+    return ''.join(pieces).strip()
+
+
+# --- JS ----------------------------------------------------------------------
+
+def _is_word(ch):
+    return ch.isalnum() or ch in '_$' or ord(ch) > 127
+
+
+def _scan_string(js, i):
+    quote = js[i]
+    i += 1
+    while i < len(js):
+        if js[i] == '\\':
+            i += 2
+            continue
+        if js[i] == quote or js[i] == '\n':
+            return i + 1
+        i += 1
+    return len(js)
+
+
+def _scan_template(js, i):
+    """End of a template literal chunk starting at i (` or }), and whether it opened ${."""
+    i += 1
+    while i < len(js):
+        if js[i] == '\\':
+            i += 2
+        elif js[i] == '`':
+            return i + 1, False
+        elif js.startswith('${', i):
+            return i + 2, True
+        else:
+            i += 1
+    return len(js), False
+
+
+def _scan_regex(js, i):
+    """End of a regex literal starting at i, or None if there is none."""
+    in_class = False
+    j = i + 1
+    while j < len(js):
+        ch = js[j]
+        if ch == '\\':
+            j += 2
+            continue
+        if ch in JS_NEWLINES:
+            return None
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            j += 1
+            while j < len(js) and _is_word(js[j]):
+                j += 1  # flags
+            return j
+        j += 1
+    return None
+
+
+def minify_js(js):
+    """JS without comments and without whitespace that does not separate tokens."""
+    out = []
+    gap = ''      # whitespace since the last token: '', ' ' or '\n'
+    prev = ''     # last significant token, to tell a regex from a division
+    braces = []   # brace depth inside each open template ${
+    depth = 0
+    i, n = 0, len(js)
+
+    def emit(token):
+        nonlocal gap
+        if gap and out:
+            last, first = out[-1][-1], token[0]
+            joined = (
+                (_is_word(last) and _is_word(first))
+                or (last == first and last in '+-')
+                or (last == '/' and first in '/*')
+                or (first == '.' and out[-1].isdigit())
+            )
+            if gap == '\n' and last not in SAFE_BEFORE_NEWLINE and first not in SAFE_AFTER_NEWLINE:
+                out.append('\n')
+            elif joined:
+                out.append(' ')
+        gap = ''
+        out.append(token)
+
+    while i < n:
+        ch = js[i]
+        if ch in JS_SPACE:
+            j = i
+            while j < n and js[j] in JS_SPACE:
+                j += 1
+            if any(c in JS_NEWLINES for c in js[i:j]):
+                gap = '\n'
+            else:
+                gap = gap or ' '
+            i = j
+        elif js.startswith('//', i):
+            j = i
+            while j < n and js[j] not in JS_NEWLINES:
+                j += 1
+            gap = gap or ' '
+            i = j
+        elif js.startswith('/*', i):
+            j = js.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            gap = '\n' if any(c in JS_NEWLINES for c in js[i:j]) else gap or ' '
+            i = j
+        elif ch in '"\'':
+            j = _scan_string(js, i)
+            emit(js[i:j])
+            prev, i = '"', j
+        elif ch == '`' or (ch == '}' and braces and depth == 0):
+            if ch == '}':
+                depth = braces.pop()
+            j, opened = _scan_template(js, i)
+            emit(js[i:j])
+            if opened:
+                braces.append(depth)
+                depth = 0
+                prev = '{'
+            else:
+                prev = '"'
+            i = j
+        elif ch == '/' and (prev == '' or prev in REGEX_AFTER or prev in REGEX_KEYWORDS) \
+                and _scan_regex(js, i) is not None:
+            j = _scan_regex(js, i)
+            emit(js[i:j])
+            prev, i = '/re/', j
+        else:
+            m = JS_WORD_RE.match(js, i)
+            if m:
+                emit(m.group(0))
+                prev, i = m.group(0), m.end()
+                continue
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+            emit(ch)
+            prev, i = ch, i + 1
+    return ''.join(out)
+
+
+def minify_json(text):
+    """JSON without insignificant whitespace; text as it is if it does not parse."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    compact = JSON_SPACE_RE.sub(lambda m: m.group(1) or '', text)
+    try:
+        if json.loads(compact) != data:
+            return text
+    except ValueError:
+        return text
+    return compact
+
+
+# --- HTML --------------------------------------------------------------------
+
+def _minify_tag(tag):
+    tag = TAG_SPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+    return TAG_END_SPACE_RE.sub(r'\1', tag)
+
+
+def _minify_raw(m):
+    open_tag, body, close = _minify_tag(m.group('raw')), m.group('body'), m.group('close')
+    name = m.group('raw_name').lower()
+    if name in ('pre', 'textarea'):
+        return m.group(0)
+    if name == 'style':
+        return open_tag + minify_css(body) + close
+    kind = TYPE_RE.search(open_tag)
+    kind = kind.group(1).lower() if kind else ''
+    if kind in JSON_TYPES:
+        return open_tag + minify_json(body.strip()) + close
+    if kind in JS_TYPES and body.strip():
+        return open_tag + minify_js(body) + close
+    return open_tag + body + close
+
+
+def _tag_name(m):
+    if m.group('raw'):
+        return m.group('raw_name').lower()
+    if m.group('name'):
+        return m.group('name').lower()
+    return '!doctype' if m.group('tag').lower().startswith('<!doctype') else ''
+
+
+def minify_html(html):
+    """The page with comments and redundant whitespace removed."""
+    items = []  # [text, tag name or None for text]
+    pos = 0
+    for m in TOKEN_RE.finditer(html):
+        if m.start() > pos:
+            items.append([html[pos:m.start()], None])
+        pos = m.end()
+        if m.group('comment'):
+            if m.group('comment').startswith(('<!--[if', '<!--<![endif]')):
+                items.append([m.group('comment'), ''])
+            continue
+        if m.group('raw'):
+            items.append([_minify_raw(m), _tag_name(m)])
+        else:
+            items.append([_minify_tag(m.group('tag')), _tag_name(m)])
+    if pos < len(html):
+        items.append([html[pos:], None])
+
+    # Merge text left next to text by dropped comments
+    merged = []
+    for item in items:
+        if item[1] is None and merged and merged[-1][1] is None:
+            merged[-1][0] += item[0]
+        else:
+            merged.append(item)
+
+    out = []
+    for i, (text, name) in enumerate(merged):
+        if name is not None:
+            out.append(text)
+            continue
+        if not text.strip(HTML_SPACE):
+            before = merged[i - 1][1] if i else '!doctype'
+            after = merged[i + 1][1] if i + 1 < len(merged) else 'html'
+            if before in SILENT_TAGS or after in SILENT_TAGS:
+                continue
+        out.append(TEXT_SPACE_RE.sub(lambda s: '\n' if '\n' in s.group(0) else ' ', text))
+    return ''.join(out).strip(HTML_SPACE)
+
+
+def main():
+    for path in sys.argv[1:]:
+        with open(path, encoding='utf-8', errors='surrogateescape') as f:
+            html = f.read()
+        small = minify_html(html)
+        before, after = len(html.encode('utf-8', 'surrogateescape')), len(small.encode('utf-8', 'surrogateescape'))
+        print(f"{path}: {before:,} -> {after:,} bytes ({100 - after * 100 / before:.1f}% smaller)")
+
+
+if __name__ == '__main__':
+    main()
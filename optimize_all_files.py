@@ -10,8 +10,11 @@ Script to optimize all HTML review files with:
 
 import os
 import re
+from html import escape
 from pathlib import Path
 
+from templates import render
+
 def get_template_content():
     """Get the base template from triplo-ai-review.html"""
     template_path = Path('tools/triplo-ai-review.html')
@@ -212,7 +215,7 @@ def create_optimized_html(filepath, info):
     return html
 
 def create_fallback_html(filepath, info, title, meta_desc, color1, color2):
-    """Create HTML from scratch if template not available"""
+    """Create HTML from scratch (templates/layouts/lifetime_review.tmpl) if template not available"""
     product = info.get('product', 'Product')
     rating = info.get('rating', '4.5')
     price = info.get('price', '69')
@@ -227,229 +230,13 @@ def create_fallback_html(filepath, info, title, meta_desc, color1, color2):
         if nav_match:
             nav_content = nav_match.group(1)
     
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <meta name="description" content="{meta_desc}">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 900px; margin: 0 auto; padding: 20px; }}
-        header {{ background: linear-gradient(135deg, {color1} 0%, {color2} 100%); color: white; padding: 60px 20px; text-align: center; }}
-        h1 {{ font-size: 2.2em; margin-bottom: 15px; }}
-        .rating-box {{ background: white; color: #333; padding: 20px; border-radius: 10px; display: inline-block; margin-top: 20px; }}
-        .rating {{ font-size: 2em; color: #ffa500; }}
-        .score {{ font-size: 2.5em; font-weight: 700; color: {color1}; }}
-        .quick-verdict {{ background: #f0f7ff; padding: 30px; border-radius: 10px; margin: 30px 0; border-left: 4px solid {color1}; }}
-        .pros-cons {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 30px 0; }}
-        .pros {{ background: #f0fdf4; padding: 20px; border-radius: 10px; border-left: 4px solid #10b981; }}
-        .cons {{ background: #fef2f2; padding: 20px; border-radius: 10px; border-left: 4px solid #ef4444; }}
-        .cta-box {{ background: linear-gradient(135deg, {color1} 0%, {color2} 100%); color: white; padding: 40px; border-radius: 10px; text-align: center; margin: 40px 0; }}
-        .cta-box h2 {{ margin-bottom: 15px; }}
-        .btn {{ display: inline-block; background: white; color: {color1}; padding: 15px 40px; border-radius: 5px; text-decoration: none; font-weight: 700; font-size: 1.1em; margin-top: 15px; }}
-        .btn:hover {{ background: #f0f0f0; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e0e0e0; }}
-        th {{ background: #f9f9f9; font-weight: 600; }}
-        ul {{ margin-left: 20px; line-height: 1.8; }}
-        h2 {{ color: {color1}; margin: 40px 0 20px; font-size: 1.8em; }}
-        h3 {{ color: #333; margin: 25px 0 15px; font-size: 1.3em; }}
-        footer {{ background: #333; color: white; text-align: center; padding: 20px; margin-top: 60px; }}
-    </style>
-</head>
-<body>
-{nav_content if nav_content else ''}
-
-<style>
-.dropdown:hover .dropdown-content {{ display: block !important; }}
-.hidden {{ display: none !important; }}
-@media (max-width: 768px) {{
-    #desktop-nav {{ display: none !important; }}
-    #mobile-menu-btn {{ display: block !important; }}
-}}
-</style>
-
-    <header>
-        <div class="container">
-            <h1>{product} Review: Complete Guide</h1>
-            <p style="font-size: 1.2em; margin: 15px 0;">Get lifetime access with exclusive AppSumo deal</p>
-            <div class="rating-box">
-                <div class="rating">⭐⭐⭐⭐⭐</div>
-                <div class="score">{rating}/5</div>
-                <p style="margin-top: 10px;">Based on verified reviews</p>
-            </div>
-        </div>
-    </header>
-
-    <div class="container">
-        <section>
-            <p style="font-size: 1.2em; line-height: 1.8; margin-bottom: 30px;">
-                <strong>{product} is a powerful tool that helps you achieve your goals.</strong> Get lifetime access for ${price} via the <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">AppSumo lifetime deal</a>.
-            </p>
-        </section>
-
-        <div class="quick-verdict">
-            <h2 style="margin-top: 0; color: {color1};">Quick Verdict</h2>
-            <p style="font-size: 1.1em; line-height: 1.8;">
-                <strong>{product} is worth the investment.</strong> At ${price} lifetime, it provides excellent value compared to monthly subscriptions. Highly recommended for anyone who needs this type of tool.
-            </p>
-        </div>
-
-        <section>
-            <h2>What is {product}?</h2>
-            <p>
-                {product} is a comprehensive tool designed to help you succeed. It offers powerful features and capabilities that make it an essential tool for your workflow.
-            </p>
-            <p style="margin-top: 15px;">
-                Get lifetime access with the <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">exclusive AppSumo lifetime deal here →</a>
-            </p>
-        </section>
-
-        <section>
-            <h2>Pricing: Lifetime Deal vs Subscription</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Option</th>
-                        <th>Price</th>
-                        <th>Cost Over 3 Years</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td><strong>Lifetime Deal (via AppSumo)</strong></td>
-                        <td>${price} one-time</td>
-                        <td>${price}</td>
-                    </tr>
-                    <tr>
-                        <td>Regular Subscription</td>
-                        <td>$29/month ($348/year)</td>
-                        <td>$1,044</td>
-                    </tr>
-                    <tr style="background: #f0fdf4;">
-                        <td colspan="2"><strong>Lifetime Deal Savings</strong></td>
-                        <td><strong>$975+ (93% off)</strong></td>
-                    </tr>
-                </tbody>
-            </table>
-            <p style="margin-top: 15px;">
-                <strong>Bottom line:</strong> The lifetime deal breaks even quickly. If you use {product} for 2+ years, you save hundreds of dollars. <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">Claim your ${price} lifetime deal on AppSumo →</a>
-            </p>
-        </section>
-
-        <section>
-            <h2>Key Features</h2>
-            <ul>
-'''
-    
-    for feature in features[:8]:
-        html += f'                <li><strong>{feature}:</strong> Powerful feature that helps you succeed</li>\n'
-    
-    html += '''            </ul>
-        </section>
-
-        <section>
-            <h2>Pros and Cons</h2>
-            <div class="pros-cons">
-                <div class="pros">
-                    <h3>✅ Pros</h3>
-                    <ul>
-                        <li>Lifetime access, no monthly fees</li>
-                        <li>All premium features included</li>
-                        <li>Great value for money</li>
-                        <li>Regular updates included</li>
-                        <li>Excellent customer support</li>
-                    </ul>
-                </div>
-                <div class="cons">
-                    <h3>❌ Cons</h3>
-                    <ul>
-                        <li>Learning curve for new users</li>
-                        <li>Some advanced features may require setup</li>
-                        <li>Requires active internet connection</li>
-                    </ul>
-                </div>
-            </div>
-        </section>
-
-        <section>
-            <h2>Who Should Buy This?</h2>
-            <p style="font-size: 1.1em; margin-bottom: 20px;">
-                {product} is perfect for anyone who needs this type of tool. Here's who should definitely consider the <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">AppSumo lifetime deal</a>:
-            </p>
-            <h3>✅ Perfect For:</h3>
-            <ul>
-                <li><strong>Business owners:</strong> Get all the features you need without monthly fees</li>
-                <li><strong>Entrepreneurs:</strong> Build and grow your business with powerful tools</li>
-                <li><strong>Freelancers:</strong> Professional features at an affordable one-time price</li>
-                <li><strong>Teams:</strong> Collaborate and work more efficiently</li>
-            </ul>
-            <h3 style="margin-top: 30px;">❌ Not Ideal For:</h3>
-            <ul>
-                <li>Users who only need basic features occasionally</li>
-                <li>People who prefer monthly subscriptions</li>
-            </ul>
-        </section>
-
-        <div class="cta-box">
-            <h2>Get {product} Lifetime Deal</h2>
-            <p style="font-size: 1.2em; margin: 15px 0;">Pay once, use forever. All features included.</p>
-            <p style="font-size: 1.5em; font-weight: 700; margin: 15px 0;">${price} (normally $348/year)</p>
-            <a href="{affiliate}" class="btn" target="_blank" rel="noopener">Get Lifetime Access →</a>
-            <p style="font-size: 0.9em; margin-top: 15px; opacity: 0.9;">60-day money-back guarantee</p>
-        </div>
-
-        <section style="margin-top: 60px;">
-            <h2>Final Verdict: Is {product} Worth It?</h2>
-            <p style="font-size: 1.1em; line-height: 1.8;">
-                <strong>Yes, {product} is absolutely worth ${price} if you need this type of tool.</strong>
-            </p>
-            <p style="font-size: 1.1em; line-height: 1.8; margin-top: 15px;">
-                The lifetime deal eliminates recurring costs and gives you all the tools you need to succeed. At ${price} lifetime vs $348/year subscription, it pays for itself quickly.
-            </p>
-            <div style="background: #f0f7ff; padding: 30px; border-radius: 10px; margin: 30px 0; text-align: center;">
-                <h3 style="color: {color1}; margin-bottom: 15px;">Our Rating: {rating}/5</h3>
-                <p style="font-size: 1.1em;">Highly Recommended</p>
-                <a href="{affiliate}" style="display: inline-block; background: {color1}; color: white; padding: 15px 40px; border-radius: 5px; text-decoration: none; font-weight: 700; margin-top: 20px;" target="_blank" rel="noopener">Get {product} Lifetime Deal →</a>
-            </div>
-        </section>
-
-        <section style="margin-top: 60px;">
-            <h2>Frequently Asked Questions</h2>
-            <h3>What is {product}?</h3>
-            <p>{product} is a powerful tool that helps you achieve your goals. Get lifetime access via the <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">AppSumo lifetime deal</a>.</p>
-
-            <h3>Is {product} really lifetime access?</h3>
-            <p>Yes. Pay ${price} once via the AppSumo lifetime deal and use it forever. No hidden fees, no expiration. <a href="{affiliate}" target="_blank" rel="noopener" style="color: {color1}; font-weight: 600;">Get the AppSumo lifetime deal here →</a></p>
-
-            <h3>What features are included?</h3>
-            <p>You get all premium features including all the tools you need—all included in the lifetime deal.</p>
-
-            <h3>Is there a free trial?</h3>
-            <p>There's no free trial, but you get a 60-day money-back guarantee. Test it risk-free for 2 months.</p>
-
-            <h3>How does the AppSumo lifetime deal work?</h3>
-            <p>The AppSumo lifetime deal gives you one-time access to {product} for ${price}, compared to regular subscription pricing. You pay once and get lifetime access with all future updates included.</p>
-
-            <h3>Is {product} worth the money?</h3>
-            <p>Absolutely. {product} provides excellent value at ${price} lifetime. The lifetime deal eliminates recurring costs and gives you all the tools you need to succeed. At this price, it's one of the best investments you can make.</p>
-        </section>
-
-        <div style="text-align: center; margin: 60px 0;">
-            <a href="../guides/best-lifetime-ai-tools.html" style="display: inline-block; background: {color1}; color: white; padding: 12px 30px; border-radius: 5px; text-decoration: none; font-weight: 600;">← See More Lifetime Deals</a>
-        </div>
-    </div>
-
-    <footer>
-        <p>© 2026 artificial.one - {product} Review</p>
-    </footer>
-</body>
-</html>'''
-    
-    return html.format(product=product, rating=rating, price=price, affiliate=affiliate, color1=color1)
+    features_ul = ''.join(
+        f'                <li><strong>{escape(feature)}:</strong> Powerful feature that helps you succeed</li>\n'
+        for feature in features[:8]
+    )
+    return render('lifetime_review', root='../', title=title, meta_desc=meta_desc, color1=color1, color2=color2,
+                  nav=nav_content, product=product, rating=rating, price=price,
+                  affiliate=affiliate, features_ul=features_ul)
 
 def main():
     tools_dir = Path('tools')
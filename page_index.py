@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Shared page index for the maintenance scripts.
+Scans the HTML tree once and caches per-page facts (title, meta description,
+canonical, OG tags, JSON-LD, affiliate links, internal hrefs, class names,
+category, rating, price) in .page_index.json, keyed by path + mtime + size.
+Later runs only re-read pages that changed, so read-only scripts can query the
+index instead of re-scanning the whole site.
+
+The meta and text facts come from html_extract.extract_page, the same
+extractor the meta/schema scripts use; only the link, class and JSON-LD scans
+are done here.
+
+Usage:
+    python page_index.py            # build/refresh the index and print a summary
+    python page_index.py --rebuild  # ignore the cache and re-read every page
+"""
+import re
+import sys
+import json
+from pathlib import Path
+
+from html_extract import extract_page
+
+CACHE_FILE = '.page_index.json'
+INDEX_VERSION = 4
+SITE_URL = 'https://artificial.one'
+APPSUMO_DOMAIN = "appsumo.8odi.net"
+APPSUMO_PATTERN = rf'https?://{re.escape(APPSUMO_DOMAIN)}/[^\s"\'<>)]+'
+
+JSON_LD_RE = re.compile(r'<script\s+type=["\']application/ld\+json["\']\s*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+AFFILIATE_RE = re.compile(APPSUMO_PATTERN, re.IGNORECASE)
+AFFILIATE_NOFOLLOW_RE = re.compile(
+    rf'https?://{re.escape(APPSUMO_DOMAIN)}[^>]*rel=["\'][^"\']*nofollow', re.IGNORECASE
+)
+HREF_RE = re.compile(r'<a\s[^>]*?href=["\']([^"\']*)["\']', re.IGNORECASE)
+EXTERNAL_HREF_RE = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//)', re.IGNORECASE)
+# class="..." anywhere, including inside JS template strings, plus classList calls
+CLASS_ATTR_RE = re.compile(r'\bclass(?:Name)?\s*=\s*(["\'])(.*?)\1', re.DOTALL)
+CLASS_LIST_RE = re.compile(r'classList\.(?:add|remove|toggle|contains)\(([^)]*)\)')
+QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+
+
+def iter_html_files(root='.'):
+    """Return all site HTML files under root, sorted, skipping hidden dirs."""
+    root = Path(root)
+    html_files = []
+    for html_file in root.rglob('*.html'):
+        rel_parts = html_file.relative_to(root).parts
+        if any(part.startswith('.') for part in rel_parts):
+            continue
+        if 'node_modules' in rel_parts:
+            continue
+        html_files.append(html_file)
+    return sorted(html_files)
+
+
+def page_key(filepath, root='.'):
+    """Cache key for a page: its POSIX path relative to root."""
+    return Path(filepath).relative_to(root).as_posix()
+
+
+def internal_links(hrefs):
+    """
+    Unique hrefs that point into the site, as written (relative ones are
+    resolved by link_graph.py). Absolute URLs on the site become root-relative.
+    """
+    links = []
+    for href in hrefs:
+        href = href.strip()
+        if href.startswith(SITE_URL):
+            href = href[len(SITE_URL):] or '/'
+        if not href or href.startswith('#') or EXTERNAL_HREF_RE.match(href):
+            continue
+        if href not in links:
+            links.append(href)
+    return links
+
+
+def extract_page_facts(content):
+    """Extract the per-page facts the maintenance scripts need."""
+    facts = {
+        'title': '',
+        'description': None,
+        'canonical': None,
+        'h1': '',
+        'og': {},
+        'json_ld': [],
+        'affiliate_links': [],
+        'affiliate_links_nofollow': 0,
+        'links': [],
+        'classes': [],
+        'category': None,
+        'rating': None,
+        'rating_scale': None,
+        'price': None,
+    }
+
+    page = extract_page(content)
+    for field in ('title', 'description', 'canonical', 'h1', 'og', 'category', 'rating', 'rating_scale'):
+        facts[field] = page[field]
+    facts['price'] = page['price'] or page['monthly_price']
+
+    for block in JSON_LD_RE.findall(content):
+        try:
+            facts['json_ld'].append(json.loads(block))
+        except ValueError:
+            # Keep malformed blocks visible to checkers instead of dropping them
+            facts['json_ld'].append({'_invalid': block.strip()[:200]})
+
+    facts['affiliate_links'] = [u.rstrip('.,;:!?)') for u in AFFILIATE_RE.findall(content)]
+    facts['affiliate_links_nofollow'] = len(AFFILIATE_NOFOLLOW_RE.findall(content))
+
+    facts['links'] = internal_links(HREF_RE.findall(content))
+
+    classes = set()
+    for _, value in CLASS_ATTR_RE.findall(content):
+        classes.update(value.split())
+    for args in CLASS_LIST_RE.findall(content):
+        for value in QUOTED_RE.findall(args):
+            classes.update(value.split())
+    facts['classes'] = sorted(classes)
+
+    if not facts['category']:
+        for schema in facts['json_ld']:
+            item = schema.get('itemReviewed', {}) if isinstance(schema, dict) else {}
+            if isinstance(item, dict) and item.get('applicationCategory') not in (None, 'AI Tool'):
+                facts['category'] = item['applicationCategory']
+                break
+
+    return facts
+
+
+def load_cache(cache_path):
+    """Load the on-disk cache, discarding it if unreadable or from an older version."""
+    try:
+        data = json.loads(Path(cache_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != INDEX_VERSION:
+        return {}
+    return data.get('pages', {})
+
+
+def save_cache(cache_path, pages):
+    """Persist the index atomically so a crashed run never leaves a torn cache."""
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    tmp_path.write_text(
+        json.dumps({'version': INDEX_VERSION, 'pages': pages}, ensure_ascii=False),
+        encoding='utf-8'
+    )
+    tmp_path.replace(cache_path)
+
+
+def refresh_index(root='.', cache_file=CACHE_FILE, rebuild=False):
+    """
+    Bring the cache up to date and return ({relative_path: facts}, pages_reread).
+    Pages whose mtime and size match the cached entry are not re-read.
+    """
+    root = Path(root)
+    cache_path = root / cache_file
+    cached = {} if rebuild else load_cache(cache_path)
+
+    pages = {}
+    reread = 0
+    for filepath in iter_html_files(root):
+        key = page_key(filepath, root)
+        try:
+            st = filepath.stat()
+        except OSError as e:
+            print(f"Error reading {filepath}: {e}")
+            continue
+
+        entry = cached.get(key)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            pages[key] = entry
+            continue
+
+        try:
+            content = filepath.read_text(encoding='utf-8', errors='ignore')
+        except OSError as e:
+            print(f"Error reading {filepath}: {e}")
+            continue
+
+        entry = extract_page_facts(content)
+        entry['path'] = key
+        entry['mtime_ns'] = st.st_mtime_ns
+        entry['size'] = st.st_size
+        pages[key] = entry
+        reread += 1
+
+    if reread or set(pages) != set(cached):
+        save_cache(cache_path, pages)
+
+    return pages, reread
+
+
+def build_index(root='.', cache_file=CACHE_FILE, rebuild=False):
+    """Return {relative_path: facts} for every HTML page under root."""
+    pages, _ = refresh_index(root, cache_file, rebuild)
+    return pages
+
+
+def load_pages(root='.'):
+    """Return the index as a list of page facts sorted by path."""
+    index = build_index(root)
+    return [index[key] for key in sorted(index)]
+
+
+def main():
+    rebuild = '--rebuild' in sys.argv[1:]
+    pages, reread = refresh_index(rebuild=rebuild)
+    print(f"Indexed {len(pages)} HTML pages ({reread} re-read, {len(pages) - reread} from cache)")
+    print(f"Cache: {CACHE_FILE}")
+
+    with_affiliate = sum(1 for p in pages.values() if p['affiliate_links'])
+    with_rating = sum(1 for p in pages.values() if p['rating'])
+    print(f"Pages with affiliate links: {with_affiliate}")
+    print(f"Pages with a rating: {with_rating}")
+
+
+if __name__ == '__main__':
+    main()
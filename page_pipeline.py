@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Single-pass page fixer pipeline.
+Loads each HTML page once, runs it through an ordered chain of registered
+transforms (canonical, OG tags, Twitter cards, breadcrumbs, FAQ schema,
+affiliate nofollow, footer disclosure) and writes it at most once. This
+replaces running each add_*.py script as a separate full-tree pass.
+
+Usage:
+    python page_pipeline.py                      # apply all transforms
+    python page_pipeline.py --dry-run            # print unified diffs, write nothing
+    python page_pipeline.py --only canonical,og  # run a subset, in pipeline order
+    python page_pipeline.py --skip faq-schema
+    python page_pipeline.py --incremental        # skip pages unchanged since last run
+    python page_pipeline.py --check              # list pages a second run would still change
+    python page_pipeline.py tools/foo-review.html blog-bar.html  # specific pages
+"""
+import sys
+import difflib
+from pathlib import Path
+
+from add_canonical_tags import get_canonical_url, add_canonical_tag
+from add_complete_og_tags import add_complete_og_tags
+from add_twitter_cards import add_twitter_cards_and_fix_entities
+from add_breadcrumbs import add_breadcrumbs
+from add_faq_schema import add_faq_schema
+from add_nofollow_to_affiliates import add_nofollow_to_links
+from add_footer_disclosure import add_footer_disclosure, is_footer_target
+from incremental import is_incremental, load_manifest, is_unchanged, record, save_manifest
+from page_index import iter_html_files
+
+# Bump when a transform is added, removed or reordered
+PIPELINE_VERSION = 1
+
+TRANSFORMS = []
+
+
+def register(name, applies_to=None):
+    """
+    Register fn(content, filepath) -> content as the next pipeline step.
+    applies_to(filepath) can restrict a step to certain pages.
+    """
+    def decorator(fn):
+        TRANSFORMS.append({'name': name, 'fn': fn, 'applies_to': applies_to})
+        return fn
+    return decorator
+
+
+@register('canonical')
+def canonical_step(content, filepath):
+    return add_canonical_tag(content, get_canonical_url(filepath))
+
+
+@register('og')
+def og_step(content, filepath):
+    return add_complete_og_tags(content, filepath)
+
+
+@register('twitter')
+def twitter_step(content, filepath):
+    return add_twitter_cards_and_fix_entities(content, filepath)
+
+
+@register('breadcrumbs')
+def breadcrumbs_step(content, filepath):
+    return add_breadcrumbs(content, filepath)
+
+
+@register('faq-schema')
+def faq_schema_step(content, filepath):
+    return add_faq_schema(content, filepath)
+
+
+@register('nofollow')
+def nofollow_step(content, filepath):
+    return add_nofollow_to_links(content)
+
+
+@register('footer-disclosure', applies_to=is_footer_target)
+def footer_disclosure_step(content, filepath):
+    return add_footer_disclosure(content)
+
+
+def select_transforms(only=None, skip=None):
+    """Return registered transforms filtered by --only/--skip, in pipeline order."""
+    names = [t['name'] for t in TRANSFORMS]
+    for name in (only or []) + (skip or []):
+        if name not in names:
+            raise ValueError(f"Unknown transform '{name}'. Available: {', '.join(names)}")
+    selected = [t for t in TRANSFORMS if not only or t['name'] in only]
+    return [t for t in selected if t['name'] not in (skip or [])]
+
+
+def run_pipeline(content, filepath, transforms):
+    """Apply transforms in order. Returns (new_content, names of steps that changed it)."""
+    changed_by = []
+    for transform in transforms:
+        if transform['applies_to'] and not transform['applies_to'](filepath):
+            continue
+        updated = transform['fn'](content, filepath)
+        if updated != content:
+            changed_by.append(transform['name'])
+            content = updated
+    return content, changed_by
+
+
+def process_file(filepath, transforms, dry_run=False):
+    """Read once, transform, write at most once. Returns the steps that changed the page."""
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+
+        updated_content, changed_by = run_pipeline(content, filepath, transforms)
+
+        if updated_content != content:
+            if dry_run:
+                diff = difflib.unified_diff(
+                    content.splitlines(keepends=True),
+                    updated_content.splitlines(keepends=True),
+                    fromfile=f'a/{filepath}',
+                    tofile=f'b/{filepath}',
+                )
+                sys.stdout.writelines(diff)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(updated_content)
+        return changed_by
+    except Exception as e:
+        print(f"Error processing {filepath}: {e}")
+        return []
+
+
+def check_idempotent(html_files, transforms):
+    """
+    Run the pipeline twice in memory on every page and return
+    [(filepath, steps that changed it again)] for pages the second run still
+    changes. Writes nothing.
+    """
+    unstable = []
+    for filepath in html_files:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        once, _ = run_pipeline(content, filepath, transforms)
+        _, changed_by = run_pipeline(once, filepath, transforms)
+        if changed_by:
+            unstable.append((filepath, changed_by))
+    return unstable
+
+
+def parse_list_arg(args, flag):
+    """Value of a comma-separated --flag a,b option (removed from args)."""
+    if flag not in args:
+        return None
+    i = args.index(flag)
+    value = args[i + 1] if i + 1 < len(args) else ''
+    del args[i:i + 2]
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def main():
+    args = sys.argv[1:]
+    only = parse_list_arg(args, '--only')
+    skip = parse_list_arg(args, '--skip')
+    dry_run = '--dry-run' in args
+    incremental = is_incremental(args)
+    paths = [a for a in args if not a.startswith('--')]
+
+    try:
+        transforms = select_transforms(only, skip)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    html_files = [Path(p) for p in paths] if paths else iter_html_files('.')
+    print(f"Found {len(html_files)} HTML files")
+    print(f"Pipeline: {' -> '.join(t['name'] for t in transforms)}")
+    if '--check' in args:
+        unstable = check_idempotent(html_files, transforms)
+        for filepath, changed_by in unstable[:25]:
+            print(f"[!] {filepath}: changed again by {', '.join(changed_by)}")
+        print(f"\nA second run would change {len(unstable)} files.")
+        sys.exit(1 if unstable else 0)
+    if dry_run:
+        print("Dry run: printing diffs, no files will be written\n")
+
+    # The manifest key includes the selected steps so a partial run never
+    # marks pages as done for the full pipeline
+    manifest = None
+    if incremental and not dry_run:
+        step_names = '+'.join(t['name'] for t in transforms)
+        manifest = load_manifest(f'page_pipeline:{step_names}', PIPELINE_VERSION)
+
+    updated_count = 0
+    step_counts = {t['name']: 0 for t in transforms}
+    for filepath in html_files:
+        if manifest is not None and is_unchanged(manifest, filepath):
+            continue
+        changed_by = process_file(filepath, transforms, dry_run)
+        if changed_by:
+            updated_count += 1
+            for name in changed_by:
+                step_counts[name] += 1
+            if not dry_run and updated_count <= 25:
+                print(f"[OK] {filepath}: {', '.join(changed_by)}")
+        if manifest is not None:
+            record(manifest, filepath)
+
+    if manifest is not None:
+        save_manifest(manifest)
+        print(f"Skipped {manifest['skipped']} unchanged files (--incremental)")
+
+    action = "Would update" if dry_run else "Updated"
+    print(f"\nCompleted! {action} {updated_count} files in a single pass.")
+    for name, count in step_counts.items():
+        print(f"  {name}: {count} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared process-pool runner for whole-site per-file transforms.
+Fans a script's process_file(filepath) calls out across worker processes with
+chunked scheduling and returns the results in input order, so the calling
+script can print the same summary it always did. An exception in one file is
+collected instead of aborting the whole run.
+
+Usage from a script:
+    results = run_parallel(process_file, sorted(html_files), jobs_from_argv())
+    for filepath, updated, error in results:
+        ...
+    report_failures(results)
+
+process_file must be a module-level function (workers pickle it by name).
+Pass --jobs 1 to run serially in-process, e.g. when debugging.
+"""
+import os
+import sys
+import traceback
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+
+def jobs_from_argv(argv=None):
+    """Worker count from --jobs N / -j N, defaulting to the number of CPUs."""
+    argv = sys.argv[1:] if argv is None else argv
+    for flag in ('--jobs', '-j'):
+        if flag in argv:
+            i = argv.index(flag)
+            try:
+                return max(1, int(argv[i + 1]))
+            except (IndexError, ValueError):
+                print(f"Ignoring invalid {flag} value; using all CPUs")
+    return os.cpu_count() or 1
+
+
+def _call(fn, filepath):
+    """Run fn(filepath), turning an exception into an error string."""
+    try:
+        return fn(filepath), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}"
+
+
+def run_parallel(fn, files, jobs=None, chunksize=None):
+    """
+    Run fn on every file. Returns [(filepath, result, error)] in input order;
+    error is None on success and result is None on failure.
+    """
+    files = list(files)
+    jobs = jobs or os.cpu_count() or 1
+    call = partial(_call, fn)
+
+    if jobs == 1 or len(files) < 2:
+        outcomes = map(call, files)
+        return [(f, result, error) for f, (result, error) in zip(files, outcomes)]
+
+    # A few chunks per worker keeps them busy without per-file IPC overhead
+    if chunksize is None:
+        chunksize = max(1, len(files) // (jobs * 4))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        outcomes = pool.map(call, files, chunksize=chunksize)
+        return [(f, result, error) for f, (result, error) in zip(files, outcomes)]
+
+
+def report_failures(results):
+    """Print collected per-file failures. Returns how many there were."""
+    failures = [(f, error) for f, _, error in results if error]
+    if failures:
+        print(f"\n[!] {len(failures)} file(s) failed:")
+        for filepath, error in failures:
+            print(f"  {filepath}: {error.splitlines()[0]}")
+    return len(failures)
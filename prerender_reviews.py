@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Build-time prerendering for the reviews.html tool grid.
+Registered as catalog.py artifacts, so `python catalog.py` emits:
+- the default "deal" view as static HTML inside #tools-container (first paint
+  needs no JS and no tool data)
+- one JSON shard per (type, category) cell under data/reviews/, e.g.
+  data/reviews/deal-writing.json; a filter click fetches only the cells it shows
+- the type x category x price band facet index (see facet_index.py) inlined
+  into the page, so the filter button counts are lookups
+
+The page keeps the generated regions between marker comments:
+    <!-- prerender:tools --> ... <!-- /prerender:tools -->
+    /* facets */ ... /* /facets */
+
+Usage:
+    python catalog.py           # rebuild everything
+    python prerender_reviews.py # same, printing only this module's outputs
+"""
+import re
+import json
+from html import escape
+
+from catalog import REVIEWS_FILE, artifact, build, compile_catalog
+from facet_index import facet_index, price_band, replace_facets
+
+SHARD_DIR = 'data/reviews'
+DEFAULT_TYPE = 'deal'  # getInitialTypeFilter() default on reviews.html
+
+GRID_START = '<!-- prerender:tools -->'
+GRID_END = '<!-- /prerender:tools -->'
+FACET_DIMS = ('type', 'catSlug', 'band')
+
+
+def listed_tools(tools):
+    """Tools shown on reviews.html, in listing order."""
+    return sorted((t for t in tools if t.listing_order is not None), key=lambda t: t.listing_order)
+
+
+def card_payload(tool):
+    """The fields a tool card needs (shard format, short keys as in the old array)."""
+    link = tool.affiliate_link if tool.type == 'deal' and tool.affiliate_link else tool.link
+    return {
+        'i': tool.listing_order,
+        'name': tool.name,
+        'cat': tool.category_label or tool.category,
+        'rating': tool.rating_text,
+        'type': tool.type,
+        'desc': tool.description,
+        'pros': tool.pros,
+        'cons': tool.cons,
+        'bestFor': tool.best_for,
+        'pricing': tool.pricing,
+        'link': link,
+        'review': tool.review_page or f'tools/{tool.slug}-review.html',
+        'catSlug': tool.category_slug,
+        'band': price_band(tool.pricing),
+    }
+
+
+def render_card(tool):
+    """Static HTML for one card; must stay in step with cardHtml() in reviews.html."""
+    e = {k: escape(v) if isinstance(v, str) else v for k, v in tool.items()}
+    pros = ''.join(f'<li>• {escape(p)}</li>' for p in tool['pros'])
+    cons = ''.join(f'<li>• {escape(c)}</li>' for c in tool['cons'])
+    if tool['type'] == 'deal':
+        actions = f'''
+                    <a href="{e['review']}" class="inline-block bg-gradient-to-r from-green-600 to-emerald-600 text-white px-6 py-2 rounded-lg font-semibold hover:from-green-700 hover:to-emerald-700 text-center">
+                        Read review &amp; get deal →
+                    </a>
+                    <a href="{e['link']}" target="_blank" rel="noopener nofollow sponsored" class="inline-block bg-gradient-to-r from-indigo-600 to-purple-600 text-white px-6 py-2 rounded-lg font-semibold hover:from-indigo-700 hover:to-purple-700 text-center border border-indigo-200 text-sm">
+                        Go to AppSumo →
+                    </a>
+                    <p class="text-xs text-gray-500 text-center mt-1">✅ 60-day guarantee • We may earn a commission</p>
+                    '''
+    else:
+        actions = f'''
+                    <a href="{e['link']}" target="_blank" rel="noopener" class="inline-block bg-gradient-to-r from-purple-600 to-blue-600 text-white px-6 py-2 rounded-lg font-semibold hover:from-purple-700 hover:to-blue-700 text-center">
+                        Visit {e['name']} →
+                    </a>
+                    <a href="{e['review']}" class="inline-block bg-gradient-to-r from-indigo-600 to-purple-600 text-white px-6 py-2 rounded-lg font-semibold hover:from-indigo-700 hover:to-purple-700 text-center">
+                        Full {e['name']} Review
+                    </a>
+                    '''
+    return f'''
+            <div class="tool-card bg-white rounded-xl p-6 {e['type']} {e['catSlug']}">
+                <div class="flex justify-between items-start mb-3">
+                    <div>
+                        <h3 class="text-xl font-bold text-gray-900">{e['name']}</h3>
+                        <p class="text-sm text-gray-600">{e['cat']}</p>
+                    </div>
+                    <div class="px-3 py-1 bg-green-100 text-green-800 rounded-full text-sm font-bold">{e['rating']}</div>
+                </div>
+                <p class="text-gray-700 mb-4">{e['desc']}</p>
+                <div class="mb-3">
+                    <div class="text-sm font-semibold text-gray-700 mb-1">✅ Pros:</div>
+                    <ul class="text-sm text-gray-600 space-y-1">
+                        {pros}
+                    </ul>
+                </div>
+                <div class="mb-3">
+                    <div class="text-sm font-semibold text-gray-700 mb-1">❌ Cons:</div>
+                    <ul class="text-sm text-gray-600 space-y-1">
+                        {cons}
+                    </ul>
+                </div>
+                <div class="text-sm text-gray-700 mb-2"><strong>Best for:</strong> {e['bestFor']}</div>
+                <div class="text-sm text-gray-700 mb-4"><strong>Pricing:</strong> {e['pricing']}</div>
+                <div class="flex flex-col gap-3">
+                    {actions}
+                </div>
+            </div>
+        '''
+
+
+def render_grid(payloads):
+    # Template indentation is dropped: it would be most of the prerendered bytes
+    cards = ''.join(re.sub(r'\s*\n\s*', '', render_card(t)) for t in payloads)
+    return '<div class="grid md:grid-cols-2 gap-6">' + cards + '</div>'
+
+
+def shard_name(tool_type, cat_slug):
+    return f'{tool_type or "other"}-{cat_slug}'
+
+
+def replace_region(content, start, end, body, label):
+    pattern = re.compile(re.escape(start) + r'.*?' + re.escape(end), re.DOTALL)
+    if not pattern.search(content):
+        raise ValueError(f"{REVIEWS_FILE}: missing {label} markers ({start} ... {end})")
+    return pattern.sub(lambda m: start + body + end, content, count=1)
+
+
+@artifact
+def reviews_prerender(tools, root):
+    payloads = [card_payload(t) for t in listed_tools(tools)]
+
+    shards = {}
+    for tool in payloads:
+        shards.setdefault(shard_name(tool['type'], tool['catSlug']), []).append(tool)
+    outputs = {
+        f'{SHARD_DIR}/{name}.json': json.dumps(items, ensure_ascii=False, separators=(',', ':')) + '\n'
+        for name, items in sorted(shards.items())
+    }
+
+    page = (root / REVIEWS_FILE).read_text(encoding='utf-8')
+    grid = render_grid([t for t in payloads if t['type'] == DEFAULT_TYPE])
+    page = replace_region(page, GRID_START, GRID_END, grid, 'grid')
+    page = replace_facets(page, facet_index(payloads, FACET_DIMS), REVIEWS_FILE)
+    outputs[REVIEWS_FILE] = page
+    return outputs
+
+
+def main():
+    tools = compile_catalog()
+    listed = listed_tools(tools)
+    written = [path for path, changed in build(tools=tools)
+               if changed and (path == REVIEWS_FILE or path.startswith(SHARD_DIR))]
+    print(f"Prerendered {sum(1 for t in listed if t.type == DEFAULT_TYPE)} '{DEFAULT_TYPE}' cards "
+          f"({len(listed)} listed tools)")
+    for path in written:
+        print(f"[OK] Wrote {path}")
+    if not written:
+        print("Everything up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Indexed fuzzy product-name resolver.
+
+Matching a name from a page (a tool object's `name: "..."`, a review slug, a
+tracker row) to a tracked product used to mean a substring check against every
+product, scored by length ratio: O(names x products) per page, and blind to
+one-letter variants (kingsumo / kingumo / kingsmo share no substring
+relation, while "grain" is a substring of unrelated names). The resolver is
+built once from the product list and answers from three indexes:
+
+- alias table: every known spelling (name, slug, catalog aliases) in compact
+  form ("King Sumo", "king-sumo" and "kingsumo" are all "kingsumo")
+- token trie over normalised name tokens: products whose full name appears
+  as a run of the query's tokens ("KingSumo Giveaways" -> KingSumo), or whose
+  name starts with the query's tokens
+- character trigram inverted index: near-spellings, scored by Dice
+  coefficient over the trigrams both names share
+
+Usage:
+    resolver = ProductResolver.from_product_links(product_links)
+    resolver.candidates('King Sumo giveaways')  # [(key, score), ...] best first
+    resolver.best('Kingumo')                    # key or None
+
+    python product_resolver.py "kingumo" "wiz write"   # query the tracker
+"""
+import re
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+NOISE_TOKENS = {'review', 'reviews'}
+NGRAM = 3
+THRESHOLD = 0.7  # same cut-off the length-ratio matcher used
+MARGIN = 0.05    # a best match this close to the runner-up is ambiguous
+END = ''         # trie key marking the end of a product name
+
+
+def normalize_tokens(name: str) -> List[str]:
+    """Lowercase alphanumeric tokens of name, without 'review'."""
+    return [t for t in TOKEN_RE.findall(str(name).lower()) if t not in NOISE_TOKENS]
+
+
+def compact(name: str) -> str:
+    """Spacing- and punctuation-free form used by the alias table."""
+    return ''.join(normalize_tokens(name))
+
+
+def ngrams(text: str) -> set:
+    padded = f' {text} '
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+class ProductResolver:
+    """Ranked product candidates for a free-form name."""
+
+    def __init__(self, entries: Iterable[Tuple[str, Iterable[str]]]):
+        """entries: (product key, [names and aliases]) pairs."""
+        self._aliases: Dict[str, str] = {}
+        self._names: List[Tuple[str, str, int]] = []  # (key, compact name, trigram count)
+        self._grams: Dict[str, List[int]] = {}         # trigram -> indexes into _names
+        self._trie: dict = {}
+
+        for key, names in entries:
+            for name in names:
+                tokens = normalize_tokens(name)
+                flat = ''.join(tokens)
+                if not flat or flat in self._aliases:
+                    continue  # first product to claim a spelling keeps it
+                self._aliases[flat] = key
+
+                grams = ngrams(flat)
+                index = len(self._names)
+                self._names.append((key, flat, len(grams)))
+                for gram in grams:
+                    self._grams.setdefault(gram, []).append(index)
+
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(END, set()).add((key, flat))
+
+    @classmethod
+    def from_product_links(cls, product_links: dict) -> 'ProductResolver':
+        """From update_appsumo_links.read_excel_links() output; keys are the normalised names."""
+        return cls(
+            (key, [key, data.get('original_name', ''), data.get('slug') or ''])
+            for key, data in product_links.items()
+        )
+
+    @classmethod
+    def from_tools(cls, tools) -> 'ProductResolver':
+        """From catalog Tool records; keys are the tool slugs."""
+        return cls((tool.slug, [tool.slug, tool.name, *tool.aliases]) for tool in tools)
+
+    def _trie_matches(self, tokens: List[str], query: str, scores: Dict[str, float]):
+        # Product names occurring as a run of the query's tokens
+        for start in range(len(tokens)):
+            node = self._trie
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                for key, flat in node.get(END, ()):
+                    scores[key] = max(scores.get(key, 0), len(flat) / len(query))
+        # Product names that start with all of the query's tokens
+        node = self._trie
+        for token in tokens:
+            node = node.get(token)
+            if node is None:
+                return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for token, child in node.items():
+                if token == END:
+                    for key, flat in child:
+                        scores[key] = max(scores.get(key, 0), len(query) / len(flat))
+                else:
+                    stack.append(child)
+
+    def _ngram_matches(self, query: str, scores: Dict[str, float]):
+        grams = ngrams(query)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for index in self._grams.get(gram, ()):
+                shared[index] = shared.get(index, 0) + 1
+        for index, count in shared.items():
+            key, _, total = self._names[index]
+            dice = 2 * count / (len(grams) + total)
+            if dice > scores.get(key, 0):
+                scores[key] = dice
+
+    def candidates(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """[(product key, score 0..1)] best first; 1.0 is a known spelling."""
+        tokens = normalize_tokens(name)
+        query = ''.join(tokens)
+        if not query:
+            return []
+        scores: Dict[str, float] = {}
+        key = self._aliases.get(query)
+        if key is not None:
+            scores[key] = 1.0
+        self._trie_matches(tokens, query, scores)
+        self._ngram_matches(query, scores)
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(key, round(score, 3)) for key, score in ranked[:limit]]
+
+    def best(self, name: str, threshold: float = THRESHOLD) -> Optional[str]:
+        """The single product name refers to, or None if nothing is close or it is ambiguous."""
+        ranked = self.candidates(name, limit=2)
+        if not ranked or ranked[0][1] < threshold:
+            return None
+        if ranked[0][1] < 1.0 and len(ranked) > 1 and ranked[0][1] - ranked[1][1] < MARGIN:
+            return None
+        return ranked[0][0]
+
+
+def main():
+    import io
+    import contextlib
+    from update_appsumo_links import EXCEL_FILE, read_excel_links
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        product_links = read_excel_links(EXCEL_FILE)
+    started = time.perf_counter()
+    resolver = ProductResolver.from_product_links(product_links)
+    print(f"Indexed {len(product_links)} products in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for name in sys.argv[1:]:
+        started = time.perf_counter()
+        ranked = resolver.candidates(name)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"\n{name!r} ({elapsed:.3f} ms) -> {resolver.best(name)!r}")
+        for key, score in ranked:
+            print(f"  {score:.3f}  {product_links[key]['original_name']}")
+
+
+if __name__ == '__main__':
+    main()
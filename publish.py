@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Publish stage: minified, precompressed copy of the site in .dist/.
+
+The tree is kept hand-indented for editing (reviews.html alone is 280 KB) and
+nothing was precompressed. This stage writes the deployable site to DIST_DIR
+(hidden, so the whole-tree scripts never treat the copies as pages):
+
+- HTML pages minified with minify.minify_html (inline CSS, inline JS and
+  JSON-LD included; <pre> and <textarea> untouched), stylesheets with
+  minify_css, other assets (data shards, images, sitemaps, robots.txt)
+  copied as they are
+- .gz (gzip -9) and .br (brotli quality 11) siblings for every text file, for
+  servers that serve precompressed files (nginx gzip_static / brotli_static).
+  brotli is optional: without it only .gz files are written
+- files are processed in parallel (parallel_runner.py); a source whose hash
+  matches the last publish is skipped (the manifest kept by incremental.py)
+- outputs whose source is gone are deleted
+
+Run it last, after the generators and build_css.py / dedupe_inline_styles.py.
+
+Usage:
+    python publish.py              # publish changed files to .dist/
+    python publish.py --out DIR    # somewhere else
+    python publish.py --rebuild    # ignore the manifest and redo every file
+    python publish.py --jobs 1     # serially, e.g. when debugging
+"""
+import sys
+import gzip
+import time
+import shutil
+from functools import partial
+from pathlib import Path
+
+from incremental import is_unchanged, load_manifest, record, save_manifest
+from minify import minify_css, minify_html
+from page_index import iter_html_files
+from parallel_runner import jobs_from_argv, report_failures, run_parallel
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = Path('.dist')
+PUBLISH_VERSION = 1
+ASSET_GLOBS = ('css/*.css', 'data/**/*.json', 'images/**/*', '*.svg', 'robots.txt', 'sitemap*.xml')
+MINIFIERS = {'.html': minify_html, '.css': minify_css}
+COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.svg', '.txt', '.xml'}
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def site_files(root='.', dist=DIST_DIR):
+    """Every file the site serves, as paths relative to root."""
+    root = Path(root)
+    files = {path.relative_to(root) for path in iter_html_files(root)}
+    for pattern in ASSET_GLOBS:
+        files.update(path.relative_to(root) for path in root.glob(pattern) if path.is_file())
+    return sorted(f for f in files if not (root / f).resolve().is_relative_to(Path(dist).resolve()))
+
+
+def _write(path, data):
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def publish_file(source, dist=DIST_DIR):
+    """
+    Write source's published form and compressed siblings under dist.
+    Returns (source bytes, output bytes, .gz bytes or None, .br bytes or None).
+    """
+    target = Path(dist) / source
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = source.read_bytes()
+
+    minify = MINIFIERS.get(source.suffix)
+    if minify:
+        output = minify(data.decode('utf-8', 'surrogateescape')).encode('utf-8', 'surrogateescape')
+        _write(target, output)
+    else:
+        output = data
+        shutil.copyfile(source, target)
+
+    sizes = [len(data), len(output), None, None]
+    if source.suffix in COMPRESSIBLE:
+        variants = [('.gz', lambda b: gzip.compress(b, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', lambda b: brotli.compress(b, quality=11, mode=brotli.MODE_TEXT)))
+        for slot, (suffix, compress) in enumerate(variants, start=2):
+            packed = compress(output)
+            sibling = target.with_name(target.name + suffix)
+            if len(packed) < len(output):
+                _write(sibling, packed)
+                sizes[slot] = len(packed)
+            elif sibling.exists():
+                sibling.unlink()
+    # A stale .br would be served instead of the new page
+    stale_br = target.with_name(target.name + '.br')
+    if brotli is None and stale_br.exists():
+        stale_br.unlink()
+    return tuple(sizes)
+
+
+def published_sizes(source, dist=DIST_DIR):
+    """publish_file's return value for a file skipped as unchanged."""
+    target = Path(dist) / source
+    sizes = [source.stat().st_size, target.stat().st_size, None, None]
+    for slot, suffix in enumerate(COMPRESSED_SUFFIXES, start=2):
+        sibling = target.with_name(target.name + suffix)
+        if sibling.exists():
+            sizes[slot] = sibling.stat().st_size
+    return tuple(sizes)
+
+
+def remove_stale(sources, dist=DIST_DIR):
+    """Delete outputs in dist whose source no longer exists. Returns how many."""
+    dist = Path(dist)
+    expected = {dist / source for source in sources}
+    removed = 0
+    for path in sorted(dist.rglob('*'), reverse=True):
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+            continue
+        original = path.with_suffix('') if path.suffix in COMPRESSED_SUFFIXES else None
+        if path in expected or original in expected:
+            continue
+        path.unlink()
+        removed += 1
+    return removed
+
+
+def section_of(source):
+    return source.parts[0] + '/' if len(source.parts) > 1 else '(root)'
+
+
+def print_report(sizes):
+    """Byte totals per top-level section: source, minified, gzip, brotli."""
+    sections = {}
+    for source, (raw, small, gz, br) in sizes.items():
+        totals = sections.setdefault(section_of(source), [0, 0, 0, 0, 0])
+        totals[0] += 1
+        totals[1] += raw
+        totals[2] += small
+        # Files not worth compressing are served as they are
+        totals[3] += gz if gz is not None else small
+        totals[4] += br if br is not None else small
+    sections['total'] = [sum(column) for column in zip(*sections.values())] if sections else [0] * 5
+
+    header = f"{'section':<14}{'files':>7}{'source':>14}{'minified':>14}{'gzip':>14}"
+    print(header + (f"{'brotli':>14}" if brotli else ''))
+    for name, (files, raw, small, gz, br) in sorted(sections.items(), key=lambda kv: (kv[0] == 'total', kv[0])):
+        line = f"{name:<14}{files:>7}{raw:>14,}{small:>14,}{gz:>14,}"
+        print(line + (f"{br:>14,}" if brotli else ''))
+    files, raw, small, gz, br = sections['total']
+    if raw:
+        print(f"Minified: {100 - small * 100 / raw:.1f}% smaller; gzip: {100 - gz * 100 / raw:.1f}% smaller"
+              + (f"; brotli: {100 - br * 100 / raw:.1f}% smaller" if brotli else ''))
+
+
+def main():
+    args = sys.argv[1:]
+    dist = Path(args[args.index('--out') + 1]) if '--out' in args[:-1] else DIST_DIR
+    started = time.perf_counter()
+    if brotli is None:
+        print("brotli is not installed (pip install brotli): writing .gz files only")
+
+    # Installing brotli later must redo everything to add the .br files
+    version = f"{PUBLISH_VERSION}{'+br' if brotli else ''}"
+    manifest = load_manifest('publish', version)
+    if '--rebuild' in args:
+        manifest['files'] = {}
+
+    sources = site_files('.', dist)
+    todo = [s for s in sources if not (is_unchanged(manifest, s) and (dist / s).exists())]
+    results = run_parallel(partial(publish_file, dist=dist), todo, jobs_from_argv())
+
+    sizes = {}
+    for source, result, error in results:
+        if error is None:
+            sizes[source] = result
+            record(manifest, source)
+    failed = {source for source, _, error in results if error}
+    for source in sources:
+        if source not in sizes and source not in failed:
+            sizes[source] = published_sizes(source, dist)
+
+    keys = {source.as_posix() for source in sources}
+    manifest['files'] = {key: entry for key, entry in manifest['files'].items() if key in keys}
+    save_manifest(manifest)
+    removed = remove_stale(sources, dist)
+    elapsed = time.perf_counter() - started
+
+    print(f"Published {len(todo) - len(failed)} file(s) to {dist.as_posix()}/, "
+          f"{len(sources) - len(todo)} unchanged, {removed} stale output(s) removed ({elapsed:.2f}s)\n")
+    print_report(sizes)
+    if report_failures(results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,16 @@
 """
 Remove duplicate OG image meta tags from HTML files.
 Keeps only the first occurrence of each OG tag type.
+Pass --incremental to skip files unchanged since the last run (see incremental.py).
 """
 import re
 from pathlib import Path
+from incremental import is_incremental, load_manifest, is_unchanged, record, save_manifest
 from collections import OrderedDict
 
+# Bump when the transform's output changes so --incremental reprocesses every file
+TRANSFORM_VERSION = 1
+
 def remove_duplicate_og_tags(content):
     """Remove duplicate OG meta tags, keeping only the first occurrence."""
     # Find all OG tags
@@ -132,12 +137,20 @@ def main():
     print("Removing duplicate OG tags...\n")
     
     updated_count = 0
+    manifest = load_manifest('remove_duplicate_og_tags', TRANSFORM_VERSION) if is_incremental() else None
     for filepath in sorted(html_files):
+        if manifest is not None and is_unchanged(manifest, filepath):
+            continue
         if process_file(filepath):
             updated_count += 1
             if updated_count <= 20:
                 print(f"[OK] Removed duplicates in {filepath}")
+        if manifest is not None:
+            record(manifest, filepath)
     
+    if manifest is not None:
+        save_manifest(manifest)
+        print(f"Skipped {manifest['skipped']} unchanged files (--incremental)")
     print(f"\nCompleted! Fixed {updated_count} files.")
 
 if __name__ == '__main__':
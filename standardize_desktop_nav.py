@@ -3,6 +3,9 @@
 import re
 from pathlib import Path
 
+from build_css import SHEET_LINK_RE
+from page_index import iter_html_files
+
 def desktop_nav_html(prefix: str) -> str:
     """Canonical desktop nav matching index.html. prefix is '' or '../'."""
     return f'''<div class="hidden md:flex gap-4 sm:gap-6 items-center text-sm sm:text-base">
@@ -141,7 +144,9 @@ def ensure_dropdown_css(html: str) -> str:
 
 def ensure_tailwind(html: str) -> str:
     """Add Tailwind CDN if missing (needed for hidden md:flex nav)."""
-    if 'tailwindcss.com' in html:
+    if 'tailwindcss.com' in html or SHEET_LINK_RE.search(html):
+        # Already styled; on a page using the build_css.py stylesheet, the
+        # next build adds any new utility classes to the sheet
         return html
     if '</head>' not in html:
         return html
@@ -174,7 +179,7 @@ def process(p: Path) -> bool:
 
 def main():
     n = 0
-    for path in sorted(Path('.').rglob('*.html')):
+    for path in iter_html_files('.'):
         if process(path):
             print(path)
             n += 1
@@ -10,6 +10,10 @@ This script ensures all pages have:
 import re
 from pathlib import Path
 
+from edit_buffer import EditBuffer
+from page_index import iter_html_files
+from templates import root_prefix
+
 # Canonical hamburger button
 HAMBURGER_BTN = '''                <button id="mobile-menu-btn" class="md:hidden text-gray-600 hover:text-purple-600">
                     <svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -79,13 +83,9 @@ document.querySelectorAll('.mobile-dropdown-btn').forEach(btn => {
 </script>'''
 
 def get_path_prefix(file_path):
-    """Determine path prefix based on file location."""
-    path = Path(file_path)
-    # If file is in root directory
-    if path.parent.name == '.' or path.parent.name == 'artificial.one':
-        return ''
-    # If file is in a subdirectory (tools/, compare/, category/, etc.)
-    return '../'
+    """Determine path prefix based on file location ('' for root pages)."""
+    # Path('blog.html').parent.name is '', not '.': use the depth below the site root
+    return root_prefix(file_path)
 
 def has_hamburger_button(content):
     """Check if hamburger button exists."""
@@ -107,8 +107,11 @@ def find_mobile_menu_end_regex(content):
     return None, None
 
 def standardize_hamburger_menu(content, prefix):
-    """Standardize hamburger menu in content."""
-    modified = False
+    """
+    Standardize hamburger menu in content. Every step searches the original
+    content; the edits are applied together at the end.
+    """
+    edits = EditBuffer(content)
     
     # Step 1: Add hamburger button if missing
     if not has_hamburger_button(content):
@@ -119,8 +122,7 @@ def standardize_hamburger_menu(content, prefix):
         if match:
             logo_end = match.end(1)
             # Insert hamburger button
-            content = content[:logo_end] + '\n                ' + HAMBURGER_BTN + '\n                ' + content[logo_end:]
-            modified = True
+            edits.insert(logo_end, '\n                ' + HAMBURGER_BTN + '\n                ')
         else:
             # Pattern 2: Logo followed by any div with flex (simpler nav)
             nav_pattern2 = r'(<a\s+href="[^"]*index\.html"[^>]*>.*?</a>)\s*(<div\s+class="[^"]*flex[^"]*")'
@@ -128,17 +130,17 @@ def standardize_hamburger_menu(content, prefix):
             if match:
                 logo_end = match.end(1)
                 # Insert hamburger button
-                content = content[:logo_end] + '\n                ' + HAMBURGER_BTN + '\n                ' + content[logo_end:]
-                modified = True
+                edits.insert(logo_end, '\n                ' + HAMBURGER_BTN + '\n                ')
     
-    # Step 2: Replace or add mobile menu
-    if has_mobile_menu(content):
+    # Step 2: Replace or add mobile menu (a marked one is refreshed by templates.py)
+    if '<!-- partial:mobile_menu -->' in content:
+        pass
+    elif has_mobile_menu(content):
         # Find existing mobile menu and replace it using regex
         menu_start, menu_end = find_mobile_menu_end_regex(content)
         if menu_start is not None and menu_end is not None:
             new_menu = MOBILE_MENU_TEMPLATE.format(prefix=prefix)
-            content = content[:menu_start] + new_menu + '\n        ' + content[menu_end:]
-            modified = True
+            edits.replace(menu_start, menu_end, new_menu + '\n        ')
     else:
         # Add mobile menu before closing nav div
         # Look for closing </div> after desktop menu
@@ -147,8 +149,7 @@ def standardize_hamburger_menu(content, prefix):
         if match:
             insert_pos = match.start()
             new_menu = '\n            ' + MOBILE_MENU_TEMPLATE.format(prefix=prefix) + '\n        '
-            content = content[:insert_pos] + new_menu + content[insert_pos:]
-            modified = True
+            edits.insert(insert_pos, new_menu)
     
     # Step 3: Ensure JavaScript is present
     script_pattern = r'<script>\s*document\.getElementById\([\'"]mobile-menu-btn[\'"]\)'
@@ -156,10 +157,9 @@ def standardize_hamburger_menu(content, prefix):
         # Add script before </body>
         body_close = content.rfind('</body>')
         if body_close != -1:
-            content = content[:body_close] + '\n' + MOBILE_MENU_SCRIPT + '\n' + content[body_close:]
-            modified = True
+            edits.insert(body_close, '\n' + MOBILE_MENU_SCRIPT + '\n')
     
-    return content, modified
+    return edits.apply(), bool(edits)
 
 def process_file(file_path):
     """Process a single HTML file."""
@@ -185,8 +185,7 @@ def process_file(file_path):
 
 def main():
     """Main function to process all HTML files."""
-    root = Path('.')
-    html_files = list(root.rglob('*.html'))
+    html_files = list(iter_html_files('.'))
     
     # Exclude index.html if it's React-based
     html_files = [f for f in html_files if not (f.name == 'index.html' and 'React' in f.read_text(encoding='utf-8')[:5000])]
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Shared template layer for the page generators.
+
+Layouts (templates/layouts/*.tmpl) and partials (templates/partials/*.tmpl)
+are compiled once into Python functions and cached until a template file
+changes, so rendering a page is one function call that joins literal chunks
+and escaped values. No regex work and no re-reading of files per page.
+
+Template syntax:
+    {{ name }}            context value, HTML-escaped
+    {{ name|raw }}        context value inserted as-is (pre-rendered HTML)
+    {{ name|json }}       value escaped for a JSON string (ld+json blocks)
+    {% include "nav" %}   a partial, inlined at compile time
+    {% style "name" %}    the CSS in templates/styles/<name>.tmpl (which may use
+                          {{ }} values), emitted as the shared stylesheet link
+                          and :root colour variables dedupe_inline_styles.py
+                          writes; colour values become the variables, and the
+                          sheet is written if it does not exist yet. Needs
+                          {{ root }}
+
+{{ site_css }} is filled in by render() when the caller does not pass it: the
+path of the current css/site.<hash>.css (build_css.py), so generated pages
+link the built stylesheet instead of loading the Tailwind CDN.
+
+Included partials are wrapped in <!-- partial:nav --> ... <!-- /partial:nav -->
+markers. Site-wide partials (ones that only need {{ root }}, the relative
+path back to the site root) can then be re-rendered in place on every
+generated page, so a nav change is a one-partial rebuild:
+
+    python templates.py           # refresh nav/mobile menu/footer everywhere
+    python templates.py --check   # report pages whose partials are stale
+    python templates.py --mark    # one-time: mark the partials in older pages
+
+Pages written before this layer existed carry no markers. --mark wraps the
+copies of a site-wide partial that are exactly what the partial renders for
+that page (typically the mobile menu and footer); navs that were edited by
+hand on a page do not match and stay unmarked, so a partial change does not
+reach them.
+
+Usage from a generator:
+    from templates import render, render_partial
+    html = render('blog_post', root='', headline=..., body=body_html)
+"""
+import os
+import re
+import sys
+import json
+import time
+from html import escape
+from pathlib import Path
+
+SITE_ROOT = Path(__file__).resolve().parent
+TEMPLATE_DIR = SITE_ROOT / 'templates'
+# Not .html, so the whole-tree page scripts never treat a template as a page
+TEMPLATE_SUFFIX = '.tmpl'
+
+TOKEN_RE = re.compile(
+    r'\{\{\s*(\w+)\s*(?:\|\s*(\w+)\s*)?\}\}|\{%\s*include\s+"(\w+)"\s*%\}|\{%\s*style\s+"(\w+)"\s*%\}'
+)
+PARTIAL_RE = re.compile(r'<!-- partial:(\w+) -->.*?<!-- /partial:\1 -->', re.DOTALL)
+MARKER_RE = re.compile(r'<!-- /?partial:\w+ -->')
+
+FILTERS = {
+    # Templates quote attributes with ", so ' can stay as-is
+    None: lambda v: escape(str(v), quote=False).replace('"', '&quot;'),
+    'raw': str,
+    'json': lambda v: json.dumps(str(v), ensure_ascii=False)[1:-1],
+}
+
+_cache = {}  # template path -> (compiled template, {dependency path: mtime})
+
+
+class TemplateError(ValueError):
+    pass
+
+
+class Template:
+    """A compiled template: render(context) -> str."""
+
+    def __init__(self, name, fn, fields):
+        self.name = name
+        self._fn = fn
+        self.fields = fields  # context names the template reads
+
+    def render(self, context=None, **values):
+        ctx = dict(context or {}, **values)
+        try:
+            return self._fn(ctx)
+        except KeyError as e:
+            raise TemplateError(f"{self.name}: no value for {{{{ {e.args[0]} }}}}") from None
+
+
+def _source(kind, name):
+    path = TEMPLATE_DIR / kind / f'{name}{TEMPLATE_SUFFIX}'
+    try:
+        return path, path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise TemplateError(f"template not found: {path}") from None
+
+
+def _expand(kind, name, deps, stack=()):
+    """Template source with includes inlined (and marked), recording every file read."""
+    if name in stack:
+        raise TemplateError(f"include cycle: {' -> '.join(stack + (name,))}")
+    path, text = _source(kind, name)
+    deps[path] = path.stat().st_mtime_ns
+
+    def include(match):
+        if match.group(4):
+            path, _ = _source('styles', match.group(4))
+            deps[path] = path.stat().st_mtime_ns
+        if not match.group(3):
+            return match.group(0)
+        partial = match.group(3)
+        body = _expand('partials', partial, deps, stack + (name,)).rstrip('\n')
+        return f'<!-- partial:{partial} -->{body}<!-- /partial:{partial} -->'
+
+    return TOKEN_RE.sub(include, text)
+
+
+def _compile(label, source):
+    """Turn expanded source into a function: one ''.join over literals and lookups."""
+    parts, fields, constants = [], set(), {}
+    pos = 0
+    for match in TOKEN_RE.finditer(source):
+        if match.start() > pos:
+            parts.append(repr(source[pos:match.start()]))
+        if match.group(4):
+            style = match.group(4)
+            fn_name = f'_s_{style}'
+            constants[fn_name] = lambda ctx, style=style: _shared_style(style, ctx)
+            parts.append(f'{fn_name}(ctx)')
+            fields |= _load('styles', style).fields | {'root'}
+            pos = match.end()
+            continue
+        name, flt = match.group(1), match.group(2)
+        if flt not in FILTERS:
+            raise TemplateError(f"{label}: unknown filter '{flt}'")
+        fn_name = f'_f_{flt or "escape"}'
+        constants[fn_name] = FILTERS[flt]
+        parts.append(f'{fn_name}(ctx[{name!r}])')
+        fields.add(name)
+        pos = match.end()
+    if pos < len(source):
+        parts.append(repr(source[pos:]))
+
+    code = 'def render(ctx):\n    return "".join((' + ', '.join(parts) + ',))\n'
+    namespace = dict(constants)
+    exec(compile(code, f'<template {label}>', 'exec'), namespace)
+    return Template(label, namespace['render'], frozenset(fields))
+
+
+def _load(kind, name):
+    key = (kind, name)
+    cached = _cache.get(key)
+    if cached:
+        template, deps = cached
+        try:
+            if all(path.stat().st_mtime_ns == mtime for path, mtime in deps.items()):
+                return template
+        except FileNotFoundError:
+            pass
+    deps = {}
+    template = _compile(f'{kind}/{name}', _expand(kind, name, deps))
+    _cache[key] = (template, deps)
+    return template
+
+
+def _shared_style(name, ctx):
+    # Imported here: dedupe_inline_styles imports this module
+    from dedupe_inline_styles import COLOR_RE, shared_style
+    template = _load('styles', name)
+    # The same CSS with other colours tells which colours are the page's own
+    colours = [key for key in sorted(template.fields) if COLOR_RE.fullmatch(str(ctx.get(key, '')))]
+    samples = [template.render(ctx, **{key: f'#{n:03x}{i:03x}' for i, key in enumerate(colours, 1)})
+               for n in (1, 2)] if colours else []
+    return shared_style(template.render(ctx), ctx['root'], SITE_ROOT, samples)
+
+
+def get_layout(name):
+    return _load('layouts', name)
+
+
+def get_partial(name):
+    return _load('partials', name)
+
+
+def site_stylesheet(root=SITE_ROOT):
+    """'css/site.<hash>.css' for the stylesheet build_css.py last wrote."""
+    from build_css import CSS_DIR, SHEET_PREFIX
+    sheets = sorted((Path(root) / CSS_DIR).glob(f'{SHEET_PREFIX}*.css'), key=lambda p: p.stat().st_mtime_ns)
+    if not sheets:
+        raise TemplateError(f"no {CSS_DIR}/{SHEET_PREFIX}<hash>.css; run build_css.py first")
+    return f'{CSS_DIR}/{sheets[-1].name}'
+
+
+def render(layout, context=None, **values):
+    """Render templates/layouts/<layout>.tmpl."""
+    template = get_layout(layout)
+    ctx = dict(context or {}, **values)
+    if 'site_css' in template.fields and 'site_css' not in ctx:
+        ctx['site_css'] = site_stylesheet()
+    return template.render(ctx)
+
+
+def render_partial(name, context=None, **values):
+    """Render templates/partials/<name>.tmpl, marked so it can be found later."""
+    body = get_partial(name).render(context, **values).rstrip('\n')
+    return f'<!-- partial:{name} -->{body}<!-- /partial:{name} -->'
+
+
+# --- Refreshing partials in generated pages ---------------------------------
+
+def root_prefix(path, root='.'):
+    """'../' per directory between the site root and path ('' at the top)."""
+    depth = len(Path(path).resolve().relative_to(Path(root).resolve()).parts) - 1
+    return '../' * depth
+
+
+def refresh_partials(content, context):
+    """
+    Re-render every marked partial in content whose fields are all available
+    in context (site-wide ones need only 'root'); others are left alone.
+    """
+    def replace(match):
+        name = match.group(1)
+        template = get_partial(name)
+        if not template.fields <= context.keys():
+            return match.group(0)
+        return render_partial(name, context)
+
+    return PARTIAL_RE.sub(replace, content)
+
+
+def mark_partials(content, context):
+    """
+    Wrap unmarked copies of site-wide partials in their markers, so
+    refresh_partials can find them. Only text that is exactly what the
+    partial renders for this page is marked, so the page looks the same.
+    For pages written before the template layer existed.
+    """
+    names = [path.stem for path in sorted((TEMPLATE_DIR / 'partials').glob(f'*{TEMPLATE_SUFFIX}'))]
+    rendered = [render_partial(name, context) for name in names if get_partial(name).fields <= context.keys()]
+    # Outer partials first: their nested ones are marked with them
+    for marked in sorted(rendered, key=len, reverse=True):
+        start_marker = marked[:marked.index('-->') + 3]
+        plain = MARKER_RE.sub('', marked)
+
+        def wrap(match):
+            if content.endswith(start_marker, 0, match.start()):
+                return match.group(0)
+            return marked
+
+        content = re.sub(re.escape(plain), wrap, content)
+    return content
+
+
+def main():
+    from page_index import iter_html_files
+
+    check = '--check' in sys.argv[1:]
+    mark = '--mark' in sys.argv[1:]
+    started = time.perf_counter()
+    pages = stale = 0
+    for filepath in iter_html_files('.'):
+        with open(filepath, encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        context = {'root': root_prefix(filepath)}
+        if mark:
+            updated = mark_partials(content, context)
+        elif '<!-- partial:' not in content:
+            continue
+        else:
+            updated = refresh_partials(content, context)
+        pages += '<!-- partial:' in updated
+        if updated == content:
+            continue
+        stale += 1
+        if check:
+            print(f"[{'UNMARKED' if mark else 'STALE'}] {filepath}")
+            continue
+        tmp = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(updated)
+        os.replace(tmp, filepath)
+        print(f"[OK] {'Marked' if mark else 'Refreshed'} {filepath}")
+
+    elapsed = time.perf_counter() - started
+    action = 'marked' if mark else 'stale' if check else 'refreshed'
+    if mark and check:
+        action = 'to mark'
+    print(f"{pages} page(s) with partials, {stale} {action} in {elapsed:.2f}s")
+    if check and stale:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
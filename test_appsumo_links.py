@@ -6,16 +6,16 @@ and test which ones are broken.
 
 import os
 import re
-import requests
-from urllib.parse import urlparse
+import sys
 from collections import defaultdict
-import time
+from link_checker import is_working
+from link_cache import check_urls_cached
 
 # Configuration
 TOOLS_FOLDER = "tools"
 APPSUMO_DOMAIN = "appsumo.8odi.net"
-TIMEOUT = 10  # seconds
-DELAY_BETWEEN_REQUESTS = 0.5  # seconds to avoid rate limiting
+# Concurrency and rate limiting are handled by link_checker.py; results are
+# cached by link_cache.py (pass --fresh to ignore the cache)
 
 def find_html_files(folder):
     """Find all HTML files in the specified folder."""
@@ -50,28 +50,6 @@ def extract_appsumo_links(file_path):
     
     return links
 
-def test_link(url):
-    """Test if a link is accessible."""
-    try:
-        # Follow redirects to check if the final destination is valid
-        response = requests.get(url, timeout=TIMEOUT, allow_redirects=True, 
-                               headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-        
-        # Consider 2xx and 3xx status codes as valid
-        if response.status_code < 400:
-            return True, response.status_code, None
-        else:
-            return False, response.status_code, None
-            
-    except requests.exceptions.Timeout:
-        return False, None, "Timeout"
-    except requests.exceptions.ConnectionError:
-        return False, None, "Connection Error"
-    except requests.exceptions.TooManyRedirects:
-        return False, None, "Too Many Redirects"
-    except Exception as e:
-        return False, None, str(e)
-
 def main():
     print("=" * 70)
     print("AppSumo Link Checker")
@@ -110,23 +88,22 @@ def main():
     broken_links = []
     working_links = []
     
+    checked = check_urls_cached(sorted(all_links), fresh='--fresh' in sys.argv[1:])
     for i, link in enumerate(sorted(all_links), 1):
-        print(f"[{i}/{len(all_links)}] Testing: {link}")
-        is_valid, status_code, error = test_link(link)
+        result = checked[link]
+        status_code = result['status_code']
+        print(f"[{i}/{len(all_links)}] Tested: {link}")
         
-        if is_valid:
+        if is_working(result):
             results[link] = {'status': 'OK', 'status_code': status_code}
             working_links.append(link)
             print(f"  [OK] Working (Status: {status_code})")
         else:
-            results[link] = {'status': 'BROKEN', 'status_code': status_code, 'error': error}
+            results[link] = {'status': 'BROKEN', 'status_code': status_code, 'error': result['error']}
             broken_links.append(link)
+            error = result['error']
             error_msg = f" - {error}" if error else f" (Status: {status_code})" if status_code else ""
             print(f"  [X] Broken{error_msg}")
-        
-        # Small delay to avoid rate limiting
-        if i < len(all_links):
-            time.sleep(DELAY_BETWEEN_REQUESTS)
     
     print()
     print("=" * 70)
@@ -6,12 +6,15 @@ the Excel file appsumo-affiliate-links-tracker.xlsx
 
 import os
 import re
-import pandas as pd
 from pathlib import Path
+from xlsx_reader import read_tracker
+from link_rewriter import build_rewrite_engine, rewrite_links
+from product_resolver import THRESHOLD, ProductResolver
 from collections import defaultdict
 
 # Configuration
 EXCEL_FILE = "appsumo-affiliate-links-tracker.xlsx"
+REVIEWS_DATA_FILE = "reviews_data.json"  # reviews.html tool data; rebuilt by catalog.py
 APPSUMO_DOMAIN = "appsumo.8odi.net"
 APPSUMO_PATTERN = rf'https?://{re.escape(APPSUMO_DOMAIN)}/[^\s"\'<>)]+'
 
@@ -20,144 +23,27 @@ def read_excel_links(excel_file):
     print(f"Reading Excel file: {excel_file}")
     
     try:
-        # Try multiple methods to read the Excel file
-        df = None
-        
-        # Method 1: Try pandas with openpyxl, ignoring styles
-        try:
-            # Use a custom function to read without styles
-            import zipfile
-            import xml.etree.ElementTree as ET
-            
-            # Extract data directly from XML to avoid style parsing
-            with zipfile.ZipFile(excel_file, 'r') as zip_ref:
-                # Read the shared strings
-                shared_strings = []
-                try:
-                    with zip_ref.open('xl/sharedStrings.xml') as f:
-                        tree = ET.parse(f)
-                        root = tree.getroot()
-                        ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-                        for si in root.findall('.//main:si', ns):
-                            text = ''
-                            for t in si.findall('.//main:t', ns):
-                                if t.text:
-                                    text += t.text
-                            shared_strings.append(text)
-                except:
-                    pass
-                
-                # Read the first worksheet
-                sheet_files = [f for f in zip_ref.namelist() if f.startswith('xl/worksheets/sheet')]
-                if sheet_files:
-                    with zip_ref.open(sheet_files[0]) as f:
-                        tree = ET.parse(f)
-                        root = tree.getroot()
-                        ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-                        
-                        data = []
-                        for row in root.findall('.//main:row', ns):
-                            row_data = []
-                            for cell in row.findall('.//main:c', ns):
-                                value_elem = cell.find('.//main:v', ns)
-                                if value_elem is not None and value_elem.text:
-                                    val = value_elem.text
-                                    # Check if it's a shared string reference
-                                    t_attr = cell.get('t')
-                                    if t_attr == 's' and shared_strings:
-                                        try:
-                                            idx = int(val)
-                                            if idx < len(shared_strings):
-                                                val = shared_strings[idx]
-                                        except:
-                                            pass
-                                    row_data.append(val)
-                                else:
-                                    row_data.append(None)
-                            if any(cell is not None for cell in row_data):
-                                data.append(row_data)
-                        
-                        if data:
-                            # First row as headers
-                            headers = [str(cell) if cell else f"Column{i+1}" for i, cell in enumerate(data[0])]
-                            df = pd.DataFrame(data[1:], columns=headers)
-        except Exception as e1:
-            print(f"XML extraction failed: {e1}, trying pandas...")
-            # Method 2: Try pandas with different engines
-            try:
-                df = pd.read_excel(excel_file, engine='calamine')  # Rust-based, faster
-            except:
-                try:
-                    df = pd.read_excel(excel_file, engine='xlrd')  # Older format support
-                except:
-                    # Last resort: try openpyxl with error suppression
-                    import warnings
-                    warnings.filterwarnings('ignore')
-                    df = pd.read_excel(excel_file, engine='openpyxl')
-        
-        if df is None or df.empty:
-            raise ValueError("Could not read Excel file with any method")
-        
-        print(f"Found {len(df)} rows in Excel file")
-        print(f"Columns: {list(df.columns)}")
-        
-        # Create a mapping of product name to affiliate link
-        # Try to find the right columns (case-insensitive)
-        name_col = None
-        link_col = None
-        
-        # Prefer "Your Generated Tracking Link" for affiliate links
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if ('name' in col_lower and 'product' in col_lower) or col == 'Product Name':
-                name_col = col
-            if 'tracking link' in col_lower or col == 'Your Generated Tracking Link':
-                link_col = col
-        
-        # If not found, try broader search
-        if not name_col:
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'name' in col_lower or 'product' in col_lower:
-                    name_col = col
-                    break
-        
-        if not link_col:
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'link' in col_lower or 'url' in col_lower or 'affiliate' in col_lower:
-                    link_col = col
-                    break
-        
-        if not name_col or not link_col:
-            # If we can't find columns, try common patterns
-            if len(df.columns) >= 2:
-                name_col = df.columns[0]
-                link_col = df.columns[1]
-                print(f"Using first column as name: {name_col}")
-                print(f"Using second column as link: {link_col}")
-            else:
-                raise ValueError("Could not identify name and link columns")
-        
-        print(f"Using name column: '{name_col}'")
-        print(f"Using link column: '{link_col}'")
-        
+        # Stream rows straight from the sheet XML (no pandas/openpyxl style parsing)
         product_links = {}
-        for idx, row in df.iterrows():
-            product_name = str(row[name_col]).strip()
-            affiliate_link = str(row[link_col]).strip()
+        row_count = 0
+        for row in read_tracker(excel_file):
+            row_count += 1
+            product_name = row.name
+            affiliate_link = row.tracking_link
             
             # Skip empty rows
-            if pd.isna(row[name_col]) or pd.isna(row[link_col]) or product_name == 'nan' or affiliate_link == 'nan':
+            if not product_name or not affiliate_link:
                 continue
             
             # Normalize product name for matching (lowercase, remove extra spaces)
             normalized_name = re.sub(r'\s+', ' ', product_name.lower().strip())
             product_links[normalized_name] = {
                 'original_name': product_name,
-                'link': affiliate_link
+                'link': affiliate_link,
+                'slug': row.slug
             }
         
+        print(f"Found {row_count} rows in Excel file")
         print(f"Loaded {len(product_links)} product links from Excel")
         # Show first 5 products as sample
         print("Sample products from Excel:")
@@ -176,164 +62,45 @@ def normalize_product_name(name):
     return normalized
 
 def find_product_in_content(content, product_name, product_links):
-    """Find product references in content and return matches."""
-    matches = []
-    
-    # Try exact normalized match first
-    normalized = normalize_product_name(product_name)
-    if normalized in product_links:
-        return [(normalized, product_links[normalized])]
-    
-    # Try partial matches (product name contains or is contained in)
-    for norm_name, link_data in product_links.items():
-        if normalized in norm_name or norm_name in normalized:
-            matches.append((norm_name, link_data))
-    
-    return matches
+    """Find product references in content and return matches, best first."""
+    resolver = product_resolver(product_links)
+    return [
+        (norm_name, product_links[norm_name])
+        for norm_name, score in resolver.candidates(product_name)
+        if score >= THRESHOLD
+    ]
+
+_resolver = (None, None)  # (product_links, its resolver)
+
+def product_resolver(product_links):
+    """The indexed resolver for product_links, built once per tracker load."""
+    global _resolver
+    if _resolver[0] is not product_links:
+        _resolver = (product_links, ProductResolver.from_product_links(product_links))
+    return _resolver[1]
 
-def update_links_in_file(file_path, product_links):
-    """Update AppSumo links in a single file."""
+def resolve_fuzzy(product_links):
+    """
+    Fallback for tool objects whose name has no exact match: the one product
+    the indexed resolver ranks clearly first (see product_resolver.py).
+    """
+    return product_resolver(product_links).best
+
+def update_links_in_file(file_path, engine):
+    """Update AppSumo links in a single file with the compiled rewrite engine."""
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
-        original_content = content
-        updates_made = []
-        
-        # Find all AppSumo links in the file
-        appsumo_links = re.findall(APPSUMO_PATTERN, content)
-        
-        # Also find product names near links (for reviews.html structure)
-        # Pattern: name: "Product Name" ... link: "https://appsumo..."
-        # This pattern matches JavaScript object structure: {name: "...", ..., link: "..."}
-        product_link_pattern = r'name:\s*"([^"]+)"[^}]*?link:\s*"(https?://' + re.escape(APPSUMO_DOMAIN) + r'/[^"]+)"'
-        product_matches = list(re.finditer(product_link_pattern, content, re.DOTALL))
-        
-        for match in product_matches:
-            product_name = match.group(1)
-            old_link = match.group(2)
-            
-            # Find matching product in Excel
-            normalized = normalize_product_name(product_name)
-            if normalized in product_links:
-                new_link = product_links[normalized]['link']
-                if old_link != new_link:
-                    # Replace just the URL part (group 2) with the new link
-                    # match.start(2) and match.end(2) point to the URL without quotes
-                    link_start = match.start(2)
-                    link_end = match.end(2)
-                    content = content[:link_start] + new_link + content[link_end:]
-                    updates_made.append({
-                        'product': product_name,
-                        'old_link': old_link,
-                        'new_link': new_link
-                    })
-            else:
-                # Debug: show products that weren't matched
-                if file_path.endswith('reviews.html'):
-                    # Try fuzzy matching
-                    best_match = None
-                    best_score = 0
-                    for norm_name, link_data in product_links.items():
-                        # Check if names are similar (one contains the other or vice versa)
-                        if normalized in norm_name or norm_name in normalized:
-                            score = min(len(normalized), len(norm_name)) / max(len(normalized), len(norm_name))
-                            if score > best_score:
-                                best_score = score
-                                best_match = (norm_name, link_data)
-                    
-                    if best_match and best_score > 0.7:  # 70% similarity threshold
-                        new_link = best_match[1]['link']
-                        if old_link != new_link:
-                            link_start = match.start(2)
-                            link_end = match.end(2)
-                            content = content[:link_start] + f'"{new_link}"' + content[link_end:]
-                            updates_made.append({
-                                'product': product_name,
-                                'old_link': old_link,
-                                'new_link': new_link,
-                                'matched_via': 'fuzzy'
-                            })
-        
-        # Also check for standalone links that might be near product names
-        # Look for patterns like: link: "https://appsumo..." and try to find nearby product name
-        standalone_link_pattern = r'link:\s*"(https?://' + re.escape(APPSUMO_DOMAIN) + r'/[^"]+)"'
-        standalone_matches = list(re.finditer(standalone_link_pattern, content))
-        
-        # For each standalone link, look backwards for a product name
-        for match in standalone_matches:
-            old_link = match.group(1)
-            # Look backwards up to 500 chars for a name: "Product" pattern
-            start_pos = max(0, match.start() - 500)
-            context = content[start_pos:match.start()]
-            
-            # Find the closest name: "Product" before this link
-            name_match = re.search(r'name:\s*"([^"]+)"', context)
-            if name_match:
-                product_name = name_match.group(1)
-                normalized = normalize_product_name(product_name)
-                
-                if normalized in product_links:
-                    new_link = product_links[normalized]['link']
-                    if old_link != new_link:
-                        # Replace this specific occurrence
-                        content = content[:match.start()] + f'link: "{new_link}"' + content[match.end():]
-                        updates_made.append({
-                            'product': product_name,
-                            'old_link': old_link,
-                            'new_link': new_link
-                        })
-        
-        # Also handle links in anchor tags: <a href="https://appsumo...">
-        anchor_pattern = r'(<a[^>]*href=["\'])(https?://' + re.escape(APPSUMO_DOMAIN) + r'/[^"\']+)(["\'][^>]*>)'
-        anchor_matches = list(re.finditer(anchor_pattern, content))
-        
-        # For anchor tags, try to find product name in nearby text
-        for match in anchor_matches:
-            old_link = match.group(2)
-            # Look in a wider context around the link
-            start_pos = max(0, match.start() - 1000)
-            end_pos = min(len(content), match.end() + 1000)
-            context = content[start_pos:end_pos]
-            
-            # Try to find product name in the context
-            # Look for common patterns
-            name_patterns = [
-                r'name:\s*"([^"]+)"',
-                r'product[:\s]+"?([^"]+)"?',
-                r'([A-Z][a-zA-Z0-9\s&]+)\s+(?:is|tool|software|platform)',
-            ]
-            
-            product_name = None
-            for pattern in name_patterns:
-                name_match = re.search(pattern, context, re.IGNORECASE)
-                if name_match:
-                    potential_name = name_match.group(1).strip()
-                    normalized = normalize_product_name(potential_name)
-                    if normalized in product_links:
-                        product_name = potential_name
-                        break
-            
-            if product_name:
-                normalized = normalize_product_name(product_name)
-                new_link = product_links[normalized]['link']
-                if old_link != new_link:
-                    # Replace the link
-                    new_anchor = match.group(1) + new_link + match.group(3)
-                    content = content[:match.start()] + new_anchor + content[match.end():]
-                    updates_made.append({
-                        'product': product_name,
-                        'old_link': old_link,
-                        'new_link': new_link
-                    })
+        # One linear scan finds every product mention and affiliate URL
+        # (see link_rewriter.py for how each URL is resolved)
+        content, updates_made = rewrite_links(content, engine)
         
         # Write the file if changes were made
-        if content != original_content:
+        if updates_made:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
-            return updates_made
-        
-        return []
+        return updates_made
     
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
@@ -350,6 +117,8 @@ def find_html_files():
             if file.endswith('.html'):
                 html_files.append(os.path.join(root, file))
     
+    if os.path.exists(REVIEWS_DATA_FILE):
+        html_files.append(os.path.join('.', REVIEWS_DATA_FILE))
     return html_files
 
 def main():
@@ -369,6 +138,7 @@ def main():
         print("No product links found in Excel file!")
         return
     
+    engine = build_rewrite_engine(product_links, resolve=resolve_fuzzy(product_links))
     print()
     
     # Step 2: Find all HTML files
@@ -386,7 +156,7 @@ def main():
     all_updates = defaultdict(list)
     
     for file_path in html_files:
-        updates = update_links_in_file(file_path, product_links)
+        updates = update_links_in_file(file_path, engine)
         if updates:
             files_updated += 1
             total_updates += len(updates)
@@ -408,10 +178,13 @@ def main():
         for file_path, updates in sorted(all_updates.items()):
             print(f"\n{file_path}:")
             for update in updates:
-                print(f"  {update['product']}")
+                print(f"  {update['product']} (offset {update['offset']})")
                 print(f"    Old: {update['old_link']}")
                 print(f"    New: {update['new_link']}")
     
+    if os.path.join('.', REVIEWS_DATA_FILE) in all_updates:
+        print(f"\n{REVIEWS_DATA_FILE} changed: run `python catalog.py` to rebuild reviews.html")
+    
     print()
     print("=" * 70)
     print("DONE")
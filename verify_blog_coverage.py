@@ -5,6 +5,10 @@ import os
 import re
 from pathlib import Path
 
+from product_resolver import ProductResolver
+
+MATCH_THRESHOLD = 0.85
+
 # Get all tools with affiliate links
 tools_dir = Path('tools')
 tools_with_affiliates = set()
@@ -25,22 +29,30 @@ for f in os.listdir('.'):
         if not any(x in f for x in ['ai-', 'appsumo', 'chatgpt', 'copilot', 'free', 'midjourney', 'professional', 'worth', '57-new', 'html.html']):
             blog_name = f.replace('blog-', '').replace('.html', '')
             blogs.add(blog_name)
-            
-# Handle name variations - some tools have multiple review files or naming variations
-# airbrush-ai-image-generator review file -> blog-airbrush-ai-image-generator.html exists
-if 'airbrush-ai-image-generator' in [f.replace('blog-', '').replace('.html', '') for f in os.listdir('.') if f.startswith('blog-airbrush')]:
-    blogs.add('airbrush-ai-image-generator')
-# writeseed-ai-content-writer review file -> blog-writeseed-ai-content-writer.html exists  
-if 'writeseed-ai-content-writer' in [f.replace('blog-', '').replace('.html', '') for f in os.listdir('.') if f.startswith('blog-writeseed')]:
-    blogs.add('writeseed-ai-content-writer')
+# Posts for long review slugs keep an 'ai-' in their name (blog-airbrush-ai-image-generator.html)
+for f in os.listdir('.'):
+    if f.startswith('blog-') and f.endswith('.html') and f[len('blog-'):-len('.html')] in tools_with_affiliates:
+        blogs.add(f[len('blog-'):-len('.html')])
+
+# Match each tool to its post by name rather than exact file name, so slugs that
+# differ only in spacing or punctuation (supercopyai / supercopy-ai) count, but
+# a post for a different product never does
+resolver = ProductResolver((blog, [blog]) for blog in blogs)
+covered = {tool: resolver.best(tool, MATCH_THRESHOLD) for tool in tools_with_affiliates}
 
 # Find missing
-missing = tools_with_affiliates - blogs
+missing = {tool for tool, blog in covered.items() if blog is None}
+variants = sorted((tool, blog) for tool, blog in covered.items() if blog and blog != tool)
 
 print(f"Tools with affiliate links: {len(tools_with_affiliates)}")
 print(f"Blog posts created: {len(blogs)}")
 print(f"Missing: {len(missing)}")
 
+if variants:
+    print(f"\nCovered by a post under another spelling ({len(variants)}):")
+    for tool, blog in variants:
+        print(f"  - {tool} -> blog-{blog}.html")
+
 if missing:
     print(f"\nTools still needing blogs ({len(missing)}):")
     for t in sorted(list(missing))[:30]:
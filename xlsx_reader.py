@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for appsumo-affiliate-links-tracker.xlsx.
+Walks the first worksheet with iterparse, clearing each row as it goes, and
+resolves shared strings lazily (sharedStrings.xml is only parsed as far as
+the highest index actually referenced). Memory stays flat as the tracker
+grows, and no script needs pandas/openpyxl just to read a few columns.
+
+Usage:
+    from xlsx_reader import read_tracker
+    for row in read_tracker():
+        print(row.name, row.tracking_link, row.status)
+
+    python xlsx_reader.py    # print a summary of the tracker
+"""
+import re
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+EXCEL_FILE = "appsumo-affiliate-links-tracker.xlsx"
+NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+# Tracker columns by header, with the position used when the header cell is
+# missing or wrong (column A's header has been overwritten with a URL before)
+TRACKER_COLUMNS = {
+    "name": ("Product Name", 0),
+    "slug": ("Product Slug", 1),
+    "product_url": ("AppSumo Product URL", 2),
+    "tracking_link": ("Your Generated Tracking Link", 3),
+    "status": ("Status", 4),
+}
+
+
+class TrackerRow(NamedTuple):
+    """One deal from the tracker. row is the 1-based Excel row number."""
+    row: int
+    name: str
+    slug: str
+    product_url: str
+    tracking_link: str
+    status: str
+    values: Dict[str, Optional[str]]
+
+
+class SharedStrings:
+    """Shared-strings table that is parsed incrementally on first lookup."""
+
+    def __init__(self, zf: zipfile.ZipFile):
+        self._zf = zf
+        self._strings: List[str] = []
+        self._events = None
+        self._done = "xl/sharedStrings.xml" not in zf.namelist()
+
+    def __getitem__(self, index: int) -> str:
+        while index >= len(self._strings) and not self._done:
+            self._read_next()
+        return self._strings[index]
+
+    def _read_next(self):
+        if self._events is None:
+            self._stream = self._zf.open("xl/sharedStrings.xml")
+            self._events = ET.iterparse(self._stream, events=("end",))
+        for _, elem in self._events:
+            if elem.tag == NS + "si":
+                # Plain <t> or rich-text runs <r><t>; phonetic <rPh> hints are skipped
+                parts = [t.text or "" for t in elem.findall(NS + "t")]
+                for run in elem.findall(NS + "r"):
+                    parts.extend(t.text or "" for t in run.findall(NS + "t"))
+                self._strings.append("".join(parts))
+                elem.clear()
+                return
+        self._done = True
+        self._stream.close()
+
+
+def column_index(cell_ref: str) -> int:
+    """0-based column index from a reference like 'C12'."""
+    index = 0
+    for ch in cell_ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + (ord(ch.upper()) - 64)
+    return index - 1
+
+
+def _cell_value(cell, shared: SharedStrings):
+    cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(NS + "t"))
+    v = cell.find(NS + "v")
+    if v is None or v.text is None:
+        return None
+    if cell_type == "s":
+        return shared[int(v.text)]
+    if cell_type == "b":
+        return v.text == "1"
+    if cell_type in ("str", "e"):
+        return v.text
+    # Numeric: keep ints as ints
+    try:
+        number = float(v.text)
+    except ValueError:
+        return v.text
+    return int(number) if number.is_integer() else number
+
+
+def first_sheet_name(zf: zipfile.ZipFile) -> str:
+    sheets = [n for n in zf.namelist() if re.match(r"xl/worksheets/sheet\d+\.xml$", n)]
+    if not sheets:
+        raise ValueError("Workbook has no worksheets")
+    return min(sheets, key=lambda n: int(re.search(r"(\d+)\.xml$", n).group(1)))
+
+
+def iter_rows(excel_file: str = EXCEL_FILE) -> Iterator[tuple]:
+    """
+    Yield (row_number, [values]) for each non-empty row of the first sheet.
+    Values are positioned by column reference, so sparse rows keep alignment.
+    """
+    with zipfile.ZipFile(excel_file, "r") as zf:
+        shared = SharedStrings(zf)
+        with zf.open(first_sheet_name(zf)) as sheet:
+            row_number = 0
+            for _, elem in ET.iterparse(sheet, events=("end",)):
+                if elem.tag != NS + "row":
+                    continue
+                row_number = int(elem.get("r", row_number + 1))
+                values = []
+                for cell in elem.iter(NS + "c"):
+                    ref = cell.get("r")
+                    index = column_index(ref) if ref else len(values)
+                    if index >= len(values):
+                        values.extend([None] * (index + 1 - len(values)))
+                    values[index] = _cell_value(cell, shared)
+                elem.clear()
+                if any(v is not None for v in values):
+                    yield row_number, values
+
+
+def _text(value) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def read_tracker(excel_file: str = EXCEL_FILE) -> Iterator[TrackerRow]:
+    """Yield a TrackerRow for every data row of the tracker."""
+    rows = iter_rows(excel_file)
+    try:
+        _, header_values = next(rows)
+    except StopIteration:
+        return
+    headers = [_text(h) or f"Column{i + 1}" for i, h in enumerate(header_values)]
+
+    positions = {}
+    for field, (header, fallback) in TRACKER_COLUMNS.items():
+        positions[field] = headers.index(header) if header in headers else fallback
+
+    for row_number, values in rows:
+        def get(i):
+            return values[i] if i < len(values) else None
+        yield TrackerRow(
+            row=row_number,
+            values={h: get(i) for i, h in enumerate(headers)},
+            **{field: _text(get(i)) for field, i in positions.items()},
+        )
+
+
+def main():
+    excel_file = sys.argv[1] if len(sys.argv) > 1 else EXCEL_FILE
+    rows = list(read_tracker(excel_file))
+    statuses = {}
+    for row in rows:
+        statuses[row.status or "(blank)"] = statuses.get(row.status or "(blank)", 0) + 1
+    print(f"{excel_file}: {len(rows)} deals")
+    for status, count in sorted(statuses.items()):
+        print(f"  {status}: {count}")
+    with_link = sum(1 for row in rows if row.tracking_link)
+    print(f"  with tracking link: {with_link}")
+
+
+if __name__ == "__main__":
+    main()